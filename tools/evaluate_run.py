@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 import argparse
-import csv
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
 import json
 import math
+import os
 import statistics
+import sys
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import numpy as np  # noqa: E402
+from timeseries_columns import read_timeseries_columns  # noqa: E402
 
 try:
     import tomllib  # py3.11+
@@ -25,60 +34,63 @@ def safe_stdev(xs: List[float]) -> float:
     return statistics.pstdev(xs) if len(xs) > 1 else 0.0
 
 
-def percentile(xs: List[float], p: float) -> float:
-    if not xs:
-        return 0.0
-    ys = sorted(xs)
+SCORE_COMPONENTS = (
+    "food_stability",
+    "innovation_urban",
+    "empire_logistics",
+    "disease_transition",
+    "trade_inequality",
+)
+SCORE_COLUMNS = (
+    "year",
+    "urbanShare",
+    "foodSecurityMean",
+    "diseaseBurdenMean",
+    "collapseCount",
+    "medianCountryArea",
+    "tradeIntensity",
+    "capabilityTier1Share",
+    "capabilityTier2Share",
+    "capabilityTier3Share",
+)
+
+# Row-wise helpers below operate on (runs x checkpoints) matrices and return one value per run.
+
+
+def row_percentile(xs: np.ndarray, p: float) -> np.ndarray:
+    if xs.shape[1] == 0:
+        return np.zeros(xs.shape[0])
+    ys = np.sort(xs, axis=1)
     p = max(0.0, min(1.0, p))
-    pos = p * (len(ys) - 1)
+    pos = p * (xs.shape[1] - 1)
     lo = int(math.floor(pos))
     hi = int(math.ceil(pos))
     t = pos - lo
-    return ys[lo] * (1.0 - t) + ys[hi] * t
-
-
-def corr(x: List[float], y: List[float]) -> float:
-    n = min(len(x), len(y))
-    if n < 3:
-        return 0.0
-    x = x[:n]
-    y = y[:n]
-    mx = safe_mean(x)
-    my = safe_mean(y)
-    num = 0.0
-    dx2 = 0.0
-    dy2 = 0.0
-    for i in range(n):
-        dx = x[i] - mx
-        dy = y[i] - my
-        num += dx * dy
-        dx2 += dx * dx
-        dy2 += dy * dy
-    den = math.sqrt(max(1e-12, dx2 * dy2))
-    return max(-1.0, min(1.0, num / den))
-
-
-def norm_corr(c: float) -> float:
-    return clamp01(0.5 * (c + 1.0))
-
-
-def slope(xs: List[float], ys: List[float]) -> float:
-    n = min(len(xs), len(ys))
-    if n < 2:
-        return 0.0
-    xs = xs[:n]
-    ys = ys[:n]
-    mx = safe_mean(xs)
-    my = safe_mean(ys)
-    num = 0.0
-    den = 0.0
-    for i in range(n):
-        dx = xs[i] - mx
-        num += dx * (ys[i] - my)
-        den += dx * dx
-    if den <= 1e-12:
-        return 0.0
-    return num / den
+    return ys[:, lo] * (1.0 - t) + ys[:, hi] * t
+
+
+def row_corr(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    if x.shape[1] < 3:
+        return np.zeros(x.shape[0])
+    dx = x - x.mean(axis=1, keepdims=True)
+    dy = y - y.mean(axis=1, keepdims=True)
+    num = (dx * dy).sum(axis=1)
+    den = np.sqrt(np.maximum(1e-12, (dx * dx).sum(axis=1) * (dy * dy).sum(axis=1)))
+    return np.clip(num / den, -1.0, 1.0)
+
+
+def norm_corr(c: np.ndarray) -> np.ndarray:
+    return np.clip(0.5 * (c + 1.0), 0.0, 1.0)
+
+
+def row_slope(xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    if xs.shape[1] < 2:
+        return np.zeros(xs.shape[0])
+    dx = xs - xs.mean(axis=1, keepdims=True)
+    num = (dx * (ys - ys.mean(axis=1, keepdims=True))).sum(axis=1)
+    den = (dx * dx).sum(axis=1)
+    ok = den > 1e-12
+    return np.where(ok, num / np.where(ok, den, 1.0), 0.0)
 
 
 def load_weights(config_path: Path) -> Dict[str, float]:
@@ -106,136 +118,150 @@ def load_weights(config_path: Path) -> Dict[str, float]:
     return weights
 
 
-def read_timeseries(csv_path: Path) -> Dict[str, List[float]]:
-    out: Dict[str, List[float]] = {}
-    with csv_path.open("r", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            for k, v in row.items():
-                out.setdefault(k, [])
-                try:
-                    out[k].append(float(v))
-                except Exception:
-                    out[k].append(0.0)
-    return out
-
-
-def run_score(ts: Dict[str, List[float]], weights: Dict[str, float]) -> Dict[str, float]:
-    years = ts.get("year", [])
-    urban = ts.get("urbanShare", [])
-    food = ts.get("foodSecurityMean", [])
-    disease = ts.get("diseaseBurdenMean", [])
-    collapse = ts.get("collapseCount", [])
-    area = ts.get("medianCountryArea", [])
-    trade = ts.get("tradeIntensity", [])
-    cap = [
-        (a + b + c) / 3.0
-        for a, b, c in zip(
-            ts.get("capabilityTier1Share", []),
-            ts.get("capabilityTier2Share", []),
-            ts.get("capabilityTier3Share", []),
-        )
-    ]
-    n = min(len(years), len(urban), len(food), len(disease), len(collapse), len(area), len(trade), len(cap))
-    if n < 4:
-        return {
-            "food_stability": 0.0,
-            "innovation_urban": 0.0,
-            "empire_logistics": 0.0,
-            "disease_transition": 0.0,
-            "trade_inequality": 0.0,
-            "run_score": 0.0,
-        }
-
-    years = years[:n]
-    urban = urban[:n]
-    food = food[:n]
-    disease = disease[:n]
-    collapse = collapse[:n]
-    area = area[:n]
-    trade = trade[:n]
-    cap = cap[:n]
-
-    collapse_rate = [0.0]
-    for i in range(1, n):
-        dy = max(1.0, years[i] - years[i - 1])
-        collapse_rate.append(max(0.0, collapse[i] - collapse[i - 1]) / dy)
-
-    score1 = safe_mean([
-        norm_corr(corr(food, urban)),
-        norm_corr(corr(food, [-v for v in collapse_rate])),
-    ])
-
-    cap_growth = cap[-1] - cap[0]
-    trade_growth = trade[-1] - trade[0]
-    saturation_penalty = clamp01(max(0.0, cap_growth - 1.8 * max(0.0, trade_growth)) / 0.25)
-    score2 = clamp01(
-        safe_mean([
-            norm_corr(corr(cap, urban)),
-            norm_corr(corr(cap, trade)),
-        ]) - 0.25 * saturation_penalty
+def read_timeseries(csv_path: Path) -> Dict[str, np.ndarray]:
+    ts = read_timeseries_columns(csv_path)
+    return {k: v for k, v in ts.columns.items() if v.ndim == 1}
+
+
+def score_matrix(m: Dict[str, np.ndarray], weights: Dict[str, float]) -> Dict[str, np.ndarray]:
+    """Score a batch of equal-length runs; every input is a (runs x checkpoints) matrix."""
+    years = m["year"]
+    urban = m["urbanShare"]
+    food = m["foodSecurityMean"]
+    disease = m["diseaseBurdenMean"]
+    collapse = m["collapseCount"]
+    area = m["medianCountryArea"]
+    trade = m["tradeIntensity"]
+    cap = (m["capabilityTier1Share"] + m["capabilityTier2Share"] + m["capabilityTier3Share"]) / 3.0
+    n = years.shape[1]
+
+    collapse_rate = np.zeros_like(collapse)
+    dy = np.maximum(1.0, years[:, 1:] - years[:, :-1])
+    collapse_rate[:, 1:] = np.maximum(0.0, collapse[:, 1:] - collapse[:, :-1]) / dy
+
+    score1 = 0.5 * (norm_corr(row_corr(food, urban)) + norm_corr(row_corr(food, -collapse_rate)))
+
+    cap_growth = cap[:, -1] - cap[:, 0]
+    trade_growth = trade[:, -1] - trade[:, 0]
+    saturation_penalty = np.clip(np.maximum(0.0, cap_growth - 1.8 * np.maximum(0.0, trade_growth)) / 0.25, 0.0, 1.0)
+    score2 = np.clip(
+        0.5 * (norm_corr(row_corr(cap, urban)) + norm_corr(row_corr(cap, trade))) - 0.25 * saturation_penalty,
+        0.0,
+        1.0,
     )
 
-    overall_collapse = safe_mean(collapse_rate)
-    high_area_threshold = percentile(area, 0.75)
-    high_area_collapse = safe_mean([collapse_rate[i] for i in range(n) if area[i] >= high_area_threshold])
-    constraint_bonus = clamp01((high_area_collapse - overall_collapse + 0.01) / 0.06)
-    score3 = clamp01(0.6 * norm_corr(corr(area, collapse_rate)) + 0.4 * constraint_bonus)
+    overall_collapse = collapse_rate.mean(axis=1)
+    high_area = area >= row_percentile(area, 0.75)[:, None]
+    high_n = high_area.sum(axis=1)
+    high_area_collapse = np.where(high_area, collapse_rate, 0.0).sum(axis=1) / np.maximum(1, high_n)
+    constraint_bonus = np.clip((high_area_collapse - overall_collapse + 0.01) / 0.06, 0.0, 1.0)
+    score3 = np.clip(0.6 * norm_corr(row_corr(area, collapse_rate)) + 0.4 * constraint_bonus, 0.0, 1.0)
 
     mid = n // 2
-    early_u = urban[:mid]
-    early_d = disease[:mid]
-    late_d = disease[mid:]
-    late_c = cap[mid:]
-    score4 = safe_mean([
-        norm_corr(corr(early_d, early_u)),
-        norm_corr(-corr(late_d, late_c)),
-    ])
-
-    trade_trend = slope(years, trade)
-    trend_score = clamp01((trade_trend + 0.00015) / 0.00030)
-    score5 = clamp01(0.55 * norm_corr(corr(trade, cap)) + 0.45 * trend_score)
-
-    wsum = (
-        weights["food_stability"]
-        + weights["innovation_urban"]
-        + weights["empire_logistics"]
-        + weights["disease_transition"]
-        + weights["trade_inequality"]
+    score4 = 0.5 * (
+        norm_corr(row_corr(disease[:, :mid], urban[:, :mid]))
+        + norm_corr(-row_corr(disease[:, mid:], cap[:, mid:]))
     )
+
+    trend_score = np.clip((row_slope(years, trade) + 0.00015) / 0.00030, 0.0, 1.0)
+    score5 = np.clip(0.55 * norm_corr(row_corr(trade, cap)) + 0.45 * trend_score, 0.0, 1.0)
+
+    wsum = sum(weights[k] for k in SCORE_COMPONENTS)
     if wsum <= 0.0:
         wsum = 1.0
+    comps = dict(zip(SCORE_COMPONENTS, (score1, score2, score3, score4, score5)))
+    total = sum(comps[k] * weights[k] for k in SCORE_COMPONENTS) / wsum
+    comps["run_score"] = np.clip(total, 0.0, 1.0)
+    return comps
 
-    total = (
-        score1 * weights["food_stability"]
-        + score2 * weights["innovation_urban"]
-        + score3 * weights["empire_logistics"]
-        + score4 * weights["disease_transition"]
-        + score5 * weights["trade_inequality"]
-    ) / wsum
-
-    return {
-        "food_stability": score1,
-        "innovation_urban": score2,
-        "empire_logistics": score3,
-        "disease_transition": score4,
-        "trade_inequality": score5,
-        "run_score": clamp01(total),
-    }
+
+def score_runs(runs: Sequence[Dict[str, np.ndarray]], weights: Dict[str, float]) -> List[Dict[str, float]]:
+    """Score many runs at once; runs are bucketed by usable length and each bucket is one matrix."""
+    out: List[Dict[str, float]] = [
+        {**{k: 0.0 for k in SCORE_COMPONENTS}, "run_score": 0.0} for _ in runs
+    ]
+    by_len: Dict[int, List[int]] = {}
+    for i, ts in enumerate(runs):
+        n = min(len(ts.get(c, ())) for c in SCORE_COLUMNS)
+        if n >= 4:
+            by_len.setdefault(n, []).append(i)
+    for n, idxs in by_len.items():
+        m = {c: np.stack([np.asarray(runs[i][c][:n], dtype=np.float64) for i in idxs]) for c in SCORE_COLUMNS}
+        comps = score_matrix(m, weights)
+        for row, i in enumerate(idxs):
+            out[i] = {k: float(v[row]) for k, v in comps.items()}
+    return out
+
+
+def run_score(ts: Dict[str, np.ndarray], weights: Dict[str, float]) -> Dict[str, float]:
+    return score_runs([ts], weights)[0]
 
 
-def collect_runs(runs_dir: Path) -> List[Tuple[Path, Path]]:
-    out: List[Tuple[Path, Path]] = []
-    for summary in sorted(runs_dir.glob("**/run_summary.json")):
-        csv_path = summary.parent / "timeseries.csv"
-        if csv_path.exists():
-            out.append((summary, csv_path))
+FINAL_METRIC_KEYS = (
+    "urbanShare",
+    "tradeIntensity",
+    "capabilityTier3Share",
+    "collapseCount",
+    "diseaseBurdenMean",
+)
+
+
+def iter_runs(runs_dir: Path) -> Iterator[Tuple[Path, Path]]:
+    """Yield (run_summary.json, timeseries.csv) pairs as directories are walked, without a full glob up front."""
+    for dirpath, dirnames, filenames in os.walk(runs_dir):
+        dirnames.sort()
+        if "run_summary.json" in filenames and "timeseries.csv" in filenames:
+            d = Path(dirpath)
+            yield (d / "run_summary.json", d / "timeseries.csv")
+
+
+def load_final_metric(ts: Dict[str, np.ndarray], key: str) -> float:
+    vals = ts.get(key, ())
+    return float(vals[-1]) if len(vals) else 0.0
+
+
+def evaluate_chunk(
+    chunk: List[Tuple[Path, Path]], weights: Dict[str, float]
+) -> List[Tuple[Path, Dict[str, Any], Dict[str, float]]]:
+    """Load and score a chunk of runs; returns (summary_path, per-run record, final metrics) per run."""
+    series = [read_timeseries(csv_path) for _, csv_path in chunk]
+    out = []
+    for (summary_path, _), ts, score in zip(chunk, series, score_runs(series, weights)):
+        record = {"run": str(summary_path.parent), **score}
+        out.append((summary_path, record, {k: load_final_metric(ts, k) for k in FINAL_METRIC_KEYS}))
     return out
 
 
-def load_final_metric(ts: Dict[str, List[float]], key: str) -> float:
-    vals = ts.get(key, [])
-    return float(vals[-1]) if vals else 0.0
+def iter_chunks(runs: Iterator[Tuple[Path, Path]], size: int) -> Iterator[List[Tuple[Path, Path]]]:
+    chunk: List[Tuple[Path, Path]] = []
+    for run in runs:
+        chunk.append(run)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_evaluations(
+    runs_dir: Path, weights: Dict[str, float], jobs: int, chunk_size: int
+) -> Iterator[Tuple[Path, Dict[str, Any], Dict[str, float]]]:
+    """Score runs while discovery is still walking the tree; results are yielded in completion order."""
+    chunks = iter_chunks(iter_runs(runs_dir), max(1, chunk_size))
+    if jobs <= 1:
+        for chunk in chunks:
+            yield from evaluate_chunk(chunk, weights)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = set()
+        for chunk in chunks:
+            pending.add(pool.submit(evaluate_chunk, chunk, weights))
+            if len(pending) >= 2 * jobs:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    yield from fut.result()
+        for fut in as_completed(pending):
+            yield from fut.result()
 
 
 def main() -> int:
@@ -246,6 +272,8 @@ def main() -> int:
     p.add_argument("--tolerance", type=float, default=0.03, help="Regression tolerance (relative floor)")
     p.add_argument("--out", default="", help="Optional output JSON path")
     p.add_argument("--write-baseline", action="store_true", help="Write computed aggregate as baseline")
+    p.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Worker processes for loading/scoring (1 = in-process)")
+    p.add_argument("--chunk-size", type=int, default=8, help="Runs per worker task")
     args = p.parse_args()
 
     runs_dir = Path(args.runsDir)
@@ -253,27 +281,16 @@ def main() -> int:
         raise SystemExit(f"runsDir not found: {runs_dir}")
 
     weights = load_weights(Path(args.config))
-    runs = collect_runs(runs_dir)
-    if not runs:
+    evaluated = []
+    for summary_path, record, finals in stream_evaluations(runs_dir, weights, int(args.jobs), int(args.chunk_size)):
+        evaluated.append((summary_path, record, finals))
+        print(f"[{len(evaluated)}] run={record['run']} run_score={record['run_score']:.6f}", file=sys.stderr, flush=True)
+    if not evaluated:
         raise SystemExit("No runs found (expected **/run_summary.json with neighboring timeseries.csv).")
+    evaluated.sort(key=lambda e: e[0])
 
-    per_run = []
-    final_vectors = {
-        "urbanShare": [],
-        "tradeIntensity": [],
-        "capabilityTier3Share": [],
-        "collapseCount": [],
-        "diseaseBurdenMean": [],
-    }
-    for summary_path, csv_path in runs:
-        ts = read_timeseries(csv_path)
-        score = run_score(ts, weights)
-        per_run.append({
-            "run": str(summary_path.parent),
-            **score,
-        })
-        for k in final_vectors:
-            final_vectors[k].append(load_final_metric(ts, k))
+    per_run = [record for _, record, _ in evaluated]
+    final_vectors = {k: [finals[k] for _, _, finals in evaluated] for k in FINAL_METRIC_KEYS}
 
     scores = [r["run_score"] for r in per_run]
     median_score = statistics.median(scores)
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import copy
-import csv
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import json
 import math
@@ -13,9 +13,23 @@ import random
 import shutil
 import statistics
 import subprocess
-from dataclasses import dataclass
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+TOOLS_DIR = Path(__file__).resolve().parent
+if str(TOOLS_DIR) not in sys.path:
+    sys.path.insert(0, str(TOOLS_DIR))
+
+import numpy as np  # noqa: E402
+from memory_admission import MemoryAdmission, horizon_key, resolve_budget_bytes  # noqa: E402
+from run_durations import DurationModel  # noqa: E402
+from run_resources import ResourceLedger, kill_child, wait_child, write_run_resources  # noqa: E402
+from timeseries_columns import TimeseriesColumns, read_timeseries_columns  # noqa: E402
 
 try:
     import tomli as toml_reader  # preferred explicit dependency
@@ -31,6 +45,8 @@ except Exception:
 
 TINY = 1e-12
 REQUIRED_RUN_ARTIFACTS = ("run_meta.json", "run_summary.json", "timeseries.csv", "violations.json")
+# Bump when score_seed_run changes so cached evaluations from older evaluator code are ignored.
+EVAL_CACHE_VERSION = "1"
 
 
 def clamp01(x: float) -> float:
@@ -86,24 +102,6 @@ def corr(x: List[float], y: List[float]) -> float:
     return max(-1.0, min(1.0, num / den))
 
 
-def parse_lat_bands(value: str) -> List[float]:
-    if not value:
-        return []
-    out: List[float] = []
-    for tok in value.split("|"):
-        tok = tok.strip()
-        if not tok:
-            continue
-        try:
-            out.append(float(tok))
-        except Exception:
-            out.append(0.0)
-    s = sum(max(0.0, v) for v in out)
-    if s > TINY:
-        return [max(0.0, v) / s for v in out]
-    return out
-
-
 def win_path(p: Path) -> str:
     s = str(p.resolve())
     if s.startswith("/mnt/") and len(s) > 6:
@@ -123,8 +121,11 @@ def load_json(path: Path) -> Dict[str, Any]:
 
 
 def write_json(path: Path, data: Dict[str, Any]) -> None:
+    # Replace rather than truncate: run artifacts may be hardlinks into the run cache.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
 
 
 def load_toml(path: Path) -> Dict[str, Any]:
@@ -244,26 +245,15 @@ def metric_max_error(a: List[float], b: List[float], mode: str) -> float:
     return max(errs) if errs else float("inf")
 
 
-def read_timeseries(path: Path) -> List[Dict[str, Any]]:
-    rows: List[Dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            out: Dict[str, Any] = {}
-            for k, v in row.items():
-                if v is None:
-                    out[k] = 0.0
-                    continue
-                vv = v.strip()
-                if k == "pop_share_by_lat_band":
-                    out[k] = parse_lat_bands(vv)
-                    continue
-                try:
-                    out[k] = float(vv)
-                except Exception:
-                    out[k] = vv
-            rows.append(out)
-    return rows
+def lat_band_entropy(ts: TimeseriesColumns) -> np.ndarray:
+    """Per-checkpoint latitude-band entropy, normalized by log(band count) when >= 2 bands."""
+    p = np.maximum(ts.lat_bands(), 0.0)
+    pos = p > TINY
+    ent = -np.where(pos, p * np.log(np.where(pos, p, 1.0)), 0.0).sum(axis=1)
+    counts = ts.lat_band_counts
+    multi = counts >= 2
+    ent[multi] /= np.log(counts[multi].astype(np.float64))
+    return ent
 
 
 @dataclass
@@ -283,6 +273,7 @@ class SeedEval:
 def check_metric_availability(
     out_dir: Path,
     defs: Dict[str, Any],
+    ts: Optional[TimeseriesColumns] = None,
 ) -> Tuple[bool, Dict[str, Any], List[Dict[str, Any]]]:
     req_artifacts = ["run_meta.json", "run_summary.json", "timeseries.csv", "violations.json"]
     missing_artifacts = [a for a in req_artifacts if not (out_dir / a).exists()]
@@ -294,10 +285,10 @@ def check_metric_availability(
     }
     violations: List[Dict[str, Any]] = []
 
-    ts_rows: List[Dict[str, Any]] = []
     if (out_dir / "timeseries.csv").exists():
-        ts_rows = read_timeseries(out_dir / "timeseries.csv")
-        cols = set(ts_rows[0].keys() if ts_rows else [])
+        if ts is None:
+            ts = read_timeseries_columns(out_dir / "timeseries.csv")
+        cols = set(ts.names if ts.n_rows > 0 else [])
         for c in defs["required_timeseries_columns"]:
             if c not in cols:
                 missing["missing_timeseries_columns"].append(c)
@@ -340,51 +331,60 @@ def check_metric_availability(
     return ok, missing, violations
 
 
-def evaluate_seed_run(
+def score_seed_run(
     seed: int,
     out_dir: Path,
     defs: Dict[str, Any],
-    write_eval_artifacts: bool = True,
+    ts: Optional[TimeseriesColumns] = None,
 ) -> SeedEval:
     t = defs["thresholds"]
     hardfail_ids = set(defs["hard_fails"])
     anti_ids = set(defs["anti_loophole_ids"])
 
-    metric_ok, missing, violations = check_metric_availability(out_dir, defs)
-    ts = read_timeseries(out_dir / "timeseries.csv") if (out_dir / "timeseries.csv").exists() else []
+    ts_path = out_dir / "timeseries.csv"
+    if ts is not None:
+        ts_cols = ts
+    else:
+        ts_cols = read_timeseries_columns(ts_path) if ts_path.exists() else TimeseriesColumns(names=[], n_rows=0)
+    metric_ok, missing, violations = check_metric_availability(out_dir, defs, ts=ts_cols)
     rs_raw = load_json(out_dir / "run_summary.json") if (out_dir / "run_summary.json").exists() else {}
+    n_rows = ts_cols.n_rows
 
-    if not ts:
+    if n_rows == 0:
         violations.append({"id": "MISSING_METRIC", "severity": 100.0, "hardfail": True, "details": {"empty_timeseries": True}})
 
-    years = [int(r.get("year", 0.0)) for r in ts]
-    pop = [float(r.get("world_pop_total", 0.0)) for r in ts]
-    food = [float(r.get("world_food_adequacy_index", 0.0)) for r in ts]
-    pop_growth = [float(r.get("world_pop_growth_rate_annual", 0.0)) for r in ts]
-    trade = [float(r.get("world_trade_intensity", 0.0)) for r in ts]
-    urban = [float(r.get("world_urban_share_proxy", 0.0)) for r in ts]
-    tech = [float(r.get("world_tech_capability_index_median", 0.0)) for r in ts]
-    disease_rate = [float(r.get("world_disease_death_rate", 0.0)) for r in ts]
-    fam_exp = [float(r.get("famine_exposure_share_t", 0.0)) for r in ts]
-    migration = [float(r.get("migration_rate_t", 0.0)) for r in ts]
-    market = [float(r.get("market_access_median", 0.0)) for r in ts]
-    hab_small = [float(r.get("habitable_cell_share_pop_gt_small", 0.0)) for r in ts]
-    coastal = [float(r.get("pop_share_coastal_vs_inland", 0.0)) for r in ts]
-    river = [float(r.get("pop_share_river_proximal", 0.0)) for r in ts]
-    health_cap = [float(r.get("health_capability_index", 0.0)) for r in ts]
-    storage_cap = [float(r.get("storage_capability_index", 0.0)) for r in ts]
-    logistics_cap = [float(r.get("logistics_capability_index", 0.0)) for r in ts]
-    transport_cost = [float(r.get("transport_cost_index", 0.0)) for r in ts]
-    long_trade_proxy = [float(r.get("long_distance_trade_proxy", 0.0)) for r in ts]
-    spoilage = [float(r.get("spoilage_kcal", 0.0)) for r in ts]
-    storage_loss = [float(r.get("storage_loss_kcal", 0.0)) for r in ts]
-    avail_before = [float(r.get("available_kcal_before_losses", 0.0)) for r in ts]
-    extraction = [float(r.get("extraction_index", 0.0)) for r in ts]
-
-    fam_count = [float(r.get("famine_wave_count", 0.0)) for r in ts]
-    epi_count = [float(r.get("epidemic_wave_count", 0.0)) for r in ts]
-    war_count = [float(r.get("major_war_count", 0.0)) for r in ts]
-    mig_count = [float(r.get("mass_migration_count", 0.0)) for r in ts]
+    def col(name: str) -> List[float]:
+        return ts_cols.column(name).tolist()
+
+    years = ts_cols.column("year").astype(np.int64).tolist()
+    pop = col("world_pop_total")
+    food = col("world_food_adequacy_index")
+    pop_growth = col("world_pop_growth_rate_annual")
+    trade = col("world_trade_intensity")
+    urban = col("world_urban_share_proxy")
+    tech = col("world_tech_capability_index_median")
+    disease_rate = col("world_disease_death_rate")
+    fam_exp = col("famine_exposure_share_t")
+    migration = col("migration_rate_t")
+    market = col("market_access_median")
+    hab_small = col("habitable_cell_share_pop_gt_small")
+    coastal = col("pop_share_coastal_vs_inland")
+    river = col("pop_share_river_proximal")
+    health_cap = col("health_capability_index")
+    storage_cap = col("storage_capability_index")
+    logistics_cap = col("logistics_capability_index")
+    transport_cost = col("transport_cost_index")
+    long_trade_proxy = col("long_distance_trade_proxy")
+    spoilage = col("spoilage_kcal")
+    storage_loss = col("storage_loss_kcal")
+    avail_before = col("available_kcal_before_losses")
+    extraction = col("extraction_index")
+    lat_entropy = lat_band_entropy(ts_cols).tolist()
+
+    fam_count = col("famine_wave_count")
+    epi_count = col("epidemic_wave_count")
+    war_count = col("major_war_count")
+    mig_count = col("mass_migration_count")
 
     def window_years(i: int) -> float:
         if i <= 0:
@@ -427,7 +427,7 @@ def evaluate_seed_run(
     epidemic_wave_rate: List[float] = []
     migration_wave_rate: List[float] = []
     adequacy_score: List[float] = []
-    for i in range(len(ts)):
+    for i in range(n_rows):
         wy = window_years(i)
         wc = wy / 100.0
         pop_avg = pop[i] if i == 0 else 0.5 * (pop[i] + pop[i - 1])
@@ -450,18 +450,7 @@ def evaluate_seed_run(
         # Geography
         g_settle = clamp01(hab_small[i] / float(t["settlement_target_share"]))
         g_access = clamp01((coastal[i] + river[i]) / float(t["access_target_sum"]))
-        bands = ts[i].get("pop_share_by_lat_band", [])
-        if not isinstance(bands, list):
-            bands = []
-        ent = 0.0
-        n_b = len(bands)
-        for p_i in bands:
-            p_i = max(0.0, float(p_i))
-            if p_i > TINY:
-                ent += -p_i * math.log(p_i)
-        if n_b >= 2:
-            ent /= math.log(float(n_b))
-        g_lat = clamp01(ent / float(t["lat_entropy_target"]))
+        g_lat = clamp01(lat_entropy[i] / float(t["lat_entropy_target"]))
         geography = 0.45 * g_settle + 0.35 * g_access + 0.20 * g_lat
 
         # Constraint
@@ -546,7 +535,7 @@ def evaluate_seed_run(
                     }
                 )
 
-    if ts:
+    if n_rows > 0:
         if tech[-1] < float(t["capability_T1"]) and long_trade_proxy[-1] > float(t["long_trade_share_max"]):
             if not (
                 logistics_cap[-1] >= float(t["logistics_R1"])
@@ -623,17 +612,6 @@ def evaluate_seed_run(
         "checkpoints": rs_raw.get("checkpoints", []),
     }
 
-    if write_eval_artifacts:
-        write_json(out_dir / "violations.json", {"violations": violations})
-        write_json(out_dir / "run_summary.json", summary)
-        meta_path = out_dir / "run_meta.json"
-        meta = load_json(meta_path) if meta_path.exists() else {}
-        meta["goals_version"] = defs.get("goals_version", "realism-envelope-v7")
-        meta["evaluator_version"] = defs.get("evaluator_version", "v7")
-        meta["definitions_version"] = defs.get("definitions_version", "v7")
-        meta["scoring_version"] = defs.get("scoring_version", "v7")
-        meta["definitions_values"] = defs.get("thresholds", {})
-        write_json(meta_path, meta)
     return SeedEval(
         seed=seed,
         total_score_seed=total_score_seed,
@@ -657,6 +635,112 @@ def evaluate_seed_run(
     )
 
 
+def write_seed_eval_artifacts(out_dir: Path, ev: SeedEval, defs: Dict[str, Any]) -> None:
+    write_json(out_dir / "violations.json", {"violations": ev.violations})
+    write_json(out_dir / "run_summary.json", ev.run_summary)
+    meta_path = out_dir / "run_meta.json"
+    meta = load_json(meta_path) if meta_path.exists() else {}
+    meta["goals_version"] = defs.get("goals_version", "realism-envelope-v7")
+    meta["evaluator_version"] = defs.get("evaluator_version", "v7")
+    meta["definitions_version"] = defs.get("definitions_version", "v7")
+    meta["scoring_version"] = defs.get("scoring_version", "v7")
+    meta["definitions_values"] = defs.get("thresholds", {})
+    write_json(meta_path, meta)
+
+
+def eval_cache_key(seed: int, run_dir: Path, defs_hash: str) -> str:
+    h = hashlib.sha256(f"{EVAL_CACHE_VERSION}|{int(seed)}|{defs_hash}".encode("utf-8"))
+    for name in REQUIRED_RUN_ARTIFACTS:
+        p = run_dir / name
+        h.update(name.encode("utf-8"))
+        h.update(hashlib.sha256(p.read_bytes()).digest() if p.exists() else b"<missing>")
+    return h.hexdigest()
+
+
+def eval_cache_path(eval_cache: Dict[str, Any], key: str) -> Path:
+    return Path(eval_cache["cache_root"]) / key[:2] / f"{key}.json"
+
+
+def load_cached_seed_eval(eval_cache: Dict[str, Any], key: str) -> Optional[SeedEval]:
+    path = eval_cache_path(eval_cache, key)
+    if not path.exists():
+        return None
+    try:
+        ev = SeedEval(**load_json(path))
+    except Exception:
+        return None
+    try:
+        # A hit refreshes the entry's age so prune_eval_cache only drops unused evaluations.
+        os.utime(path)
+    except OSError:
+        pass
+    return ev
+
+
+def prune_eval_cache(eval_cache: Dict[str, Any]) -> int:
+    """Delete evaluations not used for `max_age_sec` (0 = keep forever); returns how many were removed."""
+    max_age = float(eval_cache.get("max_age_sec", 0.0))
+    root = Path(eval_cache["cache_root"])
+    if max_age <= 0 or not root.exists():
+        return 0
+    cutoff = time.time() - max_age
+    removed = 0
+    for path in root.glob("*/*.json"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def store_cached_seed_eval(eval_cache: Dict[str, Any], key: str, ev: SeedEval) -> None:
+    path = eval_cache_path(eval_cache, key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(asdict(ev)), encoding="utf-8")
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            tmp.unlink()
+        except Exception:
+            pass
+
+
+def evaluate_seed_run(
+    seed: int,
+    out_dir: Path,
+    defs: Dict[str, Any],
+    write_eval_artifacts: bool = True,
+    eval_cache: Optional[Dict[str, Any]] = None,
+) -> SeedEval:
+    """Score one run directory, reusing the on-disk evaluation cache when its artifacts are unchanged.
+
+    Writing eval artifacts rewrites run_summary.json/violations.json/run_meta.json, so the
+    evaluation is also stored under the key of the rewritten directory; a resumed tuner then
+    reproduces the original evaluation instead of re-scoring the rewritten summary.
+    """
+    cache_on = bool((eval_cache or {}).get("enabled", False))
+    key = ""
+    ev: Optional[SeedEval] = None
+    if cache_on:
+        key = eval_cache_key(seed, out_dir, str(eval_cache["defs_hash"]))
+        ev = load_cached_seed_eval(eval_cache, key)
+    if ev is None:
+        ev = score_seed_run(seed, out_dir, defs)
+        if cache_on:
+            store_cached_seed_eval(eval_cache, key, ev)
+    if write_eval_artifacts:
+        write_seed_eval_artifacts(out_dir, ev, defs)
+        if cache_on:
+            post_key = eval_cache_key(seed, out_dir, str(eval_cache["defs_hash"]))
+            if post_key != key and not eval_cache_path(eval_cache, post_key).exists():
+                store_cached_seed_eval(eval_cache, post_key, ev)
+    return ev
+
+
 def compare_metric_series(
     a: SeedEval, b: SeedEval, eps_map: Dict[str, str]
 ) -> Tuple[bool, List[Dict[str, Any]]]:
@@ -717,13 +801,233 @@ def run_meta_matches(
     )
 
 
-def copy_run_artifacts(src_dir: Path, dst_dir: Path) -> None:
-    dst_dir.mkdir(parents=True, exist_ok=True)
-    for name in REQUIRED_RUN_ARTIFACTS:
-        shutil.copy2(src_dir / name, dst_dir / name)
+FICLONE = 0x40049409  # linux/fs.h, reflink on btrfs/xfs
+
+
+def link_or_copy(src: Path, dst: Path) -> str:
+    """Materialize `src` at `dst` as a hardlink, else a reflink, else a copy. Returns the mode used."""
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+
+            with src.open("rb") as fs, dst.open("wb") as fd:
+                fcntl.ioctl(fd.fileno(), FICLONE, fs.fileno())
+            return "reflink"
+        except Exception:
+            try:
+                dst.unlink()
+            except OSError:
+                pass
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+class RunStore:
+    """Content-addressed store for raw run artifacts, with an LRU byte budget.
+
+    Artifacts live once under `objects/<sha[:2]>/<sha>` and are shared between
+    entries; `index.json` maps each run key to its artifact hashes and last-use
+    time and is loaded once per process, so lookups do not touch the filesystem.
+    Hits are materialized into the seed dir with hardlinks (reflink/copy as
+    fallback), so artifacts in a seed dir must be replaced, never rewritten in
+    place (`write_json` does this). When the unique object bytes exceed
+    `budget_bytes` (0 = unlimited), least recently used entries are dropped.
+    """
+
+    INDEX_VERSION = 1
+
+    def __init__(self, root: Path, budget_bytes: int = 0) -> None:
+        self.root = root
+        self.budget_bytes = max(0, int(budget_bytes))
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.object_sizes: Dict[str, int] = {}
+        self.object_refs: Dict[str, int] = {}
+        # Objects being linked into a seed dir; eviction defers unlinking them until unpinned.
+        self.pins: Dict[str, int] = {}
+        self.index_dirty = False
+        self.stats = {"hits": 0, "misses": 0, "puts": 0, "evicted": 0, "links": {}}
+        self.root.mkdir(parents=True, exist_ok=True)
+        index_path = self.root / "index.json"
+        if index_path.exists():
+            try:
+                index = load_json(index_path)
+                if int(index.get("version", 0)) == self.INDEX_VERSION:
+                    self.entries = dict(index.get("entries", {}))
+                    self.object_sizes = {k: int(v) for k, v in index.get("objects", {}).items()}
+            except Exception:
+                self.entries = {}
+                self.object_sizes = {}
+        for entry in self.entries.values():
+            for sha in entry["files"].values():
+                self.object_refs[sha] = self.object_refs.get(sha, 0) + 1
+
+    def object_path(self, sha: str) -> Path:
+        return self.root / "objects" / sha[:2] / sha
+
+    def total_bytes(self) -> int:
+        return sum(self.object_sizes.values())
+
+    def save_index(self) -> None:
+        write_json(
+            self.root / "index.json",
+            {"version": self.INDEX_VERSION, "entries": self.entries, "objects": self.object_sizes},
+        )
+        self.index_dirty = False
+
+    def flush(self) -> None:
+        """Persist last-use times recorded by hits (puts and evictions save the index themselves)."""
+        with self.lock:
+            if self.index_dirty:
+                self.save_index()
+
+    def _unpin(self, shas: List[str]) -> None:
+        for sha in shas:
+            self.pins[sha] = self.pins.get(sha, 1) - 1
+            if self.pins[sha] <= 0:
+                self.pins.pop(sha, None)
+                if sha not in self.object_refs:
+                    try:
+                        self.object_path(sha).unlink()
+                    except OSError:
+                        pass
+
+    def materialize(self, key: str, dst_dir: Path) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or not all(self.object_path(sha).exists() for sha in entry["files"].values()):
+                self.stats["misses"] += 1
+                return False
+            entry["last_used"] = time.time()
+            self.index_dirty = True
+            files = dict(entry["files"])
+            for sha in files.values():
+                self.pins[sha] = self.pins.get(sha, 0) + 1
+        dst_dir.mkdir(parents=True, exist_ok=True)
+        modes: List[str] = []
+        try:
+            for name, sha in files.items():
+                dst = dst_dir / name
+                if dst.exists() or dst.is_symlink():
+                    dst.unlink()
+                modes.append(link_or_copy(self.object_path(sha), dst))
+        except OSError:
+            # An object vanished underneath us (e.g. removed outside this process): treat as a miss.
+            for name in files:
+                try:
+                    (dst_dir / name).unlink()
+                except OSError:
+                    pass
+            with self.lock:
+                self._unpin(list(files.values()))
+                self.stats["misses"] += 1
+            return False
+        with self.lock:
+            self._unpin(list(files.values()))
+            self.stats["hits"] += 1
+            for mode in modes:
+                self.stats["links"][mode] = self.stats["links"].get(mode, 0) + 1
+        return True
+
+    def put(self, key: str, src_dir: Path) -> None:
+        files = {name: hashlib.sha256((src_dir / name).read_bytes()).hexdigest() for name in REQUIRED_RUN_ARTIFACTS}
+        with self.lock:
+            for name, sha in files.items():
+                obj = self.object_path(sha)
+                if not obj.exists():
+                    obj.parent.mkdir(parents=True, exist_ok=True)
+                    tmp = obj.with_name(f"{sha}.{os.getpid()}.{threading.get_ident()}.tmp")
+                    link_or_copy(src_dir / name, tmp)
+                    os.replace(tmp, obj)
+                self.object_refs[sha] = self.object_refs.get(sha, 0) + 1
+                if sha not in self.object_sizes:
+                    self.object_sizes[sha] = obj.stat().st_size
+            old = self.entries.get(key)
+            if old is not None:
+                self._release(old)
+            self.entries[key] = {"files": files, "last_used": time.time()}
+            self.stats["puts"] += 1
+            self._evict(keep=key)
+            self.save_index()
+
+    def _release(self, entry: Dict[str, Any]) -> None:
+        for sha in entry["files"].values():
+            self.object_refs[sha] = self.object_refs.get(sha, 1) - 1
+            if self.object_refs[sha] <= 0:
+                self.object_refs.pop(sha, None)
+                self.object_sizes.pop(sha, None)
+                if sha in self.pins:
+                    continue
+                try:
+                    self.object_path(sha).unlink()
+                except OSError:
+                    pass
+
+    def _evict(self, keep: str) -> None:
+        if self.budget_bytes <= 0:
+            return
+        total = self.total_bytes()
+        for key in sorted(self.entries, key=lambda k: float(self.entries[k].get("last_used", 0.0))):
+            if total <= self.budget_bytes:
+                break
+            if key == keep:
+                continue
+            self._release(self.entries.pop(key))
+            self.stats["evicted"] += 1
+            total = self.total_bytes()
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "entries": len(self.entries),
+                "bytes": self.total_bytes(),
+                "budget_bytes": self.budget_bytes,
+                **copy.deepcopy(self.stats),
+            }
+
+
+_RUN_STORES: Dict[str, RunStore] = {}
+_RUN_STORES_LOCK = threading.Lock()
+
 
+def get_run_store(run_cache: Dict[str, Any]) -> RunStore:
+    root = Path(run_cache["cache_root"]).resolve()
+    with _RUN_STORES_LOCK:
+        store = _RUN_STORES.get(str(root))
+        if store is None:
+            store = RunStore(root, int(run_cache.get("budget_bytes", 0)))
+            _RUN_STORES[str(root)] = store
+        return store
 
-def run_cli(
+
+def find_cli_exe(exe_dir: Path) -> Path:
+    names = ("worldsim_cli.exe", "worldsim_cli") if os.name == "nt" else ("worldsim_cli", "worldsim_cli.exe")
+    for name in names:
+        if (exe_dir / name).exists():
+            return exe_dir / name
+    return exe_dir / names[0]
+
+
+def resolve_launcher(requested: str, exe_dir: Path) -> str:
+    """Pick how run_cli starts the simulator: `native` (argv exec with cwd) or `cmd` (legacy cmd.exe hop for WSL)."""
+    if requested in ("native", "cmd"):
+        return requested
+    if os.name == "nt":
+        return "native"
+    # On Linux/WSL, a native build runs directly; a Windows-only .exe keeps the cmd.exe hop.
+    return "cmd" if find_cli_exe(exe_dir).suffix.lower() == ".exe" else "native"
+
+
+class RunCancelled(RuntimeError):
+    """Raised by run_cli when a streaming race killed the child before it finished."""
+
+
+def cli_command(
     exe_dir: Path,
     seed: int,
     config_path: Path,
@@ -732,9 +1036,28 @@ def run_cli(
     end_year: int,
     checkpoint_every: int,
     use_gpu: bool,
-    runtime_env: Optional[Dict[str, str]] = None,
-) -> None:
-    out_dir.mkdir(parents=True, exist_ok=True)
+    launcher: str = "cmd",
+) -> Tuple[List[str], Optional[str]]:
+    """argv and cwd for one simulator run."""
+    if launcher == "native":
+        exe = find_cli_exe(exe_dir)
+        windows_exe = os.name == "nt" or exe.suffix.lower() == ".exe"
+
+        def cli_path(path: Path) -> str:
+            return win_path(path) if windows_exe else str(path.resolve())
+
+        argv = [
+            str(exe),
+            "--seed", str(seed),
+            "--config", cli_path(config_path),
+            "--startYear", str(start_year),
+            "--endYear", str(end_year),
+            "--checkpointEveryYears", str(checkpoint_every),
+            "--outDir", cli_path(out_dir),
+            "--useGPU", "1" if use_gpu else "0",
+        ]
+        return argv, str(exe_dir)
+
     exe_win = win_path(exe_dir)
     cfg_win = win_path(config_path)
     out_win = win_path(out_dir)
@@ -753,18 +1076,90 @@ def run_cli(
     else:
         wsl_cmd = Path("/mnt/c/Windows/System32/cmd.exe")
         cmd_exe = str(wsl_cmd) if wsl_cmd.exists() else "cmd.exe"
+    return [cmd_exe, "/c", cmd], None
+
+
+async def run_cli(
+    exe_dir: Path,
+    seed: int,
+    config_path: Path,
+    out_dir: Path,
+    start_year: int,
+    end_year: int,
+    checkpoint_every: int,
+    use_gpu: bool,
+    runtime_env: Optional[Dict[str, str]] = None,
+    launcher: str = "cmd",
+    timeout_sec: float = 0.0,
+    cancel_event: Optional[threading.Event] = None,
+    on_poll: Optional[Callable[[], Awaitable[None]]] = None,
+    poll_sec: float = 2.0,
+    on_spawn: Optional[Callable[[int], None]] = None,
+    on_usage: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> None:
+    """Run one simulator child; it is killed on timeout, race cancellation or task cancellation.
+
+    The child is reaped with `os.wait4` on a helper thread; `on_usage` receives its
+    wall/CPU/peak-RSS usage whenever it exits, including when it was killed.
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
     env = os.environ.copy()
     if runtime_env:
         env.update({k: str(v) for k, v in runtime_env.items()})
-    p = subprocess.run(
-        [cmd_exe, "/c", cmd],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        env=env,
-        check=False,
+    argv, cwd = cli_command(
+        exe_dir, seed, config_path, out_dir, start_year, end_year, checkpoint_every, use_gpu, launcher=launcher
     )
-    if p.returncode != 0:
-        raise RuntimeError(f"worldsim_cli failed seed={seed} rc={p.returncode}")
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_sec if timeout_sec > 0 else None
+    # Without a race to watch, the only wake-up needed is the child's exit (or the deadline).
+    tick = 0.2 if (cancel_event is not None or on_poll is not None) else None
+    next_poll = loop.time() + poll_sec
+    started = time.monotonic()
+    proc = subprocess.Popen(argv, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env)
+    if on_spawn is not None:
+        on_spawn(proc.pid)
+    # A dedicated reaper thread per child: asyncio's child watcher would lose the rusage, and a
+    # shared executor could queue reaps behind each other when jobs exceed its worker count.
+    waiter: asyncio.Future = loop.create_future()
+    reaped = threading.Event()
+    reaped_usage: Dict[str, Any] = {}
+
+    def reap() -> None:
+        reaped_usage.update(wait_child(proc, started))
+        reaped.set()
+        try:
+            loop.call_soon_threadsafe(lambda: waiter.done() or waiter.set_result(None))
+        except RuntimeError:
+            pass  # loop already closed; nobody is waiting
+
+    threading.Thread(target=reap, name=f"reap-{seed}", daemon=True).start()
+    try:
+        while True:
+            if cancel_event is not None and cancel_event.is_set():
+                raise RunCancelled(f"worldsim_cli cancelled seed={seed}")
+            wait_for = tick
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise RuntimeError(f"worldsim_cli timed out seed={seed} after {timeout_sec:.0f}s")
+                wait_for = remaining if wait_for is None else min(wait_for, remaining)
+            done, _ = await asyncio.wait({waiter}, timeout=wait_for)
+            if done:
+                break
+            if on_poll is not None and loop.time() >= next_poll:
+                await on_poll()
+                next_poll = loop.time() + poll_sec
+    finally:
+        if not reaped.is_set():
+            kill_child(proc)
+            # Blocking is brief after SIGKILL and, unlike awaiting, cannot be interrupted by a second cancel.
+            reaped.wait()
+        if on_usage is not None:
+            on_usage(reaped_usage)
+    rc = int(reaped_usage["returncode"])
+    if rc != 0:
+        raise RuntimeError(f"worldsim_cli failed seed={seed} rc={rc}")
 
 
 def aggregate_objective(seed_evals: List[SeedEval], defs: Dict[str, Any]) -> Dict[str, Any]:
@@ -831,6 +1226,82 @@ def paired_delta_stats(
     }
 
 
+class StreamingRace:
+    """Partial-objective watcher for one racing stage.
+
+    Checkpoint i's score only depends on timeseries rows <= i, so the scores of a
+    still-running candidate's completed rows equal its final scores for those rows
+    and can be paired with the incumbent's first k checkpoint scores on the same
+    seed (CRN). Penalties are not known until the run ends and are left out on both
+    sides. Once enough seeds have reported enough checkpoints, the median
+    per-seed delta is compared to `reject_below`; when it falls below, the cancel
+    event is set and run_cli kills the remaining children.
+    """
+
+    def __init__(
+        self,
+        defs: Dict[str, Any],
+        incumbent_by_seed: Dict[int, SeedEval],
+        seeds: List[int],
+        reject_below: float,
+        min_checkpoint_fraction: float,
+        min_seeds: int,
+    ) -> None:
+        self.defs = defs
+        self.incumbent_by_seed = incumbent_by_seed
+        self.reject_below = float(reject_below)
+        self.min_checkpoint_fraction = float(min_checkpoint_fraction)
+        self.min_seeds = max(1, min(int(min_seeds), len(seeds)))
+        self.cancel_event = threading.Event()
+        self.lock = threading.Lock()
+        self.partial_deltas: Dict[int, float] = {}
+        self.partial_fraction: Dict[int, float] = {}
+        self.estimate: Optional[float] = None
+
+    def observe(self, seed: int, run_dir: Path) -> None:
+        """Score the completed rows of a running seed's timeseries.csv."""
+        ts_path = run_dir / "timeseries.csv"
+        if self.cancel_event.is_set() or not ts_path.exists():
+            return
+        try:
+            ts = read_timeseries_columns(ts_path, complete_rows_only=True)
+            partial = score_seed_run(int(seed), run_dir, self.defs, ts=ts).checkpoint_scores
+        except Exception:
+            return
+        self.record(seed, partial)
+
+    def record(self, seed: int, checkpoint_scores: List[float]) -> None:
+        inc = self.incumbent_by_seed.get(int(seed))
+        if inc is None or not inc.checkpoint_scores:
+            return
+        partial = checkpoint_scores
+        k = min(len(partial), len(inc.checkpoint_scores))
+        if k <= 0:
+            return
+        delta = 100.0 * (safe_mean(partial[:k]) - safe_mean(inc.checkpoint_scores[:k]))
+        with self.lock:
+            self.partial_deltas[int(seed)] = delta
+            self.partial_fraction[int(seed)] = k / float(len(inc.checkpoint_scores))
+            ready = [
+                d for sd, d in self.partial_deltas.items() if self.partial_fraction[sd] >= self.min_checkpoint_fraction
+            ]
+            if len(ready) < self.min_seeds:
+                return
+            self.estimate = statistics.median(ready)
+            if self.estimate < self.reject_below:
+                self.cancel_event.set()
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "cancelled": self.cancel_event.is_set(),
+                "partial_objective_delta": self.estimate,
+                "reject_below": self.reject_below,
+                "seed_partial_deltas": {str(k): v for k, v in sorted(self.partial_deltas.items())},
+                "seed_checkpoint_fraction": {str(k): v for k, v in sorted(self.partial_fraction.items())},
+            }
+
+
 def normalized_stage_counts(stage_counts: List[int], total_seeds: int) -> List[int]:
     out: List[int] = []
     for n in stage_counts:
@@ -865,6 +1336,29 @@ def make_candidate(
         "old_val": old_val,
         "new_val": new_val,
         "direction": direction,
+        "edits": [
+            {
+                "path": pdef["path"],
+                "old": old_val,
+                "new": new_val,
+                "recommended_step": pdef["recommended_step"],
+                "direction": direction,
+            }
+        ],
+    }
+
+
+def make_joint_candidate(lane: str, edits: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Candidate that moves several parameters at once; it has no single `pdef` for per-parameter stats."""
+    return {
+        "lane": lane,
+        "group": "joint",
+        "path": f"joint[{len(edits)}]",
+        "pdef": None,
+        "old_val": None,
+        "new_val": None,
+        "direction": 0,
+        "edits": edits,
     }
 
 
@@ -956,8 +1450,13 @@ def propose_explore_candidate(
     iteration: int,
     rng: random.Random,
     avoid_path: Optional[str] = None,
+    avoid_paths: Optional[List[str]] = None,
+    lane: str = "explore",
 ) -> Dict[str, Any]:
-    choices = [p for p in pdefs if str(p["path"]) != str(avoid_path)] if avoid_path else list(pdefs)
+    avoid = {str(x) for x in (avoid_paths or [])}
+    if avoid_path:
+        avoid.add(str(avoid_path))
+    choices = [p for p in pdefs if str(p["path"]) not in avoid] if avoid else list(pdefs)
     if not choices:
         choices = list(pdefs)
     pdef = rng.choice(choices)
@@ -968,7 +1467,464 @@ def propose_explore_candidate(
     if rng.random() < 0.5:
         direction = -direction
     new_val = apply_step(old_val, pdef, direction)
-    return make_candidate("explore", pdef, old_val, new_val, direction)
+    return make_candidate(lane, pdef, old_val, new_val, direction)
+
+
+class OnePlusOneCMA:
+    """(1+1)-CMA-ES lane that moves all tunable parameters jointly.
+
+    Coordinates are in units of each parameter's `recommended_step` (as in
+    StepSurrogate). The parent is the incumbent config, so the mean only moves
+    when a candidate from any lane passes the racing/paired gates. Each
+    iteration samples one offspring within schema bounds; whether its scout
+    beats the incumbent by `min_delta` drives the success-rule step size and the
+    rank-one covariance update of Igel, Suttorp & Hansen (2006).
+    """
+
+    P_TARGET = 2.0 / 11.0
+    P_THRESH = 0.44
+    C_P = 1.0 / 12.0
+
+    def __init__(self, pdefs: List[Dict[str, Any]], sigma0: float, min_sigma: float, max_sigma: float) -> None:
+        n = len(pdefs)
+        self.pdefs = pdefs
+        self.steps = np.array([max(TINY, abs(float(p["recommended_step"]))) for p in pdefs], dtype=np.float64)
+        self.min_sigma = float(min_sigma)
+        self.max_sigma = float(max_sigma)
+        self.sigma = max(self.min_sigma, min(self.max_sigma, float(sigma0)))
+        self.cov = np.eye(n, dtype=np.float64)
+        self.p_c = np.zeros(n, dtype=np.float64)
+        self.p_succ = self.P_TARGET
+        self.damping = 1.0 + n / 2.0
+        self.c_c = 2.0 / (n + 2.0)
+        self.c_cov = 2.0 / (n * n + 6.0)
+
+    def ask(self, best_cfg: Dict[str, Any], rng: random.Random, lane: str = "cmaes", max_tries: int = 8) -> Optional[Dict[str, Any]]:
+        """Joint candidate around the incumbent, or None if bounds/int rounding leave every draw unchanged."""
+        try:
+            a = np.linalg.cholesky(self.cov)
+        except np.linalg.LinAlgError:
+            self.cov = np.eye(len(self.pdefs), dtype=np.float64)
+            a = self.cov
+        for _ in range(max_tries):
+            y = a @ np.array([rng.gauss(0.0, 1.0) for _ in self.pdefs], dtype=np.float64)
+            edits: List[Dict[str, Any]] = []
+            realized = np.zeros(len(self.pdefs), dtype=np.float64)
+            for i, pdef in enumerate(self.pdefs):
+                path = str(pdef["path"])
+                old_val = get_param(best_cfg, path)
+                raw = float(old_val) + self.sigma * float(y[i]) * float(self.steps[i])
+                raw = max(float(pdef["min"]), min(float(pdef["max"]), raw))
+                new_val: Any = int(round(raw)) if pdef["type"] == "int" else float(raw)
+                if new_val == old_val:
+                    continue
+                # Bounds and rounding change the step actually taken; the update must learn from that one.
+                realized[i] = (float(new_val) - float(old_val)) / float(self.steps[i]) / self.sigma
+                edits.append(
+                    {
+                        "path": path,
+                        "old": old_val,
+                        "new": new_val,
+                        "recommended_step": pdef["recommended_step"],
+                        "direction": 1 if float(new_val) > float(old_val) else -1,
+                    }
+                )
+            if edits:
+                cand = make_joint_candidate(lane, edits)
+                cand["cma_y"] = [float(v) for v in realized]
+                return cand
+        return None
+
+    def tell(self, y: List[float], success: bool) -> None:
+        self.p_succ = (1.0 - self.C_P) * self.p_succ + self.C_P * (1.0 if success else 0.0)
+        self.sigma *= math.exp((self.p_succ - self.P_TARGET) / (self.damping * (1.0 - self.P_TARGET)))
+        self.sigma = max(self.min_sigma, min(self.max_sigma, self.sigma))
+        if not success:
+            return
+        yv = np.array(y, dtype=np.float64)
+        if self.p_succ < self.P_THRESH:
+            self.p_c = (1.0 - self.c_c) * self.p_c + math.sqrt(self.c_c * (2.0 - self.c_c)) * yv
+            self.cov = (1.0 - self.c_cov) * self.cov + self.c_cov * np.outer(self.p_c, self.p_c)
+        else:
+            self.p_c = (1.0 - self.c_c) * self.p_c
+            self.cov = (1.0 - self.c_cov) * self.cov + self.c_cov * (
+                np.outer(self.p_c, self.p_c) + self.c_c * (2.0 - self.c_c) * self.cov
+            )
+
+    def state(self) -> Dict[str, Any]:
+        return {"sigma": self.sigma, "p_succ": self.p_succ, "p_c": self.p_c.tolist(), "cov": self.cov.tolist()}
+
+    def load_state(self, state: Dict[str, Any]) -> None:
+        self.sigma = float(state["sigma"])
+        self.p_succ = float(state["p_succ"])
+        self.p_c = np.array(state["p_c"], dtype=np.float64)
+        self.cov = np.array(state["cov"], dtype=np.float64)
+
+
+def morris_bounds(pdef: Dict[str, Any], cur_val: Any, radius_steps: float) -> Tuple[float, float]:
+    lo, hi = float(pdef["min"]), float(pdef["max"])
+    if radius_steps > 0:
+        r = float(radius_steps) * abs(float(pdef["recommended_step"]))
+        lo, hi = max(lo, float(cur_val) - r), min(hi, float(cur_val) + r)
+    return lo, hi
+
+
+def morris_design(
+    pdefs: List[Dict[str, Any]],
+    base_cfg: Dict[str, Any],
+    trajectories: int,
+    levels: int,
+    radius_steps: float,
+    rng: random.Random,
+) -> List[List[Dict[str, Any]]]:
+    """Morris one-at-a-time trajectories on a `levels`-point grid per parameter.
+
+    Each trajectory starts at a random grid point and moves every parameter once,
+    in random order, by the standard jump of levels/(2*(levels-1)) of its range.
+    Ranges are the schema bounds, or +/- `radius_steps` recommended steps around
+    the current value when that is positive. Points carry concrete values (ints
+    rounded), the moved path and the realized jump in unit coordinates.
+    """
+    p = max(2, int(levels))
+    jump = p / (2.0 * (p - 1))
+    spans = [morris_bounds(pdef, get_param(base_cfg, str(pdef["path"])), radius_steps) for pdef in pdefs]
+
+    def concrete(i: int, u: float) -> Any:
+        lo, hi = spans[i]
+        v = lo + u * (hi - lo)
+        return int(round(v)) if pdefs[i]["type"] == "int" else float(v)
+
+    def unit(i: int, v: Any) -> float:
+        lo, hi = spans[i]
+        return (float(v) - lo) / (hi - lo) if hi > lo else 0.0
+
+    design: List[List[Dict[str, Any]]] = []
+    for _ in range(max(1, int(trajectories))):
+        u = [rng.randrange(p) / (p - 1) for _ in pdefs]
+        values = {str(pdef["path"]): concrete(i, u[i]) for i, pdef in enumerate(pdefs)}
+        traj = [{"values": dict(values), "moved": None, "du": 0.0}]
+        order = list(range(len(pdefs)))
+        rng.shuffle(order)
+        for i in order:
+            path = str(pdefs[i]["path"])
+            u[i] = u[i] + jump if u[i] + jump <= 1.0 + 1e-9 else u[i] - jump
+            before = values[path]
+            values[path] = concrete(i, u[i])
+            traj.append({"values": dict(values), "moved": path, "du": unit(i, values[path]) - unit(i, before)})
+        design.append(traj)
+    return design
+
+
+def morris_effects(design: List[List[Dict[str, Any]]], objectives: List[List[float]]) -> Dict[str, Dict[str, float]]:
+    """Elementary effects per parameter: mu* (mean |EE|, the ranking statistic), mu and sigma."""
+    ee: Dict[str, List[float]] = {}
+    for traj, objs in zip(design, objectives):
+        for j in range(1, len(traj)):
+            path = str(traj[j]["moved"])
+            du = float(traj[j]["du"])
+            if abs(du) < TINY:
+                continue  # bounds/int rounding left the value unchanged
+            ee.setdefault(path, []).append((float(objs[j]) - float(objs[j - 1])) / du)
+    out: Dict[str, Dict[str, float]] = {}
+    for path, vals in ee.items():
+        out[path] = {
+            "mu_star": safe_mean([abs(v) for v in vals]),
+            "mu": safe_mean(vals),
+            "sigma": safe_std(vals),
+            "n": float(len(vals)),
+        }
+    return out
+
+
+class StepSurrogate:
+    """Online Bayesian linear model of the scout objective over tunable parameters.
+
+    Each parameter is measured in units of its `recommended_step`, so a weight is
+    the expected objective change per step and the zero-mean prior
+    (`prior_step_effect_sd`) says "unknown effect". Proposals are single-step
+    edits of the incumbent, so the predicted improvement is the weight times the
+    step difference, and its posterior sd is what keeps untried parameters from
+    being screened out.
+    """
+
+    def __init__(self, pdefs: List[Dict[str, Any]], noise_sd: float, prior_step_effect_sd: float) -> None:
+        self.paths = [str(p["path"]) for p in pdefs]
+        self.steps = np.array([max(TINY, abs(float(p["recommended_step"]))) for p in pdefs], dtype=np.float64)
+        self.noise_var = max(TINY, float(noise_sd)) ** 2
+        self.prior_var = max(TINY, float(prior_step_effect_sd)) ** 2
+        self.rows_x: List[np.ndarray] = []
+        self.rows_y: List[float] = []
+        self.weights: Optional[np.ndarray] = None
+        self.cov: Optional[np.ndarray] = None
+
+    def features(self, params: Dict[str, Any]) -> np.ndarray:
+        return np.array([float(params.get(p, 0.0)) for p in self.paths], dtype=np.float64) / self.steps
+
+    def add(self, params: Dict[str, Any], objective: float) -> None:
+        self.rows_x.append(self.features(params))
+        self.rows_y.append(float(objective))
+        self.weights = None
+
+    def fit(self) -> None:
+        n_params = len(self.paths)
+        if not self.rows_y:
+            self.weights = np.zeros(n_params, dtype=np.float64)
+            self.cov = np.eye(n_params, dtype=np.float64) * self.prior_var
+            return
+        x = np.vstack(self.rows_x)
+        y = np.array(self.rows_y, dtype=np.float64)
+        xc = x - x.mean(axis=0)
+        yc = y - y.mean()
+        precision = xc.T @ xc / self.noise_var + np.eye(n_params, dtype=np.float64) / self.prior_var
+        self.cov = np.linalg.inv(precision)
+        self.weights = self.cov @ (xc.T @ yc) / self.noise_var
+
+    def predict_delta(self, cand_params: Dict[str, Any], inc_params: Dict[str, Any]) -> Tuple[float, float]:
+        if self.weights is None:
+            self.fit()
+        d = self.features(cand_params) - self.features(inc_params)
+        mu = float(self.weights @ d)
+        sd = math.sqrt(max(0.0, float(d @ self.cov @ d)))
+        return mu, sd
+
+
+def surrogate_params(cfg: Dict[str, Any], pdefs: List[Dict[str, Any]]) -> Dict[str, float]:
+    return {str(p["path"]): float(get_param(cfg, str(p["path"]))) for p in pdefs}
+
+
+def surrogate_row_key(row: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Identity of a training row: the same config scored on the same seeds and horizon is one observation."""
+    params = tuple(sorted((str(k), float(v)) for k, v in row["params"].items()))
+    return params, tuple(int(x) for x in row.get("seeds", [])), int(row.get("end_year", 0))
+
+
+def load_surrogate_rows(
+    it_root: Path, seeds: List[int], end_year: int, before_iteration: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Distinct surrogate training rows recorded by earlier iterations with the same scout seeds and horizon."""
+    rows: List[Dict[str, Any]] = []
+    seen: Set[Tuple[Any, ...]] = set()
+    for path in sorted(it_root.glob("iter_*/iteration.json")):
+        if before_iteration is not None and int(path.parent.name.split("_")[-1]) >= before_iteration:
+            continue
+        try:
+            recorded = load_json(path).get("surrogate", {}).get("rows", [])
+        except Exception:
+            continue
+        for row in recorded:
+            if [int(x) for x in row.get("seeds", [])] == list(seeds) and int(row.get("end_year", 0)) == int(end_year):
+                key = surrogate_row_key(row)
+                if key not in seen:
+                    seen.add(key)
+                    rows.append(row)
+    return rows
+
+
+class TraceRecorder:
+    """Chrome trace-event timeline of a tuning campaign (open in Perfetto or chrome://tracing).
+
+    Tuner threads get one lane each for phase and seed-set spans; simulator jobs
+    run on numbered worker lanes shared by all concurrent seed sets. Timestamps
+    are wall-clock microseconds and each session gets its own trace `pid`, so a
+    resumed campaign appends to the same timeline.
+    """
+
+    def __init__(self, path: Optional[Path], append: bool = False) -> None:
+        self.path = path
+        self.enabled = path is not None
+        self.lock = threading.Lock()
+        self.events: List[Dict[str, Any]] = []
+        self.pid = 1
+        self.thread_lanes: Dict[int, int] = {}
+        self.worker_busy: List[bool] = []
+        self.open_phase: Optional[Tuple[str, float, Dict[str, Any]]] = None
+        if not self.enabled:
+            return
+        if append and path is not None and path.exists():
+            try:
+                self.events = list(load_json(path).get("traceEvents", []))
+            except Exception:
+                self.events = []
+            self.pid = 1 + max((int(e.get("pid", 0)) for e in self.events), default=0)
+        self._meta("process_name", 0, {"name": f"tuning session {self.pid} (pid {os.getpid()})"})
+        self._meta("process_sort_index", 0, {"sort_index": self.pid})
+
+    @staticmethod
+    def now() -> float:
+        return time.time() * 1e6
+
+    def _meta(self, name: str, tid: int, args: Dict[str, Any]) -> None:
+        self.events.append({"ph": "M", "name": name, "pid": self.pid, "tid": tid, "args": args})
+
+    def thread_lane(self) -> int:
+        ident = threading.get_ident()
+        with self.lock:
+            lane = self.thread_lanes.get(ident)
+            if lane is None:
+                lane = len(self.thread_lanes)
+                self.thread_lanes[ident] = lane
+                name = "tuner" if threading.current_thread() is threading.main_thread() else f"tuner {threading.current_thread().name}"
+                self._meta("thread_name", lane, {"name": name})
+                self._meta("thread_sort_index", lane, {"sort_index": lane})
+            return lane
+
+    def acquire_worker(self) -> int:
+        with self.lock:
+            for i, busy in enumerate(self.worker_busy):
+                if not busy:
+                    self.worker_busy[i] = True
+                    return 1000 + i
+            self.worker_busy.append(True)
+            i = len(self.worker_busy) - 1
+            self._meta("thread_name", 1000 + i, {"name": f"worker {i}"})
+            self._meta("thread_sort_index", 1000 + i, {"sort_index": 1000 + i})
+            return 1000 + i
+
+    def release_worker(self, tid: int) -> None:
+        with self.lock:
+            self.worker_busy[tid - 1000] = False
+
+    def complete(self, name: str, cat: str, tid: int, start_us: float, args: Optional[Dict[str, Any]] = None) -> None:
+        if not self.enabled:
+            return
+        event = {"ph": "X", "name": name, "cat": cat, "pid": self.pid, "tid": tid, "ts": start_us, "dur": max(0.0, self.now() - start_us)}
+        if args:
+            event["args"] = args
+        with self.lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name: str, cat: str, tid: Optional[int] = None, args: Optional[Dict[str, Any]] = None):
+        if not self.enabled:
+            yield
+            return
+        lane = self.thread_lane() if tid is None else tid
+        start = self.now()
+        try:
+            yield
+        finally:
+            self.complete(name, cat, lane, start, args)
+
+    def phase(self, name: Optional[str], args: Optional[Dict[str, Any]] = None) -> None:
+        """End the current top-level phase on the main tuner lane and, unless `name` is None, start the next."""
+        if not self.enabled:
+            return
+        lane = self.thread_lane()
+        if self.open_phase is not None:
+            prev_name, prev_start, prev_args = self.open_phase
+            self.complete(prev_name, "phase", lane, prev_start, prev_args)
+        self.open_phase = (name, self.now(), dict(args or {})) if name is not None else None
+
+    def save(self) -> None:
+        if not self.enabled or self.path is None:
+            return
+        with self.lock:
+            events = list(self.events)
+        if self.open_phase is not None:
+            # Show the still-running phase up to now without closing it.
+            name, start, args = self.open_phase
+            events.append({"ph": "X", "name": name, "cat": "phase", "pid": self.pid, "tid": self.thread_lanes.get(threading.main_thread().ident, 0), "ts": start, "dur": self.now() - start, "args": args})
+        try:
+            write_json(self.path, {"traceEvents": events, "displayTimeUnit": "ms"})
+        except OSError:
+            pass
+
+
+def config_content_key(config_path: Path) -> str:
+    """Hash of the parsed config, so TOML formatting and key order do not split identical configs."""
+    cfg = load_toml(config_path)
+    return hashlib.sha256(json.dumps(cfg, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")).hexdigest()[:16]
+
+
+class CandidateMemo:
+    """Per-seed evaluations and inner racing decisions for configs the loop already evaluated.
+
+    Lanes regularly revisit a config (a +1 step undone by a later -1, an explore
+    lane landing on an earlier reject). Seed evals are keyed by config content,
+    horizon and backend; a racing decision is keyed by candidate and incumbent
+    content, because it only holds against the incumbent it was raced against.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.evals: Dict[str, Dict[int, SeedEval]] = {}
+        self.decisions: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"seed_hits": 0, "seed_puts": 0, "decision_hits": 0}
+        self.dirty = False
+
+    @staticmethod
+    def run_key(content_key: str, start_year: int, end_year: int, checkpoint_every: int, use_gpu: bool) -> str:
+        return f"{content_key}|{start_year}|{end_year}|{checkpoint_every}|{'gpu' if use_gpu else 'cpu'}"
+
+    def lookup(self, run_key: str, seeds: List[int]) -> Dict[int, SeedEval]:
+        with self.lock:
+            known = self.evals.get(run_key, {})
+            hits = {int(s): known[int(s)] for s in seeds if int(s) in known}
+            self.stats["seed_hits"] += len(hits)
+            return hits
+
+    def put(self, run_key: str, evals: List[SeedEval]) -> None:
+        with self.lock:
+            known = self.evals.setdefault(run_key, {})
+            for ev in evals:
+                if int(ev.seed) not in known:
+                    known[int(ev.seed)] = ev
+                    self.stats["seed_puts"] += 1
+                    self.dirty = True
+
+    def decision(self, candidate_key: str, incumbent_key: str) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            found = self.decisions.get(f"{candidate_key}|{incumbent_key}")
+            if found is not None:
+                self.stats["decision_hits"] += 1
+            return copy.deepcopy(found)
+
+    def record_decision(self, candidate_key: str, incumbent_key: str, decision: Dict[str, Any]) -> None:
+        with self.lock:
+            self.decisions.setdefault(f"{candidate_key}|{incumbent_key}", copy.deepcopy(decision))
+            self.dirty = True
+
+    def load(self, fingerprint: Dict[str, Any]) -> None:
+        """Adopt a memo saved by an earlier session with the same inputs (used on --resume)."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            data = load_json(self.path)
+        except Exception:
+            return
+        if data.get("fingerprint") != fingerprint:
+            return
+        with self.lock:
+            for k, v in data.get("evals", {}).items():
+                known = self.evals.setdefault(k, {})
+                for s, e in v.items():
+                    known.setdefault(int(s), SeedEval(**e))
+            for k, d in data.get("decisions", {}).items():
+                self.decisions.setdefault(k, d)
+
+    def save(self, fingerprint: Dict[str, Any]) -> None:
+        if self.path is None:
+            return
+        with self.lock:
+            if not self.dirty:
+                return
+            payload = {
+                "fingerprint": fingerprint,
+                "evals": {k: {str(s): asdict(e) for s, e in v.items()} for k, v in self.evals.items()},
+                "decisions": self.decisions,
+            }
+            self.dirty = False
+        write_json(self.path, payload)
+
+    def summary(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "configs": len({k.split("|", 1)[0] for k in self.evals}),
+                "seed_evals": sum(len(v) for v in self.evals.values()),
+                "decisions": len(self.decisions),
+                **dict(self.stats),
+            }
 
 
 def run_seed_set(
@@ -986,109 +1942,238 @@ def run_seed_set(
     run_cache: Optional[Dict[str, Any]] = None,
     runtime_env: Optional[Dict[str, str]] = None,
     write_eval_artifacts: bool = True,
+    eval_cache: Optional[Dict[str, Any]] = None,
+    launcher: str = "cmd",
+    race: Optional[StreamingRace] = None,
+    race_poll_sec: float = 2.0,
+    job_timeout_sec: float = 0.0,
+    durations: Optional[DurationModel] = None,
+    admission: Optional[MemoryAdmission] = None,
+    resources: Optional[ResourceLedger] = None,
+    trace: Optional[TraceRecorder] = None,
+    memo: Optional[CandidateMemo] = None,
 ) -> List[SeedEval]:
+    """Run and evaluate `seeds` with exactly `jobs` simulator children in flight.
+
+    An asyncio loop drives the children; artifact hashing and scoring run on a
+    `jobs`-sized thread pool. A failing or timed-out seed cancels the rest (their
+    children are killed) and its error is raised. With `race`, seeds cancelled by
+    the race are left out of the result. With `durations`, seeds are dispatched
+    longest-expected first and simulator wall times are recorded back. With
+    `admission`, a child only starts once its projected peak RSS fits the
+    memory budget shared with any concurrently running seed sets. Every launched
+    child's usage is written to `run_resources.json` in its seed dir and, with
+    `resources`, recorded under this config hash and horizon. With `trace`, the
+    seed set, each seed job and its admission wait/simulate/evaluate steps are
+    recorded as timeline spans on worker lanes. With `memo`, seeds already
+    evaluated for the same config content and horizon are returned from it
+    without running (their seed dirs are not written) and new evals are added.
+    """
     out_dir.mkdir(parents=True, exist_ok=True)
-    n_jobs = max(1, min(int(jobs), len(seeds)))
+    memo_key = (
+        CandidateMemo.run_key(config_content_key(config_path), start_year, end_year, checkpoint_every, use_gpu)
+        if memo is not None
+        else ""
+    )
+    remembered = memo.lookup(memo_key, seeds) if memo is not None else {}
+    n_jobs = max(1, min(int(jobs), len(seeds) - len(remembered)))
     cfg_hash16 = hash16(config_path)
     cache_enabled = bool((run_cache or {}).get("enabled", False))
-    cache_root = Path((run_cache or {}).get("cache_root", out_dir / "_cache")).resolve()
     reuse_existing = bool((run_cache or {}).get("reuse_existing_seed_dirs", True))
-    materialize_from_cache = bool((run_cache or {}).get("materialize_from_cache", False))
-    if cache_enabled:
-        cache_root.mkdir(parents=True, exist_ok=True)
+    store = get_run_store(run_cache) if cache_enabled and run_cache is not None else None
+    tracing = trace is not None and trace.enabled
 
-    def run_one(seed: int) -> SeedEval:
+    async def run_one(seed: int, pool: ThreadPoolExecutor, lane: int) -> Optional[SeedEval]:
+        loop = asyncio.get_running_loop()
         sd = out_dir / f"seed_{seed}"
-        run_dir_for_eval = sd
+        if race is not None and race.cancel_event.is_set():
+            return None
 
-        if reuse_existing and run_dir_has_required_artifacts(sd) and run_meta_matches(sd, seed, cfg_hash16, start_year, end_year, use_gpu):
-            run_dir_for_eval = sd
-        else:
+        if not (reuse_existing and run_dir_has_required_artifacts(sd) and run_meta_matches(sd, seed, cfg_hash16, start_year, end_year, use_gpu)):
             used_cache = False
-            cache_sd = cache_root / f"{cfg_hash16}_{seed}_{start_year}_{end_year}_{checkpoint_every}_{'gpu' if use_gpu else 'cpu'}"
-            if cache_enabled and run_dir_has_required_artifacts(cache_sd) and run_meta_matches(cache_sd, seed, cfg_hash16, start_year, end_year, use_gpu):
-                used_cache = True
-                if materialize_from_cache:
-                    copy_run_artifacts(cache_sd, sd)
-                    run_dir_for_eval = sd
-                else:
-                    run_dir_for_eval = cache_sd
+            cache_key = f"{cfg_hash16}_{seed}_{start_year}_{end_year}_{checkpoint_every}_{'gpu' if use_gpu else 'cpu'}"
+            if store is not None and store.materialize(cache_key, sd):
+                used_cache = run_meta_matches(sd, seed, cfg_hash16, start_year, end_year, use_gpu)
 
             if not used_cache:
-                run_cli(
-                    exe_dir,
-                    seed,
-                    config_path,
-                    sd,
-                    start_year,
-                    end_year,
-                    checkpoint_every,
-                    use_gpu,
-                    runtime_env=runtime_env,
-                )
-                run_dir_for_eval = sd
-                if cache_enabled:
+                # Drop artifacts that may be hardlinks into the store before the simulator rewrites them.
+                for name in REQUIRED_RUN_ARTIFACTS:
+                    try:
+                        (sd / name).unlink()
+                    except FileNotFoundError:
+                        pass
+
+                async def observe() -> None:
+                    await loop.run_in_executor(pool, race.observe, seed, sd)
+
+                def on_usage(usage: Dict[str, Any]) -> None:
+                    write_run_resources(sd, usage)
+                    if resources is not None:
+                        resources.record(cfg_hash16, mem_horizon, usage)
+
+                admit_us = trace.now() if tracing else 0.0
+                token = await admission.admit_async(mem_horizon) if admission is not None else None
+                if tracing and trace.now() - admit_us > 10_000:
+                    trace.complete("admission wait", "admission", lane, admit_us)
+                finished = False
+                run_started = time.monotonic()
+                sim_us = trace.now() if tracing else 0.0
+                try:
+                    await run_cli(
+                        exe_dir,
+                        seed,
+                        config_path,
+                        sd,
+                        start_year,
+                        end_year,
+                        checkpoint_every,
+                        use_gpu,
+                        runtime_env=runtime_env,
+                        launcher=launcher,
+                        timeout_sec=job_timeout_sec,
+                        cancel_event=race.cancel_event if race is not None else None,
+                        on_poll=observe if race is not None else None,
+                        poll_sec=race_poll_sec,
+                        on_spawn=(lambda pid: admission.attach(token, pid)) if admission is not None else None,
+                        on_usage=on_usage,
+                    )
+                    finished = True
+                except RunCancelled:
+                    # Partial artifacts must not be picked up by reuse_existing_seed_dirs later.
+                    shutil.rmtree(sd, ignore_errors=True)
+                    return None
+                finally:
+                    # Only complete runs teach the per-horizon peak; a killed child's peak is partial.
+                    if admission is not None:
+                        admission.release(token, record=finished)
+                    if tracing:
+                        trace.complete("simulate", "simulate", lane, sim_us, {"finished": finished})
+                if durations is not None:
+                    durations.record(seed, start_year, end_year, backend, time.monotonic() - run_started)
+                if store is not None:
                     try:
-                        copy_run_artifacts(sd, cache_sd)
+                        await loop.run_in_executor(pool, store.put, cache_key, sd)
                     except Exception:
                         pass
-        return evaluate_seed_run(seed, run_dir_for_eval, defs, write_eval_artifacts=write_eval_artifacts)
+        eval_us = trace.now() if tracing else 0.0
+        ev = await loop.run_in_executor(
+            pool,
+            lambda: evaluate_seed_run(seed, sd, defs, write_eval_artifacts=write_eval_artifacts, eval_cache=eval_cache),
+        )
+        if tracing:
+            trace.complete("evaluate", "evaluate", lane, eval_us)
+        if race is not None:
+            race.record(seed, ev.checkpoint_scores)
+        return ev
 
     def p(msg: str) -> None:
         if label:
             print(f"[{label}] {msg}", flush=True)
 
     p(f"starting {len(seeds)} seed(s), jobs={n_jobs}, gpu={use_gpu}, years={start_year}->{end_year}")
-
-    if n_jobs == 1:
-        out: List[SeedEval] = []
-        for i, seed in enumerate(seeds, start=1):
-            p(f"seed {seed} ({i}/{len(seeds)}) start")
-            out.append(run_one(seed))
-            p(f"seed {seed} ({i}/{len(seeds)}) done")
-        return out
-
-    by_seed: Dict[int, SeedEval] = {}
-    with ThreadPoolExecutor(max_workers=n_jobs) as pool:
-        seed_iter = iter(seeds)
-        active: Dict[Any, int] = {}
-        for _ in range(n_jobs):
+    if remembered:
+        p(f"{len(remembered)} seed(s) from candidate memo")
+
+    by_seed: Dict[int, Optional[SeedEval]] = dict(remembered)
+    for seed, ev in remembered.items():
+        if race is not None:
+            race.record(seed, ev.checkpoint_scores)
+
+    backend = "gpu" if use_gpu else "cpu"
+    mem_horizon = horizon_key(start_year, end_year, backend)
+    pending = [s for s in seeds if s not in remembered]
+    dispatch = durations.order(pending, start_year, end_year, backend) if durations is not None else pending
+
+    async def schedule() -> None:
+        seed_iter = iter(dispatch)
+        done_n = len(remembered)
+
+        # Each worker owns one slot and pulls the next seed as soon as its own finishes.
+        async def worker(pool: ThreadPoolExecutor) -> None:
+            nonlocal done_n
+            lane = trace.acquire_worker() if tracing else 0
             try:
-                s = next(seed_iter)
-            except StopIteration:
-                break
-            active[pool.submit(run_one, s)] = s
-        p("workers launched")
-        done_n = 0
-        while active:
-            for fut in as_completed(list(active.keys()), timeout=None):
-                seed = active.pop(fut)
-                by_seed[seed] = fut.result()
-                done_n += 1
-                p(f"seed {seed} ({done_n}/{len(seeds)}) done")
-                try:
-                    s = next(seed_iter)
-                    active[pool.submit(run_one, s)] = s
-                except StopIteration:
-                    pass
-                break
-    return [by_seed[seed] for seed in seeds]
+                for seed in seed_iter:
+                    seed_us = trace.now() if tracing else 0.0
+                    outcome = "error"
+                    try:
+                        by_seed[seed] = await run_one(seed, pool, lane)
+                        outcome = "done" if by_seed[seed] is not None else "cancelled"
+                    finally:
+                        if tracing:
+                            trace.complete(f"seed {seed}", "seed", lane, seed_us, {"label": label, "outcome": outcome})
+                    done_n += 1
+                    p(f"seed {seed} ({done_n}/{len(seeds)}) {outcome}")
+            finally:
+                if tracing:
+                    trace.release_worker(lane)
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            workers = [asyncio.create_task(worker(pool)) for _ in range(n_jobs)]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                for w in workers:
+                    w.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+
+    span = trace.span(label or "seed set", "seed_set", args={"seeds": len(seeds), "jobs": n_jobs, "years": [start_year, end_year], "gpu": use_gpu}) if tracing else nullcontext()
+    try:
+        with span:
+            asyncio.run(schedule())
+    finally:
+        if store is not None:
+            store.flush()
+        if durations is not None:
+            durations.save()
+        if admission is not None:
+            admission.save()
+    if memo is not None:
+        memo.put(memo_key, [ev for ev in by_seed.values() if ev is not None])
+    return [ev for ev in (by_seed[seed] for seed in seeds) if ev is not None]
 
 
 def load_seed_set_from_existing(
     seeds: List[int],
     seed_root: Path,
     defs: Dict[str, Any],
+    eval_cache: Optional[Dict[str, Any]] = None,
 ) -> Optional[List[SeedEval]]:
     out: List[SeedEval] = []
     for seed in seeds:
         sd = seed_root / f"seed_{seed}"
         if not run_dir_has_required_artifacts(sd):
             return None
-        out.append(evaluate_seed_run(seed, sd, defs, write_eval_artifacts=False))
+        out.append(evaluate_seed_run(seed, sd, defs, write_eval_artifacts=False, eval_cache=eval_cache))
     return out
 
 
+LOOP_STATE_VERSION = 1
+
+
+def rng_state_to_json(state: Tuple[Any, ...]) -> List[Any]:
+    version, internal, gauss_next = state
+    return [version, list(internal), gauss_next]
+
+
+def rng_state_from_json(data: List[Any]) -> Tuple[Any, ...]:
+    return (int(data[0]), tuple(int(x) for x in data[1]), data[2])
+
+
+def load_loop_state(path: Path, fingerprint: Dict[str, Any]) -> Dict[str, Any]:
+    """Read the loop checkpoint written by a previous run; refuse one taken with different inputs."""
+    if not path.exists():
+        raise SystemExit(f"--resume: no loop checkpoint at {path}")
+    state = load_json(path)
+    if int(state.get("version", 0)) != LOOP_STATE_VERSION:
+        raise SystemExit(f"--resume: unsupported loop checkpoint version in {path}")
+    if state.get("fingerprint") != fingerprint:
+        diff = sorted(k for k in set(fingerprint) | set(state.get("fingerprint", {})) if state.get("fingerprint", {}).get(k) != fingerprint.get(k))
+        raise SystemExit(f"--resume: checkpoint {path} was taken with different inputs: {diff}")
+    return state
+
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Fine tuning loop for realism objective.")
     ap.add_argument("--config", default="data/sim_config.toml")
@@ -1101,6 +2186,22 @@ def main() -> int:
     ap.add_argument("--force-rebaseline", action="store_true")
     ap.add_argument("--stop-flag", default="", help="Optional file path; if created, loop stops gracefully after current iteration.")
     ap.add_argument("--no-write-live-config", action="store_true", help="Do not overwrite --config with best_sim_config.toml at end.")
+    ap.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue from loop_state.json in --out-dir: restart the interrupted iteration with its saved incumbent, stats and RNG state.",
+    )
+    ap.add_argument(
+        "--screen-only",
+        action="store_true",
+        help="Run (or reuse) the Morris parameter screening, write screening.json and exit without tuning.",
+    )
+    ap.add_argument(
+        "--launcher",
+        choices=["auto", "native", "cmd"],
+        default="auto",
+        help="How to start worldsim_cli: native argv exec, legacy cmd.exe hop (WSL -> Windows exe), or auto by platform.",
+    )
     args = ap.parse_args()
 
     root = Path.cwd()
@@ -1171,6 +2272,13 @@ def main() -> int:
     # (2) Adaptive racing: stage-wise evaluation with early reject.
     racing_enabled = bool(racing_cfg.get("enabled", True))
     early_reject_margin = float(racing_cfg.get("early_reject_margin", 0.75))
+    # Streaming racing: score completed timeseries rows while stage seeds run and kill the stage early.
+    streaming_racing = {
+        "enabled": bool(racing_cfg.get("streaming_enabled", False)),
+        "poll_sec": max(0.2, float(racing_cfg.get("streaming_poll_sec", 2.0))),
+        "min_checkpoint_fraction": clamp01(float(racing_cfg.get("streaming_min_checkpoint_fraction", 0.5))),
+        "min_seeds": max(1, int(racing_cfg.get("streaming_min_seeds", 2))),
+    }
     # (5) Paired statistical accept rule (additional to objective gates).
     paired_enabled = bool(paired_cfg.get("enabled", True))
     paired_z = float(paired_cfg.get("confidence_z", 1.96))
@@ -1185,6 +2293,27 @@ def main() -> int:
     auto_seed_jobs = bool(rt_cfg.get("auto_seed_jobs_from_cpu", True))
     if auto_seed_jobs:
         seed_jobs = max(1, min(seed_jobs, max(1, cpu_count - reserve_cpu_cores)))
+    launcher = resolve_launcher(str(args.launcher), exe_dir)
+    # Longest-expected-first dispatch from simulator wall times persisted across runs.
+    run_durations = DurationModel(out_root / "run_durations.json")
+    # Per-seed wall-clock limit for a simulator child (0 = none); a timeout fails the seed set.
+    seed_timeout_sec = max(0.0, float(rt_cfg.get("seed_timeout_sec", 0.0)))
+    # Children are admitted only while their learned peak RSS fits this budget (0 = 80% of MemAvailable, <0 = off).
+    memory_budget_gb = float(rt_cfg.get("memory_budget_gb", 0.0))
+    mem_admission = MemoryAdmission(resolve_budget_bytes(memory_budget_gb), out_root / "run_memory.json")
+    # Wall/CPU/peak-RSS of every launched child, rolled up per config hash and horizon at the end.
+    run_resources = ResourceLedger()
+    # Chrome trace-event timeline of phases and seed jobs (tuning_trace.json); a resumed run appends to it.
+    trace_timeline = bool(rt_cfg.get("trace_timeline", True))
+    trace = TraceRecorder(out_root / "tuning_trace.json" if trace_timeline else None, append=bool(args.resume))
+    if streaming_racing["enabled"] and launcher != "native":
+        # Killing the cmd.exe hop does not reliably stop the simulator it started.
+        print("[startup] streaming racing disabled: requires --launcher native", flush=True)
+        streaming_racing["enabled"] = False
+    if seed_timeout_sec > 0 and launcher != "native":
+        # Same hop: a timed-out kill would orphan the simulator while its slot is handed to the next job.
+        print("[startup] seed_timeout_sec ignored: requires --launcher native", flush=True)
+        seed_timeout_sec = 0.0
     runtime_env: Dict[str, str] = {}
     if bool(rt_cfg.get("pin_single_thread_env", True)):
         runtime_env.update(
@@ -1202,9 +2331,30 @@ def main() -> int:
         "enabled": run_cache_enabled,
         "cache_root": str((out_root / str(cache_cfg.get("cache_subdir", "run_cache"))).resolve()),
         "reuse_existing_seed_dirs": bool(cache_cfg.get("reuse_existing_seed_dirs", True)),
-        "materialize_from_cache": bool(cache_cfg.get("materialize_from_cache", False)),
+        # LRU byte budget for the content-addressed store (0 = unlimited).
+        "budget_bytes": max(0, int(float(cache_cfg.get("budget_gb", 0.0)) * (1024 ** 3))),
     }
 
+    # Evaluation cache: per-run SeedEval keyed by artifact content + realism_definitions.json hash.
+    eval_cache_cfg = accel.get("eval_cache", {}) if isinstance(accel.get("eval_cache", {}), dict) else {}
+    eval_cache = {
+        "enabled": bool(eval_cache_cfg.get("enabled", True)),
+        "cache_root": str((out_root / str(eval_cache_cfg.get("cache_subdir", "eval_cache"))).resolve()),
+        "defs_hash": hashlib.sha256(defs_path.read_bytes()).hexdigest(),
+        # Entries unused for this long are dropped at startup (0 = never); keys embed the
+        # definitions hash, so edits to realism_definitions.json strand old entries.
+        "max_age_sec": max(0.0, float(eval_cache_cfg.get("max_age_days", 30.0))) * 86400.0,
+    }
+    if eval_cache["enabled"]:
+        pruned = prune_eval_cache(eval_cache)
+        if pruned:
+            print(f"[startup] eval cache: pruned {pruned} entries unused for {eval_cache_cfg.get('max_age_days', 30.0)} days", flush=True)
+
+    # Candidate memo: configs the loop revisits reuse their seed evals and racing decision.
+    memo_cfg = accel.get("candidate_memo", {}) if isinstance(accel.get("candidate_memo", {}), dict) else {}
+    candidate_memo_enabled = bool(memo_cfg.get("enabled", True))
+    candidate_memo = CandidateMemo(out_root / "candidate_memo.json") if candidate_memo_enabled else None
+
     # (7) I/O minimization policy.
     write_eval_inner = bool(io_cfg.get("write_eval_artifacts_for_inner", False))
     write_eval_holdout = bool(io_cfg.get("write_eval_artifacts_for_holdout", True))
@@ -1213,9 +2363,42 @@ def main() -> int:
 
     # (8) Smarter proposals and (9) two-lane search.
     two_lane = bool(search_cfg.get("two_lane_enabled", True))
+    # Candidates scouted concurrently per iteration: one exploit lane plus explore lanes on distinct params.
+    batch_candidates = max(1, int(search_cfg.get("batch_candidates", 2 if two_lane else 1)))
     ucb_explore_coeff = float(search_cfg.get("ucb_explore_coeff", 0.75))
     search_random_seed = int(search_cfg.get("random_seed", 1337))
     rng = random.Random(search_random_seed)
+    # Surrogate pre-screen: drop proposals whose optimistic predicted scout delta is below the floor.
+    surrogate_cfg = search_cfg.get("surrogate", {}) if isinstance(search_cfg.get("surrogate", {}), dict) else {}
+    surrogate_policy = {
+        "enabled": bool(surrogate_cfg.get("enabled", False)),
+        "min_history": max(1, int(surrogate_cfg.get("min_history", 8))),
+        "noise_sd": float(surrogate_cfg.get("noise_sd", 1.0)),
+        "prior_step_effect_sd": float(surrogate_cfg.get("prior_step_effect_sd", 2.0)),
+        "kappa": float(surrogate_cfg.get("kappa", 1.0)),
+        "min_predicted_delta": float(surrogate_cfg.get("min_predicted_delta", 0.0)),
+        "max_redraws": max(0, int(surrogate_cfg.get("max_redraws", 4))),
+    }
+    # Morris elementary-effects screening: tune only parameters whose mu* is a meaningful share of the largest.
+    screening_cfg = search_cfg.get("screening", {}) if isinstance(search_cfg.get("screening", {}), dict) else {}
+    screening_policy = {
+        "enabled": bool(screening_cfg.get("enabled", False)),
+        "trajectories": max(1, int(screening_cfg.get("trajectories", 4))),
+        "levels": max(2, int(screening_cfg.get("levels", 4))),
+        "seeds": max(1, int(screening_cfg.get("seeds", 2))),
+        "radius_steps": max(0.0, float(screening_cfg.get("radius_steps", 0.0))),
+        "min_mu_star_fraction": max(0.0, float(screening_cfg.get("min_mu_star_fraction", 0.1))),
+        "keep_top": max(0, int(screening_cfg.get("keep_top", 0))),
+        "random_seed": int(screening_cfg.get("random_seed", search_random_seed)),
+    }
+    # Extra (1+1)-CMA-ES lane moving all tunable parameters jointly; sigma is in recommended steps.
+    cmaes_cfg = search_cfg.get("cmaes", {}) if isinstance(search_cfg.get("cmaes", {}), dict) else {}
+    cmaes_policy = {
+        "enabled": bool(cmaes_cfg.get("enabled", False)),
+        "initial_sigma_steps": float(cmaes_cfg.get("initial_sigma_steps", 1.0)),
+        "min_sigma_steps": max(TINY, float(cmaes_cfg.get("min_sigma_steps", 0.1))),
+        "max_sigma_steps": float(cmaes_cfg.get("max_sigma_steps", 8.0)),
+    }
 
     curriculum = schema.get("tuning_curriculum", {}) if isinstance(schema.get("tuning_curriculum", {}), dict) else {}
     curriculum_enabled = bool(curriculum.get("enabled", False))
@@ -1266,7 +2449,9 @@ def main() -> int:
     baseline_obj_path = out_root / "baseline_objective.json"
     baseline_gate_path = out_root / "baseline_gates.json"
     print(f"[startup] output_dir={out_root}", flush=True)
-    print(f"[startup] tuning_seeds={tuning_seeds} holdout_seeds={holdout_seeds} seed_jobs={seed_jobs}", flush=True)
+    print(f"[startup] tuning_seeds={tuning_seeds} holdout_seeds={holdout_seeds} seed_jobs={seed_jobs} launcher={launcher}", flush=True)
+    if mem_admission.enabled:
+        print(f"[startup] memory admission budget={mem_admission.budget_bytes / 1024 ** 3:.1f} GiB", flush=True)
     print(
         f"[startup] tuning_window policy=[{policy_start}, {policy_max_end}] effective=[{start_year}, {end_year}]",
         flush=True,
@@ -1276,60 +2461,71 @@ def main() -> int:
         flush=True,
     )
     print(
-        f"[startup] accelerators crn={crn_enabled} racing={racing_enabled} stages={stage_counts} paired={paired_enabled} two_lane={two_lane} cache={run_cache_enabled}",
+        f"[startup] accelerators crn={crn_enabled} racing={racing_enabled} streaming={streaming_racing['enabled']} stages={stage_counts} paired={paired_enabled} two_lane={two_lane} batch={batch_candidates} cmaes={cmaes_policy['enabled']} memo={candidate_memo_enabled} cache={run_cache_enabled} eval_cache={eval_cache['enabled']}",
         flush=True,
     )
-    write_json(
-        out_root / "tuning_policy.json",
-        {
-            "tuning_year_window": {
-                "policy_start_year": policy_start,
-                "policy_max_end_year": policy_max_end,
-                "enforce_start_year": enforce_start_year,
-                "allow_shorter_end_year": allow_shorter_end_year,
-                "effective_start_year": start_year,
-                "effective_end_year": end_year,
+    tuning_policy: Dict[str, Any] = {
+        "tuning_year_window": {
+            "policy_start_year": policy_start,
+            "policy_max_end_year": policy_max_end,
+            "enforce_start_year": enforce_start_year,
+            "allow_shorter_end_year": allow_shorter_end_year,
+            "effective_start_year": start_year,
+            "effective_end_year": end_year,
+        },
+        "frozen_scenario": {
+            "enabled": bool(frozen_scenario.get("enabled", False)),
+            "required_paths": frozen_scenario.get("required_paths", {}),
+            "applied_overrides": frozen_changes,
+        },
+        "accelerators": {
+            "common_random_numbers": {"enabled": crn_enabled},
+            "adaptive_racing": {
+                "enabled": racing_enabled,
+                "stage_seed_counts": stage_counts,
+                "early_reject_margin": early_reject_margin,
+                "streaming": streaming_racing,
             },
-            "frozen_scenario": {
-                "enabled": bool(frozen_scenario.get("enabled", False)),
-                "required_paths": frozen_scenario.get("required_paths", {}),
-                "applied_overrides": frozen_changes,
+            "paired_acceptance": {
+                "enabled": paired_enabled,
+                "confidence_z": paired_z,
+                "min_inner_lcb_delta": paired_min_inner_lcb_delta,
+                "min_long_lcb_delta": paired_min_long_lcb_delta,
+                "min_holdout_lcb_delta": paired_min_holdout_lcb_delta,
             },
-            "accelerators": {
-                "common_random_numbers": {"enabled": crn_enabled},
-                "adaptive_racing": {
-                    "enabled": racing_enabled,
-                    "stage_seed_counts": stage_counts,
-                    "early_reject_margin": early_reject_margin,
-                },
-                "paired_acceptance": {
-                    "enabled": paired_enabled,
-                    "confidence_z": paired_z,
-                    "min_inner_lcb_delta": paired_min_inner_lcb_delta,
-                    "min_long_lcb_delta": paired_min_long_lcb_delta,
-                    "min_holdout_lcb_delta": paired_min_holdout_lcb_delta,
-                },
-                "run_cache": run_cache,
-                "io": {
-                    "write_eval_artifacts_for_inner": write_eval_inner,
-                    "write_eval_artifacts_for_holdout": write_eval_holdout,
-                    "prune_rejected_iterations": prune_rejected,
-                    "keep_candidate_if_rejected": keep_candidate_if_rejected,
-                },
-                "search": {
-                    "two_lane_enabled": two_lane,
-                    "ucb_explore_coeff": ucb_explore_coeff,
-                    "random_seed": search_random_seed,
-                },
-                "runtime_hygiene": {
-                    "auto_seed_jobs_from_cpu": auto_seed_jobs,
-                    "reserve_cpu_cores": reserve_cpu_cores,
-                    "pin_single_thread_env": bool(rt_cfg.get("pin_single_thread_env", True)),
-                    "runtime_env": runtime_env,
-                },
+            "run_cache": run_cache,
+            "eval_cache": eval_cache,
+            "candidate_memo": {"enabled": candidate_memo_enabled},
+            "io": {
+                "write_eval_artifacts_for_inner": write_eval_inner,
+                "write_eval_artifacts_for_holdout": write_eval_holdout,
+                "prune_rejected_iterations": prune_rejected,
+                "keep_candidate_if_rejected": keep_candidate_if_rejected,
+            },
+            "search": {
+                "two_lane_enabled": two_lane,
+                "batch_candidates": batch_candidates,
+                "surrogate": surrogate_policy,
+                "cmaes": cmaes_policy,
+                "screening": screening_policy,
+                "ucb_explore_coeff": ucb_explore_coeff,
+                "random_seed": search_random_seed,
+            },
+            "runtime_hygiene": {
+                "auto_seed_jobs_from_cpu": auto_seed_jobs,
+                "reserve_cpu_cores": reserve_cpu_cores,
+                "pin_single_thread_env": bool(rt_cfg.get("pin_single_thread_env", True)),
+                "runtime_env": runtime_env,
+                "launcher": launcher,
+                "seed_timeout_sec": seed_timeout_sec,
+                "memory_budget_gb": memory_budget_gb,
+                "memory_budget_bytes": mem_admission.budget_bytes,
+                "memory_admission_enabled": mem_admission.enabled,
+                "trace_timeline": trace_timeline,
             },
         },
-    )
+    }
+    write_json(out_root / "tuning_policy.json", tuning_policy)
     base_inner_agg: Dict[str, Any]
     base_inner_holdout_agg: Dict[str, Any]
     base_inner_top3: List[str]
@@ -1343,6 +2539,115 @@ def main() -> int:
     baseline_long_tune: List[SeedEval]
     baseline_long_holdout: List[SeedEval]
 
+    screening_record: Optional[Dict[str, Any]] = None
+    if screening_policy["enabled"] or args.screen_only:
+        trace.phase("screening")
+        screen_seeds = tuning_seeds[: screening_policy["seeds"]]
+        screening_path = out_root / "screening.json"
+        screen_fp = {
+            "schema_hash16": hash16(schema_path),
+            "definitions_hash16": hash16(defs_path),
+            # Local screening depends on where it is centred; full-range screening does not.
+            "config_hash16": hash16(best_cfg_path) if screening_policy["radius_steps"] > 0 else None,
+            "params": [str(p["path"]) for p in pdefs],
+            "seeds": screen_seeds,
+            "years": [start_year, inner_end_year],
+            "design": {k: screening_policy[k] for k in ("trajectories", "levels", "radius_steps", "random_seed")},
+        }
+        prev_screen = load_json(screening_path) if screening_path.exists() else {}
+        if prev_screen.get("fingerprint") == screen_fp:
+            effects = prev_screen["effects"]
+            print(f"[screening] reusing {screening_path.name}", flush=True)
+        else:
+            design = morris_design(
+                pdefs,
+                best_cfg,
+                screening_policy["trajectories"],
+                screening_policy["levels"],
+                screening_policy["radius_steps"],
+                random.Random(screening_policy["random_seed"]),
+            )
+            points = [(t, j, pt) for t, traj in enumerate(design) for j, pt in enumerate(traj)]
+            print(f"[screening] Morris design: {len(design)} trajectories x {len(pdefs) + 1} points, seeds={screen_seeds}", flush=True)
+            point_jobs = max(1, min(len(screen_seeds), seed_jobs))
+
+            def screen_point(item: Tuple[int, int, Dict[str, Any]]) -> float:
+                t, j, pt = item
+                pt_cfg = copy.deepcopy(best_cfg)
+                for path, val in pt["values"].items():
+                    set_param(pt_cfg, path, val)
+                pt_dir = out_root / "screening" / f"traj_{t:02d}" / f"point_{j:03d}"
+                pt_cfg_path = pt_dir / "sim_config.toml"
+                dump_toml(pt_cfg, pt_cfg_path)
+                evals = run_seed_set(
+                    screen_seeds,
+                    exe_dir,
+                    pt_cfg_path,
+                    pt_dir / "runs",
+                    start_year,
+                    inner_end_year,
+                    checkpoint_every,
+                    bool(pt_cfg["economy"]["useGPU"]),
+                    defs,
+                    jobs=point_jobs,
+                    label=f"screen t{t:02d} p{j:03d}",
+                    run_cache=run_cache,
+                    eval_cache=eval_cache,
+                    launcher=launcher,
+                    job_timeout_sec=seed_timeout_sec,
+                    durations=run_durations,
+                    admission=mem_admission,
+                    resources=run_resources,
+                    trace=trace,
+                    runtime_env=runtime_env,
+                    write_eval_artifacts=write_eval_inner,
+                )
+                if prune_rejected:
+                    shutil.rmtree(pt_dir / "runs", ignore_errors=True)
+                return float(aggregate_objective(evals, defs)["objective"])
+
+            # Design points are independent, so several share the seed_jobs budget at once.
+            with ThreadPoolExecutor(max_workers=max(1, seed_jobs // point_jobs)) as screen_pool:
+                point_objs = list(screen_pool.map(screen_point, points))
+            objectives: List[List[float]] = [[] for _ in design]
+            for (t, _, _), obj in zip(points, point_objs):
+                objectives[t].append(obj)
+            effects = morris_effects(design, objectives)
+
+        top_mu_star = max([float(e["mu_star"]) for e in effects.values()] or [0.0])
+        floor = screening_policy["min_mu_star_fraction"] * top_mu_star
+        # Parameters the design could not move (degenerate range) rank last but stay in: their
+        # effect is unknown, so they neither take a keep_top slot nor get screened out.
+        ranked = sorted(
+            [str(p["path"]) for p in pdefs],
+            key=lambda path: -float(effects[path]["mu_star"]) if path in effects else math.inf,
+        )
+        kept = [path for path in ranked if path in effects and float(effects[path]["mu_star"]) >= floor]
+        if screening_policy["keep_top"] > 0:
+            kept = kept[: screening_policy["keep_top"]]
+        kept = (kept + [path for path in ranked if path not in effects]) or ranked[:1]
+        screening_record = {
+            "fingerprint": screen_fp,
+            "effects": effects,
+            "ranking": [
+                {"path": path, **effects.get(path, {"mu_star": None, "mu": None, "sigma": None, "n": 0.0}), "kept": path in kept}
+                for path in ranked
+            ],
+            "kept": kept,
+        }
+        write_json(screening_path, screening_record)
+        for row in screening_record["ranking"]:
+            mu_star = "n/a" if row["mu_star"] is None else f"{float(row['mu_star']):.6f}"
+            print(f"[screening] {row['path']} mu*={mu_star} kept={row['kept']}", flush=True)
+        print(f"[screening] keeping {len(kept)}/{len(pdefs)} parameters", flush=True)
+        if args.screen_only:
+            trace.phase(None)
+            trace.save()
+            return 0
+        kept_set = set(kept)
+        pdefs = [p for p in pdefs if str(p["path"]) in kept_set]
+
+    trace.phase("baseline")
     use_cached = False
     if (not args.force_rebaseline) and baseline_obj_path.exists() and baseline_gate_path.exists():
         bo_probe = load_json(baseline_obj_path)
@@ -1389,9 +2694,9 @@ def main() -> int:
         parity_ok = bool(bg.get("parity_pass", False))
         canary_det = list(bg.get("canary", []))
         parity_det = list(bg.get("parity", []))
-        baseline_inner_tune_loaded = load_seed_set_from_existing(tuning_seeds, baseline_dir / "inner" / "tuning", defs)
-        baseline_long_tune_loaded = load_seed_set_from_existing(tuning_seeds, baseline_dir / "long" / "tuning", defs)
-        baseline_long_holdout_loaded = load_seed_set_from_existing(holdout_seeds, baseline_dir / "long" / "holdout", defs)
+        baseline_inner_tune_loaded = load_seed_set_from_existing(tuning_seeds, baseline_dir / "inner" / "tuning", defs, eval_cache)
+        baseline_long_tune_loaded = load_seed_set_from_existing(tuning_seeds, baseline_dir / "long" / "tuning", defs, eval_cache)
+        baseline_long_holdout_loaded = load_seed_set_from_existing(holdout_seeds, baseline_dir / "long" / "holdout", defs, eval_cache)
         if (
             baseline_inner_tune_loaded is None
             or baseline_long_tune_loaded is None
@@ -1418,6 +2723,13 @@ def main() -> int:
             jobs=seed_jobs,
             label="baseline:inner:tuning",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )
@@ -1436,6 +2748,13 @@ def main() -> int:
             jobs=seed_jobs,
             label="baseline:inner:holdout",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )
@@ -1460,6 +2779,13 @@ def main() -> int:
                 jobs=seed_jobs,
                 label="baseline:medium:tuning",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
                 runtime_env=runtime_env,
                 write_eval_artifacts=True,
             )
@@ -1478,6 +2804,13 @@ def main() -> int:
                 jobs=seed_jobs,
                 label="baseline:medium:holdout",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
                 runtime_env=runtime_env,
                 write_eval_artifacts=True,
             )
@@ -1505,6 +2838,13 @@ def main() -> int:
             jobs=seed_jobs,
             label="baseline:long:tuning",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )
@@ -1523,6 +2863,13 @@ def main() -> int:
             jobs=seed_jobs,
             label="baseline:long:holdout",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )
@@ -1562,6 +2909,13 @@ def main() -> int:
             defs,
             label="baseline:canary:a",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )[0]
@@ -1577,6 +2931,13 @@ def main() -> int:
             defs,
             label="baseline:canary:b",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )[0]
@@ -1596,6 +2957,13 @@ def main() -> int:
             defs,
             label="baseline:parity:gpu",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )[0]
@@ -1611,6 +2979,13 @@ def main() -> int:
             defs,
             label="baseline:parity:cpu",
             run_cache=run_cache,
+            eval_cache=eval_cache,
+            launcher=launcher,
+            job_timeout_sec=seed_timeout_sec,
+            durations=run_durations,
+            admission=mem_admission,
+            resources=run_resources,
+            trace=trace,
             runtime_env=runtime_env,
             write_eval_artifacts=True,
         )[0]
@@ -1648,6 +3023,16 @@ def main() -> int:
         flush=True,
     )
 
+    if candidate_memo is not None:
+        # The incumbent config reappears whenever a lane steps back onto it.
+        base_content = config_content_key(config_path)
+        base_gpu = bool(cfg0["economy"]["useGPU"])
+        candidate_memo.put(CandidateMemo.run_key(base_content, start_year, inner_end_year, checkpoint_every, base_gpu), baseline_inner_tune)
+        candidate_memo.put(
+            CandidateMemo.run_key(base_content, start_year, long_end_year, checkpoint_every, base_gpu),
+            list(baseline_long_tune) + list(baseline_long_holdout),
+        )
+
     # Iterative loop.
     best_inner_seed_evals = list(baseline_inner_tune)
     best_long_seed_evals = list(baseline_long_tune)
@@ -1662,10 +3047,114 @@ def main() -> int:
     min_delta = float(defs["thresholds"]["min_delta"])
     holdout_delta_req = float(defs["thresholds"]["holdout_objective_min_delta"])
 
-    for it in range(1, args.max_iterations + 1):
+    # Crash-safe resume: loop-carried state is checkpointed atomically at the start of each
+    # iteration (phase markers are updated as it progresses). A resumed run replays the
+    # interrupted iteration from that state; with the same RNG state it proposes the same
+    # candidates, so finished seed runs are picked up from their seed dirs / run cache.
+    loop_state_path = out_root / "loop_state.json"
+    loop_fingerprint = {
+        "schema_hash16": hash16(schema_path),
+        "definitions_hash16": hash16(defs_path),
+        "tuning_seeds": list(tuning_seeds),
+        "holdout_seeds": list(holdout_seeds),
+        "years": [start_year, inner_end_year, medium_end_year if medium_enabled else None, long_end_year],
+        # Parameters that survived screening: saved stats and the CMA covariance are sized to them.
+        "params": [str(p["path"]) for p in pdefs],
+    }
+    cma: Optional[OnePlusOneCMA] = None
+    if cmaes_policy["enabled"]:
+        cma = OnePlusOneCMA(pdefs, cmaes_policy["initial_sigma_steps"], cmaes_policy["min_sigma_steps"], cmaes_policy["max_sigma_steps"])
+    start_it = 1
+    if args.resume:
+        saved = load_loop_state(loop_state_path, loop_fingerprint)
+        start_it = int(saved["iteration"])
+        best_cfg = saved["best_cfg"]
+        dump_toml(best_cfg, best_cfg_path)
+        best_inner_obj = float(saved["best_inner_obj"])
+        best_medium_obj = float(saved["best_medium_obj"])
+        best_medium_holdout_obj = float(saved["best_medium_holdout_obj"])
+        best_obj = float(saved["best_obj"])
+        best_holdout_obj = float(saved["best_holdout_obj"])
+        best_eval = saved["best_eval"]
+        best_top3 = list(saved["best_top3"])
+        best_inner_seed_evals = [SeedEval(**e) for e in saved["best_inner_seed_evals"]]
+        best_long_seed_evals = [SeedEval(**e) for e in saved["best_long_seed_evals"]]
+        best_holdout_seed_evals = [SeedEval(**e) for e in saved["best_holdout_seed_evals"]]
+        best_inner_by_seed = eval_map_by_seed(best_inner_seed_evals)
+        best_long_by_seed = eval_map_by_seed(best_long_seed_evals)
+        best_holdout_by_seed = eval_map_by_seed(best_holdout_seed_evals)
+        param_stats = saved["param_stats"]
+        total_param_attempts = int(saved["total_param_attempts"])
+        prev_top3_inner = list(saved["prev_top3_inner"])
+        proposal_top3 = list(saved["proposal_top3"])
+        accepted_iters = int(saved["accepted_iters"])
+        accepted_since_improve = int(saved["accepted_since_improve"])
+        consecutive_gate_fail = int(saved["consecutive_gate_fail"])
+        plateau_same_top3 = int(saved["plateau_same_top3"])
+        rng.setstate(rng_state_from_json(saved["rng_state"]))
+        if cma is not None and saved.get("cmaes"):
+            cma.load_state(saved["cmaes"])
+        if candidate_memo is not None:
+            candidate_memo.load(loop_fingerprint)
+        print(f"[startup] resuming at iteration {start_it} (last phase={saved.get('phase')})", flush=True)
+
+    loop_state: Dict[str, Any] = {}
+
+    def checkpoint_loop(it: int, phase: str, fresh: bool = False) -> None:
+        if fresh:
+            loop_state.clear()
+            loop_state.update(
+                {
+                    "version": LOOP_STATE_VERSION,
+                    "fingerprint": loop_fingerprint,
+                    "iteration": it,
+                    "best_cfg": best_cfg,
+                    "best_inner_obj": best_inner_obj,
+                    "best_medium_obj": best_medium_obj,
+                    "best_medium_holdout_obj": best_medium_holdout_obj,
+                    "best_obj": best_obj,
+                    "best_holdout_obj": best_holdout_obj,
+                    "best_eval": best_eval,
+                    "best_top3": best_top3,
+                    "best_inner_seed_evals": [asdict(e) for e in best_inner_seed_evals],
+                    "best_long_seed_evals": [asdict(e) for e in best_long_seed_evals],
+                    "best_holdout_seed_evals": [asdict(e) for e in best_holdout_seed_evals],
+                    "param_stats": param_stats,
+                    "total_param_attempts": total_param_attempts,
+                    "prev_top3_inner": prev_top3_inner,
+                    "proposal_top3": proposal_top3,
+                    "accepted_iters": accepted_iters,
+                    "accepted_since_improve": accepted_since_improve,
+                    "consecutive_gate_fail": consecutive_gate_fail,
+                    "plateau_same_top3": plateau_same_top3,
+                    "rng_state": rng_state_to_json(rng.getstate()),
+                    "cmaes": cma.state() if cma is not None else None,
+                }
+            )
+        loop_state["phase"] = phase
+        write_json(loop_state_path, loop_state)
+        if candidate_memo is not None:
+            candidate_memo.save(loop_fingerprint)
+        trace.phase("finalize" if phase.startswith("stopped:") else f"iter {it:03d}:{phase}")
+        trace.save()
+
+    surrogate_seeds = tuning_seeds[: min(stage_counts[0], len(tuning_seeds))]
+    surrogate: Optional[StepSurrogate] = None
+    # Rows already fed to the surrogate; the incumbent and memoized candidates recur across iterations.
+    surrogate_seen: Set[Tuple[Any, ...]] = set()
+    if surrogate_policy["enabled"]:
+        surrogate = StepSurrogate(pdefs, surrogate_policy["noise_sd"], surrogate_policy["prior_step_effect_sd"])
+        for row in load_surrogate_rows(it_root, surrogate_seeds, inner_end_year, before_iteration=start_it):
+            surrogate_seen.add(surrogate_row_key(row))
+            surrogate.add(row["params"], safe_mean([float(v) for v in row["seed_scores"].values()]))
+        print(f"[startup] surrogate history rows={len(surrogate.rows_y)}", flush=True)
+
+    next_it = start_it
+    for it in range(start_it, args.max_iterations + 1):
         if stop_flag is not None and stop_flag.exists():
             stop_reason = "MANUAL_STOP"
             break
+        checkpoint_loop(it, "proposal", fresh=True)
         it_dir = it_root / f"iter_{it:03d}"
         it_dir.mkdir(parents=True, exist_ok=True)
         top3_before = list(proposal_top3)
@@ -1681,20 +3170,84 @@ def main() -> int:
             ucb_explore_coeff,
         )
         lane_candidates.append(cand_exploit)
-        if two_lane and len(pdefs) > 1:
-            cand_explore = propose_explore_candidate(
-                best_cfg,
-                pdefs,
-                proposal_top3,
-                it,
-                rng,
-                avoid_path=str(cand_exploit["path"]),
+        while len(lane_candidates) < min(batch_candidates, len(pdefs)):
+            n_explore = len(lane_candidates)
+            lane_candidates.append(
+                propose_explore_candidate(
+                    best_cfg,
+                    pdefs,
+                    proposal_top3,
+                    it,
+                    rng,
+                    avoid_paths=[str(c["path"]) for c in lane_candidates],
+                    lane="explore" if n_explore == 1 else f"explore{n_explore}",
+                )
             )
-            lane_candidates.append(cand_explore)
+
+        surrogate_screen: List[Dict[str, Any]] = []
+        if surrogate is not None and len(surrogate.rows_y) >= surrogate_policy["min_history"]:
+            inc_params = surrogate_params(best_cfg, pdefs)
+            tried_paths = [str(c["path"]) for c in lane_candidates]
+            used_lanes = {str(c["lane"]) for c in lane_candidates}
+            pending = list(lane_candidates)
+            kept: List[Dict[str, Any]] = []
+            redraws = 0
+            while pending:
+                cand = pending.pop(0)
+                cand_params = dict(inc_params)
+                for e in cand["edits"]:
+                    cand_params[str(e["path"])] = float(e["new"])
+                mu, sd = surrogate.predict_delta(cand_params, inc_params)
+                optimistic = mu + surrogate_policy["kappa"] * sd
+                keep = optimistic >= surrogate_policy["min_predicted_delta"]
+                surrogate_screen.append(
+                    {
+                        "lane": cand["lane"],
+                        "path": cand["path"],
+                        "new": cand["new_val"],
+                        "predicted_delta": mu,
+                        "predicted_sd": sd,
+                        "optimistic_delta": optimistic,
+                        "kept": keep,
+                        "candidate": cand,
+                    }
+                )
+                if keep:
+                    kept.append(cand)
+                elif redraws < surrogate_policy["max_redraws"] and len(tried_paths) < len(pdefs):
+                    redraws += 1
+                    k = 1
+                    while ("explore" if k == 1 else f"explore{k}") in used_lanes:
+                        k += 1
+                    lane_name = "explore" if k == 1 else f"explore{k}"
+                    used_lanes.add(lane_name)
+                    redraw = propose_explore_candidate(
+                        best_cfg, pdefs, proposal_top3, it, rng, avoid_paths=tried_paths, lane=lane_name
+                    )
+                    tried_paths.append(str(redraw["path"]))
+                    pending.append(redraw)
+            if not kept:
+                # Everything looks unpromising: still race the most optimistic proposal so the model gets data.
+                best_row = max(surrogate_screen, key=lambda r: float(r["optimistic_delta"]))
+                best_row["kept"] = True
+                kept.append(best_row["candidate"])
+            lane_candidates = kept[: max(1, batch_candidates)]
+            for row in surrogate_screen:
+                row.pop("candidate")
+                print(
+                    f"[iter {it:03d}] surrogate lane={row['lane']} param={row['path']} new={row['new']} pred={row['predicted_delta']:.4f}+/-{row['predicted_sd']:.4f} kept={row['kept']}",
+                    flush=True,
+                )
+
+        # The joint lane is exempt from the surrogate screen and the batch cap: it is its own search.
+        cma_lane: Optional[Dict[str, Any]] = cma.ask(best_cfg, rng) if cma is not None else None
+        if cma_lane is not None:
+            lane_candidates.append(cma_lane)
 
         scout_n = min(stage_counts[0], len(tuning_seeds))
         scout_seeds = tuning_seeds[:scout_n]
         lane_scout_rows: List[Dict[str, Any]] = []
+        cma_record: Optional[Dict[str, Any]] = None
         selected_lane = lane_candidates[0]
         best_scout_delta = -1e18
         selected_cfg: Dict[str, Any] = {}
@@ -1702,11 +3255,19 @@ def main() -> int:
         selected_scout_by_seed: Dict[int, SeedEval] = {}
         selected_scout_evals: List[SeedEval] = []
 
-        for lane in lane_candidates:
+        # Lane scouts share the seed_jobs budget and run concurrently, so a batch of
+        # candidates fills the cores a single scout stage would leave idle.
+        lane_workers = min(len(lane_candidates), seed_jobs)
+        lane_jobs = [
+            seed_jobs // lane_workers + (1 if i < seed_jobs % lane_workers else 0) if len(lane_candidates) <= seed_jobs else 1
+            for i in range(len(lane_candidates))
+        ]
+
+        def scout_lane(lane: Dict[str, Any], jobs: int) -> Tuple[Dict[str, Any], Path, List[SeedEval]]:
             lane_name = str(lane["lane"])
-            path = str(lane["path"])
             lane_cfg = copy.deepcopy(best_cfg)
-            set_param(lane_cfg, path, lane["new_val"])
+            for e in lane["edits"]:
+                set_param(lane_cfg, str(e["path"]), e["new"])
             lane_cfg_path = it_dir / f"candidate_{lane_name}.toml"
             dump_toml(lane_cfg, lane_cfg_path)
             lane_scout = run_seed_set(
@@ -1719,12 +3280,60 @@ def main() -> int:
                 checkpoint_every,
                 bool(lane_cfg["economy"]["useGPU"]),
                 defs,
-                jobs=seed_jobs,
+                jobs=jobs,
                 label=f"iter {it:03d}:{lane_name}:scout",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
+                memo=candidate_memo,
                 runtime_env=runtime_env,
                 write_eval_artifacts=write_eval_inner,
             )
+            return lane_cfg, lane_cfg_path, lane_scout
+
+        if len(lane_candidates) == 1:
+            lane_results = [scout_lane(lane_candidates[0], seed_jobs)]
+        else:
+            with ThreadPoolExecutor(max_workers=lane_workers) as lane_pool:
+                lane_results = list(lane_pool.map(scout_lane, lane_candidates, lane_jobs))
+
+        surrogate_rows: List[Dict[str, Any]] = []
+        if all(s in best_inner_by_seed for s in scout_seeds):
+            surrogate_rows.append(
+                {
+                    "role": "incumbent",
+                    "params": surrogate_params(best_cfg, pdefs),
+                    "seeds": scout_seeds,
+                    "end_year": inner_end_year,
+                    "seed_scores": {str(s): best_inner_by_seed[s].total_score_seed for s in scout_seeds},
+                }
+            )
+        for lane, (lane_cfg, lane_cfg_path, lane_scout) in zip(lane_candidates, lane_results):
+            surrogate_rows.append(
+                {
+                    "role": str(lane["lane"]),
+                    "params": surrogate_params(lane_cfg, pdefs),
+                    "seeds": scout_seeds,
+                    "end_year": inner_end_year,
+                    "seed_scores": {str(e.seed): e.total_score_seed for e in lane_scout},
+                }
+            )
+        if surrogate is not None:
+            for row in surrogate_rows:
+                key = surrogate_row_key(row)
+                if key in surrogate_seen:
+                    continue
+                surrogate_seen.add(key)
+                surrogate.add(row["params"], safe_mean(list(row["seed_scores"].values())))
+
+        for lane, (lane_cfg, lane_cfg_path, lane_scout) in zip(lane_candidates, lane_results):
+            lane_name = str(lane["lane"])
+            path = str(lane["path"])
             lane_scout_agg = aggregate_objective(lane_scout, defs)
             inc_scout = [best_inner_by_seed[s] for s in scout_seeds if s in best_inner_by_seed]
             inc_scout_agg = aggregate_objective(inc_scout, defs) if inc_scout else {"objective": best_inner_obj}
@@ -1741,6 +3350,7 @@ def main() -> int:
                     "path": path,
                     "old": lane["old_val"],
                     "new": lane["new_val"],
+                    "edits": lane["edits"],
                     "scout_objective": lane_scout_agg["objective"],
                     "scout_delta_vs_incumbent": scout_delta,
                     "scout_paired": scout_pair,
@@ -1750,6 +3360,15 @@ def main() -> int:
                 f"[iter {it:03d}] lane={lane_name} scout group={lane['group']} param={path} old={lane['old_val']} new={lane['new_val']} delta={scout_delta:.6f}",
                 flush=True,
             )
+            if lane is cma_lane:
+                cma_record = {
+                    "sigma_steps_before": cma.sigma,
+                    "scout_delta": scout_delta,
+                    "success": scout_delta >= min_delta,
+                    "n_edits": len(lane["edits"]),
+                }
+                cma.tell(lane["cma_y"], scout_delta >= min_delta)
+                cma_record.update({"sigma_steps_after": cma.sigma, "p_succ": cma.p_succ})
             if scout_delta > best_scout_delta:
                 best_scout_delta = scout_delta
                 selected_lane = lane
@@ -1772,14 +3391,53 @@ def main() -> int:
             flush=True,
         )
 
+        checkpoint_loop(it, "racing")
         cand_inner_by_seed = dict(selected_scout_by_seed)
         stage_records: List[Dict[str, Any]] = []
         early_reject = False
         early_reject_reason = ""
-        for stage_n in stage_counts:
+        stage_plan = list(stage_counts)
+        memo_decision: Optional[Dict[str, Any]] = None
+        if candidate_memo is not None:
+            cand_content = config_content_key(selected_cfg_path)
+            inc_content = config_content_key(best_cfg_path)
+            memo_decision = candidate_memo.decision(cand_content, inc_content)
+            if memo_decision is not None:
+                memo_inner_key = CandidateMemo.run_key(
+                    cand_content, start_year, inner_end_year, checkpoint_every, bool(selected_cfg["economy"]["useGPU"])
+                )
+                memo_evals = candidate_memo.lookup(memo_inner_key, [int(s) for s in memo_decision["seeds"]])
+                if len(memo_evals) == len(memo_decision["seeds"]):
+                    # Same candidate raced against the same incumbent: replay the outcome instead of re-racing.
+                    cand_inner_by_seed.update(memo_evals)
+                    stage_records = memo_decision["stages"]
+                    early_reject = bool(memo_decision["early_reject"])
+                    early_reject_reason = str(memo_decision["early_reject_reason"])
+                    stage_plan = []
+                    print(
+                        f"[iter {it:03d}] candidate memo: replaying racing decision from iteration {memo_decision['iteration']} (early_reject={early_reject})",
+                        flush=True,
+                    )
+                else:
+                    memo_decision = None
+        for stage_n in stage_plan:
             stage_seed_subset = tuning_seeds[:stage_n]
             need = [s for s in stage_seed_subset if s not in cand_inner_by_seed]
+            race: Optional[StreamingRace] = None
             if need:
+                if racing_enabled and streaming_racing["enabled"]:
+                    race = StreamingRace(
+                        defs,
+                        best_inner_by_seed,
+                        stage_seed_subset,
+                        min_delta - early_reject_margin,
+                        streaming_racing["min_checkpoint_fraction"],
+                        streaming_racing["min_seeds"],
+                    )
+                    # Seeds already evaluated (e.g. lane scouts) count toward the stage estimate.
+                    for s in stage_seed_subset:
+                        if s in cand_inner_by_seed:
+                            race.record(s, cand_inner_by_seed[s].checkpoint_scores)
                 stage_eval = run_seed_set(
                     need,
                     exe_dir,
@@ -1793,8 +3451,18 @@ def main() -> int:
                     jobs=seed_jobs,
                     label=f"iter {it:03d}:inner:stage{stage_n}",
                     run_cache=run_cache,
+                    eval_cache=eval_cache,
+                    launcher=launcher,
+                    job_timeout_sec=seed_timeout_sec,
+                    durations=run_durations,
+                    admission=mem_admission,
+                    resources=run_resources,
+                    trace=trace,
+                    memo=candidate_memo,
                     runtime_env=runtime_env,
                     write_eval_artifacts=write_eval_inner,
+                    race=race,
+                    race_poll_sec=streaming_racing["poll_sec"],
                 )
                 for s in stage_eval:
                     cand_inner_by_seed[int(s.seed)] = s
@@ -1816,8 +3484,19 @@ def main() -> int:
                     "incumbent_objective": inc_stage_agg["objective"],
                     "objective_delta": stage_delta,
                     "paired": stage_pair,
+                    "streaming": race.summary() if race is not None else None,
                 }
             )
+            # Unlike the stage-boundary checks below, this also applies to the last stage:
+            # a candidate killed there would have failed improve_ok by at least the margin.
+            if race is not None and race.cancel_event.is_set():
+                early_reject = True
+                early_reject_reason = "STREAMING_PARTIAL_OBJECTIVE"
+                print(
+                    f"[iter {it:03d}] early reject at stage={stage_n} reason={early_reject_reason} partial_delta={race.estimate:.6f}",
+                    flush=True,
+                )
+                break
             if racing_enabled and stage_n < len(tuning_seeds):
                 reject_obj = stage_delta < (min_delta - early_reject_margin)
                 reject_pair = paired_enabled and (stage_pair.get("n", 0) >= 2) and (float(stage_pair.get("lcb", 0.0)) < (paired_min_inner_lcb_delta - early_reject_margin))
@@ -1831,6 +3510,18 @@ def main() -> int:
                     break
 
         evaluated_inner_seeds = [s for s in tuning_seeds if s in cand_inner_by_seed]
+        if candidate_memo is not None and memo_decision is None:
+            candidate_memo.record_decision(
+                cand_content,
+                inc_content,
+                {
+                    "iteration": it,
+                    "seeds": evaluated_inner_seeds,
+                    "stages": stage_records,
+                    "early_reject": early_reject,
+                    "early_reject_reason": early_reject_reason,
+                },
+            )
         cand_inner = [cand_inner_by_seed[s] for s in evaluated_inner_seeds]
         cand_inner_agg = aggregate_objective(cand_inner, defs)
         cand_inner_top3 = top3_violations(cand_inner)
@@ -1855,6 +3546,7 @@ def main() -> int:
         improve_ok = (inner_delta >= min_delta) and ((not paired_enabled) or (float(inner_pair.get("lcb", -1e18)) >= paired_min_inner_lcb_delta))
         checks_executed = no_hardfail_tuning and improve_ok and (not early_reject)
         if checks_executed:
+            checkpoint_loop(it, "gates")
             print(f"[iter {it:03d}] running canary/parity checks", flush=True)
             cand_canary_a = run_seed_set(
                 [tuning_seeds[0]],
@@ -1868,6 +3560,13 @@ def main() -> int:
                 defs,
                 label=f"iter {it:03d}:canary:a",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
                 runtime_env=runtime_env,
                 write_eval_artifacts=write_eval_inner,
             )[0]
@@ -1883,6 +3582,13 @@ def main() -> int:
                 defs,
                 label=f"iter {it:03d}:canary:b",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
                 runtime_env=runtime_env,
                 write_eval_artifacts=write_eval_inner,
             )[0]
@@ -1899,6 +3605,13 @@ def main() -> int:
                 defs,
                 label=f"iter {it:03d}:parity:gpu",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
                 runtime_env=runtime_env,
                 write_eval_artifacts=write_eval_inner,
             )[0]
@@ -1914,6 +3627,13 @@ def main() -> int:
                 defs,
                 label=f"iter {it:03d}:parity:cpu",
                 run_cache=run_cache,
+                eval_cache=eval_cache,
+                launcher=launcher,
+                job_timeout_sec=seed_timeout_sec,
+                durations=run_durations,
+                admission=mem_admission,
+                resources=run_resources,
+                trace=trace,
                 runtime_env=runtime_env,
                 write_eval_artifacts=write_eval_inner,
             )[0]
@@ -1925,6 +3645,7 @@ def main() -> int:
                 flush=True,
             )
 
+        checkpoint_loop(it, "promotion")
         medium_required = medium_enabled and (
             (medium_check_every_iterations > 0 and (it % medium_check_every_iterations == 0))
             or (medium_check_every_accepted > 0 and ((accepted_iters + 1) % medium_check_every_accepted == 0))
@@ -1964,6 +3685,14 @@ def main() -> int:
                     jobs=seed_jobs,
                     label=f"iter {it:03d}:medium:tuning",
                     run_cache=run_cache,
+                    eval_cache=eval_cache,
+                    launcher=launcher,
+                    job_timeout_sec=seed_timeout_sec,
+                    durations=run_durations,
+                    admission=mem_admission,
+                    resources=run_resources,
+                    trace=trace,
+                    memo=candidate_memo,
                     runtime_env=runtime_env,
                     write_eval_artifacts=write_eval_inner,
                 )
@@ -1983,6 +3712,14 @@ def main() -> int:
                     jobs=seed_jobs,
                     label=f"iter {it:03d}:medium:holdout",
                     run_cache=run_cache,
+                    eval_cache=eval_cache,
+                    launcher=launcher,
+                    job_timeout_sec=seed_timeout_sec,
+                    durations=run_durations,
+                    admission=mem_admission,
+                    resources=run_resources,
+                    trace=trace,
+                    memo=candidate_memo,
                     runtime_env=runtime_env,
                     write_eval_artifacts=write_eval_holdout,
                 )
@@ -2013,6 +3750,14 @@ def main() -> int:
                     jobs=seed_jobs,
                     label=f"iter {it:03d}:long:tuning",
                     run_cache=run_cache,
+                    eval_cache=eval_cache,
+                    launcher=launcher,
+                    job_timeout_sec=seed_timeout_sec,
+                    durations=run_durations,
+                    admission=mem_admission,
+                    resources=run_resources,
+                    trace=trace,
+                    memo=candidate_memo,
                     runtime_env=runtime_env,
                     write_eval_artifacts=write_eval_holdout,
                 )
@@ -2041,6 +3786,14 @@ def main() -> int:
                         jobs=seed_jobs,
                         label=f"iter {it:03d}:long:holdout",
                         run_cache=run_cache,
+                        eval_cache=eval_cache,
+                        launcher=launcher,
+                        job_timeout_sec=seed_timeout_sec,
+                        durations=run_durations,
+                        admission=mem_admission,
+                        resources=run_resources,
+                        trace=trace,
+                        memo=candidate_memo,
                         runtime_env=runtime_env,
                         write_eval_artifacts=write_eval_holdout,
                     )
@@ -2083,15 +3836,17 @@ def main() -> int:
             and holdout_ok
         )
 
-        st = param_stats[path]
-        st["attempts"] = int(st["attempts"]) + 1
-        st["sum_inner_delta"] = float(st["sum_inner_delta"]) + float(inner_delta)
-        st["sum_long_delta"] = float(st["sum_long_delta"]) + float(objective_delta if long_ran else 0.0)
-        st["last_direction"] = direction
-        dir_key = "+1" if direction > 0 else "-1"
-        st["dir_gain"][dir_key] = float(st["dir_gain"].get(dir_key, 0.0)) + float(inner_delta)
-        if accepted:
-            st["accepts"] = int(st["accepts"]) + 1
+        # Per-parameter UCB stats only describe single-parameter moves; the joint lane adapts itself.
+        if pdef is not None:
+            st = param_stats[path]
+            st["attempts"] = int(st["attempts"]) + 1
+            st["sum_inner_delta"] = float(st["sum_inner_delta"]) + float(inner_delta)
+            st["sum_long_delta"] = float(st["sum_long_delta"]) + float(objective_delta if long_ran else 0.0)
+            st["last_direction"] = direction
+            dir_key = "+1" if direction > 0 else "-1"
+            st["dir_gain"][dir_key] = float(st["dir_gain"].get(dir_key, 0.0)) + float(inner_delta)
+            if accepted:
+                st["accepts"] = int(st["accepts"]) + 1
         total_param_attempts += 1
 
         if accepted:
@@ -2148,15 +3903,9 @@ def main() -> int:
             "subsystem_group": group,
             "selected_lane": selected_lane["lane"],
             "lane_scout": lane_scout_rows,
-            "parameter_edits": [
-                {
-                    "path": path,
-                    "old": old_val,
-                    "new": new_val,
-                    "recommended_step": pdef["recommended_step"],
-                    "direction": direction,
-                }
-            ],
+            "surrogate": {"screen": surrogate_screen, "rows": surrogate_rows},
+            "cmaes": cma_record,
+            "parameter_edits": selected_lane["edits"],
             "top_violations_before": top3_before,
             "top_violations_after": cand_inner_top3,
             "top_violations_after_long": cand_top3 if long_ran else None,
@@ -2172,6 +3921,7 @@ def main() -> int:
                 "stages": stage_records,
                 "early_reject": early_reject,
                 "early_reject_reason": early_reject_reason,
+                "memo_replay_of_iteration": memo_decision["iteration"] if memo_decision is not None else None,
             },
             "paired_stats": {
                 "inner": inner_pair,
@@ -2226,6 +3976,7 @@ def main() -> int:
                 except Exception:
                     pass
 
+        next_it = it + 1
         if stop_flag is not None and stop_flag.exists():
             stop_reason = "MANUAL_STOP"
             break
@@ -2253,6 +4004,8 @@ def main() -> int:
             stop_reason = "SAFETY"
             break
 
+    checkpoint_loop(next_it, f"stopped:{stop_reason or 'MAX_ITERATIONS'}", fresh=True)
+
     # Write final outputs.
     final = {
         "stop_condition": stop_reason if stop_reason else "MAX_ITERATIONS",
@@ -2276,7 +4029,12 @@ def main() -> int:
         },
         "optimization_accelerators": {
             "common_random_numbers": {"enabled": crn_enabled},
-            "adaptive_racing": {"enabled": racing_enabled, "stage_seed_counts": stage_counts, "early_reject_margin": early_reject_margin},
+            "adaptive_racing": {
+                "enabled": racing_enabled,
+                "stage_seed_counts": stage_counts,
+                "early_reject_margin": early_reject_margin,
+                "streaming": streaming_racing,
+            },
             "paired_acceptance": {
                 "enabled": paired_enabled,
                 "confidence_z": paired_z,
@@ -2284,19 +4042,26 @@ def main() -> int:
                 "min_long_lcb_delta": paired_min_long_lcb_delta,
                 "min_holdout_lcb_delta": paired_min_holdout_lcb_delta,
             },
-            "run_cache": run_cache,
+            "run_cache": {**run_cache, "store": get_run_store(run_cache).summary() if run_cache_enabled else None},
+            "eval_cache": eval_cache,
+            "candidate_memo": {"enabled": candidate_memo_enabled, **(candidate_memo.summary() if candidate_memo is not None else {})},
             "io": {
                 "write_eval_artifacts_for_inner": write_eval_inner,
                 "write_eval_artifacts_for_holdout": write_eval_holdout,
                 "prune_rejected_iterations": prune_rejected,
                 "keep_candidate_if_rejected": keep_candidate_if_rejected,
             },
-            "search": {"two_lane_enabled": two_lane, "ucb_explore_coeff": ucb_explore_coeff, "random_seed": search_random_seed},
-            "runtime_hygiene": {"seed_jobs": seed_jobs, "cpu_count": cpu_count, "reserve_cpu_cores": reserve_cpu_cores, "runtime_env": runtime_env},
+            "search": {"two_lane_enabled": two_lane, "batch_candidates": batch_candidates, "surrogate": surrogate_policy, "cmaes": {**cmaes_policy, "final_state": cma.state() if cma is not None else None}, "screening": {**screening_policy, "kept": screening_record["kept"] if screening_record is not None else None}, "ucb_explore_coeff": ucb_explore_coeff, "random_seed": search_random_seed},
+            "runtime_hygiene": {"seed_jobs": seed_jobs, "cpu_count": cpu_count, "reserve_cpu_cores": reserve_cpu_cores, "runtime_env": runtime_env, "launcher": launcher, "seed_timeout_sec": seed_timeout_sec, "memory_admission": mem_admission.summary(), "trace_timeline": trace_timeline},
         },
         "iterations_completed": len(list(it_root.glob("iter_*"))),
+        "resource_usage": run_resources.rollup(),
     }
     write_json(out_root / "final_report.json", final)
+    tuning_policy["resource_usage"] = final["resource_usage"]
+    write_json(out_root / "tuning_policy.json", tuning_policy)
+    trace.phase(None)
+    trace.save()
 
     # Also update the live config to best-so-far so subsequent runs use best known settings.
     if not bool(args.no_write_live_config):
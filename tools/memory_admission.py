@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Memory-aware admission control for concurrent worldsim_cli children.
+
+Shared by `fine_tune_realism.py` and the seed sweepers. Worker counts still cap
+concurrency; on top of that a new child is only started while the projected
+resident memory of all running children plus the newcomer fits the budget.
+
+- Child RSS is sampled from `/proc/<pid>/status` (VmRSS) by one background
+  thread; a child's peak is recorded per horizon (start|end|backend) when it
+  exits and persisted, so later stages and sweeps start with a learned peak.
+- A running child counts at max(its peak so far, the learned horizon peak); a
+  newcomer counts at the learned peak (or the largest running peak of the same
+  horizon while nothing is learned yet).
+- One child is always admitted when nothing is running, so a budget below a
+  single run's peak degrades to serial execution instead of deadlocking.
+
+Without `/proc` (Windows, or a Windows .exe launched through the WSL cmd.exe
+hop, whose process is not visible to Linux) sampling finds nothing and only the
+worker count applies.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+MEMORY_MODEL_VERSION = 1
+PROC_ROOT = Path("/proc")
+
+
+def read_rss_bytes(pid: int) -> Optional[int]:
+    try:
+        with (PROC_ROOT / str(int(pid)) / "status").open("r", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def mem_available_bytes() -> Optional[int]:
+    try:
+        with (PROC_ROOT / "meminfo").open("r", encoding="ascii", errors="replace") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def resolve_budget_bytes(budget_gb: float, auto_fraction: float = 0.8) -> int:
+    """`budget_gb` > 0 is explicit, 0 means `auto_fraction` of MemAvailable now, < 0 disables admission."""
+    if budget_gb < 0:
+        return 0
+    if budget_gb > 0:
+        return int(budget_gb * (1024 ** 3))
+    avail = mem_available_bytes()
+    return int(avail * auto_fraction) if avail else 0
+
+
+def horizon_key(start_year: int, end_year: int, backend: str) -> str:
+    return f"{int(start_year)}|{int(end_year)}|{backend}"
+
+
+class MemoryAdmission:
+    def __init__(self, budget_bytes: int, model_path: Optional[Path] = None, sample_sec: float = 0.5) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self.model_path = model_path
+        self.sample_sec = max(0.05, float(sample_sec))
+        self.enabled = self.budget_bytes > 0 and PROC_ROOT.joinpath("self", "status").exists()
+        self.cond = threading.Condition()
+        self.peaks: Dict[str, int] = {}
+        self.active: Dict[int, Dict[str, Any]] = {}
+        self.next_token = 1
+        self.stats = {"admitted": 0, "delayed": 0, "max_projected_bytes": 0}
+        self.sampler: Optional[threading.Thread] = None
+        if model_path is not None:
+            try:
+                data = json.loads(model_path.read_text(encoding="utf-8"))
+                if int(data.get("version", 0)) == MEMORY_MODEL_VERSION:
+                    self.peaks = {k: int(v) for k, v in data.get("peaks", {}).items()}
+            except Exception:
+                self.peaks = {}
+
+    def _expected(self, horizon: str) -> int:
+        learned = self.peaks.get(horizon)
+        if learned is not None:
+            return learned
+        running = [int(a["peak"]) for a in self.active.values() if a["horizon"] == horizon]
+        return max(running) if running else 0
+
+    def _projected(self, horizon: str) -> int:
+        total = sum(max(int(a["peak"]), self._expected(a["horizon"])) for a in self.active.values())
+        return total + self._expected(horizon)
+
+    def _try_admit(self, horizon: str) -> Optional[int]:
+        projected = self._projected(horizon)
+        if self.active and self.enabled and projected > self.budget_bytes:
+            return None
+        token = self.next_token
+        self.next_token += 1
+        self.active[token] = {"horizon": horizon, "pid": None, "peak": 0}
+        self.stats["admitted"] += 1
+        self.stats["max_projected_bytes"] = max(int(self.stats["max_projected_bytes"]), projected)
+        return token
+
+    def admit(self, horizon: str, cancel_event: Optional[threading.Event] = None) -> Optional[int]:
+        """Block until a child of `horizon` fits; returns a token, or None if `cancel_event` fired first."""
+        delayed = False
+        with self.cond:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                token = self._try_admit(horizon)
+                if token is not None:
+                    return token
+                if not delayed:
+                    delayed = True
+                    self.stats["delayed"] += 1
+                self.cond.wait(timeout=self.sample_sec)
+
+    async def admit_async(self, horizon: str) -> int:
+        delayed = False
+        while True:
+            with self.cond:
+                token = self._try_admit(horizon)
+                if token is not None:
+                    return token
+                if not delayed:
+                    delayed = True
+                    self.stats["delayed"] += 1
+            await asyncio.sleep(self.sample_sec)
+
+    def attach(self, token: int, pid: int) -> None:
+        with self.cond:
+            if token in self.active:
+                self.active[token]["pid"] = int(pid)
+            if self.enabled and self.sampler is None:
+                self.sampler = threading.Thread(target=self._sample_loop, name="rss-sampler", daemon=True)
+                self.sampler.start()
+
+    def release(self, token: Optional[int], record: bool = True) -> None:
+        """Drop a finished child; with `record`, its observed peak updates the horizon model."""
+        if token is None:
+            return
+        with self.cond:
+            entry = self.active.pop(token, None)
+            if entry is not None and record and int(entry["peak"]) > 0:
+                horizon = str(entry["horizon"])
+                self.peaks[horizon] = max(int(self.peaks.get(horizon, 0)), int(entry["peak"]))
+            self.cond.notify_all()
+
+    def _sample_loop(self) -> None:
+        while True:
+            time.sleep(self.sample_sec)
+            with self.cond:
+                pids = [(t, a["pid"]) for t, a in self.active.items() if a["pid"] is not None]
+            samples = [(t, read_rss_bytes(pid)) for t, pid in pids]
+            with self.cond:
+                for t, rss in samples:
+                    if rss is not None and t in self.active:
+                        self.active[t]["peak"] = max(int(self.active[t]["peak"]), rss)
+                self.cond.notify_all()
+
+    def save(self) -> None:
+        if self.model_path is None:
+            return
+        with self.cond:
+            payload = json.dumps({"version": MEMORY_MODEL_VERSION, "peaks": self.peaks}, indent=2)
+        try:
+            self.model_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.model_path.with_name(f"{self.model_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.model_path)
+        except OSError:
+            pass
+
+    def summary(self) -> Dict[str, Any]:
+        with self.cond:
+            return {
+                "enabled": self.enabled,
+                "budget_bytes": self.budget_bytes,
+                "horizon_peak_bytes": dict(self.peaks),
+                **dict(self.stats),
+            }
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""Persisted wall-time estimates for worldsim_cli runs, used to order seed dispatch.
+
+Shared by `fine_tune_realism.py` and the seed sweepers. Each finished simulator
+run records its elapsed seconds under (seed, start_year, end_year, backend);
+schedulers then dispatch seeds longest-expected first so one slow seed started
+last does not set the makespan of a stage or sweep. Seeds without history are
+estimated from the mean of known runs on the same horizon and backend (or, if
+none, the per-year rate of other horizons on that backend) and keep their input
+order among equals.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+DURATIONS_VERSION = 1
+# Weight of the newest sample in the per-run moving average.
+EWMA_ALPHA = 0.5
+
+
+def backend_name(use_gpu: Optional[bool]) -> str:
+    if use_gpu is None:
+        return "default"
+    return "gpu" if use_gpu else "cpu"
+
+
+class DurationModel:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        self.runs: Dict[str, Dict[str, float]] = {}
+        self.dirty = False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if int(data.get("version", 0)) == DURATIONS_VERSION:
+                self.runs = {k: dict(v) for k, v in data.get("runs", {}).items()}
+        except Exception:
+            self.runs = {}
+
+    @staticmethod
+    def key(seed: int, start_year: int, end_year: int, backend: str) -> str:
+        return f"{int(seed)}|{int(start_year)}|{int(end_year)}|{backend}"
+
+    def record(self, seed: int, start_year: int, end_year: int, backend: str, elapsed_sec: float) -> None:
+        if elapsed_sec <= 0.0:
+            return
+        k = self.key(seed, start_year, end_year, backend)
+        with self.lock:
+            prev = self.runs.get(k)
+            if prev is None:
+                self.runs[k] = {"sec": float(elapsed_sec), "n": 1}
+            else:
+                prev["sec"] = (1.0 - EWMA_ALPHA) * float(prev["sec"]) + EWMA_ALPHA * float(elapsed_sec)
+                prev["n"] = int(prev.get("n", 1)) + 1
+            self.dirty = True
+
+    def expected(self, seeds: Iterable[int], start_year: int, end_year: int, backend: str) -> Dict[int, float]:
+        seed_list = [int(s) for s in seeds]
+        years = max(1, int(end_year) - int(start_year))
+        with self.lock:
+            known: Dict[int, float] = {}
+            for s in seed_list:
+                hit = self.runs.get(self.key(s, start_year, end_year, backend))
+                if hit is not None:
+                    known[s] = float(hit["sec"])
+            same_horizon: List[float] = []
+            per_year: List[float] = []
+            for k, v in self.runs.items():
+                _, s0, s1, b = k.split("|")
+                if b != backend:
+                    continue
+                if int(s0) == int(start_year) and int(s1) == int(end_year):
+                    same_horizon.append(float(v["sec"]))
+                per_year.append(float(v["sec"]) / max(1, int(s1) - int(s0)))
+        if same_horizon:
+            fallback = sum(same_horizon) / len(same_horizon)
+        elif per_year:
+            fallback = years * sum(per_year) / len(per_year)
+        else:
+            fallback = 0.0
+        return {s: known.get(s, fallback) for s in seed_list}
+
+    def order(self, seeds: Iterable[int], start_year: int, end_year: int, backend: str) -> List[int]:
+        """Seeds sorted longest-expected first; ties keep input order."""
+        seed_list = [int(s) for s in seeds]
+        est = self.expected(seed_list, start_year, end_year, backend)
+        return sorted(seed_list, key=lambda s: -est[s])
+
+    def save(self) -> None:
+        with self.lock:
+            if not self.dirty:
+                return
+            payload = json.dumps({"version": DURATIONS_VERSION, "runs": self.runs}, indent=2)
+            self.dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
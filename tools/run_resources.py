@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""Per-run resource accounting for worldsim_cli children.
+
+Shared by `fine_tune_realism.py` and the seed sweepers. Children are reaped with
+`os.wait4`, which returns the child's own rusage, so every launched run reports
+wall time, user/sys CPU seconds and peak RSS without sampling. The numbers are
+written as `run_resources.json` next to `run_meta.json` and rolled up per
+horizon (start|end|backend) and per config hash in tool summaries.
+
+Where `os.wait4` is unavailable (Windows) only wall time is reported.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+RUN_RESOURCES_FILE = "run_resources.json"
+
+
+def _exit_code(status: int) -> int:
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _usage(started: float, rc: int, ru: Any) -> Dict[str, Any]:
+    out: Dict[str, Any] = {"wall_sec": time.monotonic() - started, "returncode": rc}
+    if ru is not None:
+        # ru_maxrss is KiB on Linux and bytes on macOS.
+        rss = int(ru.ru_maxrss) if sys.platform == "darwin" else int(ru.ru_maxrss) * 1024
+        out.update({"user_cpu_sec": float(ru.ru_utime), "sys_cpu_sec": float(ru.ru_stime), "peak_rss_bytes": rss})
+    return out
+
+
+def _reaped(proc: subprocess.Popen, started: float, result: Tuple[int, int, Any]) -> Dict[str, Any]:
+    rc = _exit_code(result[1])
+    # Keep Popen consistent so it neither reaps again nor warns about a running child.
+    proc.returncode = rc
+    return _usage(started, rc, result[2])
+
+
+def wait_child(proc: subprocess.Popen, started: float) -> Dict[str, Any]:
+    """Block until `proc` exits and return its usage (`returncode` included)."""
+    if not hasattr(os, "wait4"):
+        return _usage(started, proc.wait(), None)
+    try:
+        return _reaped(proc, started, os.wait4(proc.pid, 0))
+    except ChildProcessError:
+        return _usage(started, proc.returncode if proc.returncode is not None else -1, None)
+
+
+def poll_child(proc: subprocess.Popen, started: float) -> Optional[Dict[str, Any]]:
+    """Non-blocking `wait_child`: None while `proc` is still running."""
+    if not hasattr(os, "wait4"):
+        rc = proc.poll()
+        return None if rc is None else _usage(started, rc, None)
+    try:
+        result = os.wait4(proc.pid, os.WNOHANG)
+    except ChildProcessError:
+        return _usage(started, proc.returncode if proc.returncode is not None else -1, None)
+    if result[0] == 0:
+        return None
+    return _reaped(proc, started, result)
+
+
+def kill_child(proc: subprocess.Popen) -> None:
+    """SIGKILL without `Popen.poll()`, which could reap the child under a concurrent `wait_child`."""
+    if not hasattr(os, "wait4"):
+        proc.kill()
+        return
+    try:
+        os.kill(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+def write_run_resources(run_dir: Path, usage: Dict[str, Any]) -> None:
+    try:
+        (run_dir / RUN_RESOURCES_FILE).write_text(json.dumps(usage, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def read_run_resources(run_dir: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return json.loads((run_dir / RUN_RESOURCES_FILE).read_text(encoding="utf-8"))
+    except Exception:
+        return None
+
+
+class UsageRollup:
+    """`rollup_usage` fed one usage at a time, for sweeps that summarize as results arrive."""
+
+    def __init__(self) -> None:
+        self.runs = 0
+        self.failed_runs = 0
+        self.wall_total = 0.0
+        self.wall_max = 0.0
+        self.user_cpu = 0.0
+        self.sys_cpu = 0.0
+        self.rss_n = 0
+        self.rss_total = 0
+        self.rss_max: Optional[int] = None
+
+    def add(self, usage: Optional[Dict[str, Any]]) -> None:
+        if not usage:
+            return
+        wall = float(usage.get("wall_sec", 0.0))
+        self.runs += 1
+        self.failed_runs += 1 if int(usage.get("returncode", 0)) != 0 else 0
+        self.wall_total += wall
+        self.wall_max = max(self.wall_max, wall)
+        if "user_cpu_sec" in usage:
+            rss = int(usage["peak_rss_bytes"])
+            self.user_cpu += float(usage["user_cpu_sec"])
+            self.sys_cpu += float(usage["sys_cpu_sec"])
+            self.rss_n += 1
+            self.rss_total += rss
+            self.rss_max = rss if self.rss_max is None else max(self.rss_max, rss)
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "failed_runs": self.failed_runs,
+            "wall_sec_total": self.wall_total,
+            "wall_sec_mean": (self.wall_total / self.runs) if self.runs else 0.0,
+            "wall_sec_max": self.wall_max,
+            "user_cpu_sec_total": self.user_cpu,
+            "sys_cpu_sec_total": self.sys_cpu,
+            "peak_rss_bytes_max": self.rss_max,
+            "peak_rss_bytes_mean": (self.rss_total / self.rss_n) if self.rss_n else None,
+        }
+
+
+def rollup_usage(usages: Iterable[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    rollup = UsageRollup()
+    for usage in usages:
+        rollup.add(usage)
+    return rollup.result()
+
+
+class ResourceLedger:
+    """Thread-safe collector of child usages keyed by config hash and horizon."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.rows: list[Tuple[str, str, Dict[str, Any]]] = []
+
+    def record(self, config: str, horizon: str, usage: Dict[str, Any]) -> None:
+        with self.lock:
+            self.rows.append((config, horizon, dict(usage)))
+
+    def rollup(self) -> Dict[str, Any]:
+        with self.lock:
+            rows = list(self.rows)
+        by_horizon: Dict[str, list] = {}
+        by_config: Dict[str, list] = {}
+        for config, horizon, usage in rows:
+            by_horizon.setdefault(horizon, []).append(usage)
+            by_config.setdefault(config, []).append(usage)
+        return {
+            "total": rollup_usage(u for _, _, u in rows),
+            "by_horizon": {k: rollup_usage(v) for k, v in sorted(by_horizon.items())},
+            "by_config": {k: rollup_usage(v) for k, v in sorted(by_config.items())},
+        }
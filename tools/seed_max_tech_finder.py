@@ -26,6 +26,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Iterable, Optional
 
+from memory_admission import MemoryAdmission, horizon_key, resolve_budget_bytes
+from run_durations import DurationModel, backend_name
+from run_resources import UsageRollup, poll_child, read_run_resources, write_run_resources
+from sweep_journal import ResultsJournal
+from tech_log_tail import TechLogFollower
+
 
 @dataclass(frozen=True)
 class SweepConfig:
@@ -40,6 +46,10 @@ class SweepConfig:
     use_gpu: Optional[bool]
     reuse_existing: bool
     include_initial_log_rows: bool = True
+    # Memory budget for concurrent runs in GiB (0 = 80% of MemAvailable, <0 = worker count only).
+    mem_budget_gb: float = 0.0
+    # Seconds between full rewrites of the results CSV/summary; every seed is journaled as it finishes.
+    write_every_sec: float = 30.0
 
 
 ProgressCallback = Callable[[str], None]
@@ -213,20 +223,28 @@ def read_latest_year_from_tech_log(tech_log_path: Path, bytes_from_end: int = 81
     return None
 
 
-def scan_max_tech(tech_log_path: Path) -> dict:
-    if not tech_log_path.exists():
-        return {"ok": False, "reason": "tech log missing"}
+def latest_year(rows: list[dict[str, str]]) -> Optional[int]:
+    for row in reversed(rows):
+        try:
+            return int(row.get("year", ""))
+        except ValueError:
+            continue
+    return None
 
-    max_total = -1
-    max_total_row: Optional[dict] = None
-    max_tech_id = -1
-    max_tech_row: Optional[dict] = None
-    row_count = 0
 
-    with tech_log_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            row_count += 1
+class MaxTechTracker:
+    """Running maxima over tech-log rows, fed incrementally while the log grows."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.max_total = -1
+        self.max_total_row: Optional[dict] = None
+        self.max_tech_id = -1
+        self.max_tech_row: Optional[dict] = None
+
+    def feed(self, rows: Iterable[dict[str, str]]) -> None:
+        for row in rows:
+            self.rows += 1
             try:
                 year = int(row.get("year", ""))
                 tech_id = int(row.get("tech_id", ""))
@@ -234,9 +252,9 @@ def scan_max_tech(tech_log_path: Path) -> dict:
             except ValueError:
                 continue
 
-            if total > max_total:
-                max_total = total
-                max_total_row = {
+            if total > self.max_total:
+                self.max_total = total
+                self.max_total_row = {
                     "year": year,
                     "tech_id": tech_id,
                     "tech_name": row.get("tech_name", ""),
@@ -246,9 +264,9 @@ def scan_max_tech(tech_log_path: Path) -> dict:
                     "event_type": row.get("event_type", ""),
                 }
 
-            if tech_id > max_tech_id:
-                max_tech_id = tech_id
-                max_tech_row = {
+            if tech_id > self.max_tech_id:
+                self.max_tech_id = tech_id
+                self.max_tech_row = {
                     "year": year,
                     "tech_id": tech_id,
                     "tech_name": row.get("tech_name", ""),
@@ -259,19 +277,31 @@ def scan_max_tech(tech_log_path: Path) -> dict:
                     "total_unlocked_techs": total,
                 }
 
-    if row_count == 0:
-        return {"ok": False, "reason": "tech log empty"}
-    if max_total_row is None or max_tech_row is None:
-        return {"ok": False, "reason": "tech log parse had no valid rows"}
+    def result(self) -> dict:
+        if self.rows == 0:
+            return {"ok": False, "reason": "tech log empty"}
+        if self.max_total_row is None or self.max_tech_row is None:
+            return {"ok": False, "reason": "tech log parse had no valid rows"}
+
+        return {
+            "ok": True,
+            "reason": "",
+            "rows": self.rows,
+            "max_total_unlocked_techs": self.max_total,
+            "max_total_row": self.max_total_row,
+            "max_tech_row": self.max_tech_row,
+        }
 
-    return {
-        "ok": True,
-        "reason": "",
-        "rows": row_count,
-        "max_total_unlocked_techs": max_total,
-        "max_total_row": max_total_row,
-        "max_tech_row": max_tech_row,
-    }
+
+def scan_max_tech(tech_log_path: Path) -> dict:
+    """Full pass over a finished log; live runs get the same result from their follower's tracker."""
+    if not tech_log_path.exists():
+        return {"ok": False, "reason": "tech log missing"}
+
+    tracker = MaxTechTracker()
+    with tech_log_path.open("r", encoding="utf-8", newline="") as f:
+        tracker.feed(csv.DictReader(f))
+    return tracker.result()
 
 
 def run_one_seed(
@@ -279,6 +309,8 @@ def run_one_seed(
     cfg: SweepConfig,
     cancel_event: Optional[threading.Event] = None,
     seed_event_cb: Optional[SeedEventCallback] = None,
+    admission: Optional[MemoryAdmission] = None,
+    follower: Optional[TechLogFollower] = None,
 ) -> dict:
     seed_dir = cfg.out_root / f"seed_{seed}"
     tech_log = seed_dir / "tech_unlocks.csv"
@@ -298,6 +330,8 @@ def run_one_seed(
     started = time.time()
     reused = False
     rc = 0
+    usage: Optional[dict] = None
+    tracker: Optional[MaxTechTracker] = None
     emit_event(state="starting", current_year=None, elapsed_sec=0.0, note="")
 
     if cancel_event is not None and cancel_event.is_set():
@@ -315,6 +349,7 @@ def run_one_seed(
 
     if cfg.reuse_existing and can_reuse_existing_run(seed, cfg, seed_dir, tech_log):
         reused = True
+        usage = read_run_resources(seed_dir)
         current_year = read_latest_year_from_tech_log(tech_log)
         emit_event(
             state="reused",
@@ -323,19 +358,67 @@ def run_one_seed(
             note="reused existing run",
         )
     else:
+        token = None
+        if admission is not None:
+            token = admission.admit(horizon_key(cfg.start_year, cfg.end_year, backend_name(cfg.use_gpu)), cancel_event)
+            if token is None:
+                emit_event(state="canceled", current_year=None, elapsed_sec=(time.time() - started), note="canceled before start")
+                return {
+                    "seed": seed,
+                    "ok": False,
+                    "returncode": -2,
+                    "elapsed_sec": time.time() - started,
+                    "run_dir": str(seed_dir),
+                    "reused": False,
+                    "reason": "canceled",
+                    "canceled": True,
+                }
+        # Queueing for memory admission is not run time; elapsed_sec feeds the duration model.
+        started = time.time()
         cmd = build_cli_cmd(seed, cfg, seed_dir, tech_log)
+        # The follower must not report a stale log from an earlier run before the child rewrites it.
+        try:
+            tech_log.unlink()
+        except FileNotFoundError:
+            pass
+        own_follower = follower is None
+        if follower is None:
+            follower = TechLogFollower().start()
+        last_year: Optional[int] = None
+        tracker = MaxTechTracker()
+
+        def on_rows(rows: list[dict[str, str]]) -> None:
+            nonlocal last_year
+            tracker.feed(rows)
+            year = latest_year(rows)
+            if year is not None and year != last_year:
+                last_year = year
+                emit_event(state="running", current_year=year, elapsed_sec=(time.time() - started), note="")
+
+        follower.watch(seed, tech_log, on_rows)
         with run_log.open("w", encoding="utf-8") as logf:
             logf.write("COMMAND:\n")
             logf.write(" ".join(cmd) + "\n\n")
-            proc = subprocess.Popen(cmd, stdout=logf, stderr=subprocess.STDOUT, cwd=str(cfg.repo_root))
-            last_year: Optional[int] = None
-            last_probe = 0.0
+            spawned = time.monotonic()
+            try:
+                proc = subprocess.Popen(cmd, stdout=logf, stderr=subprocess.STDOUT, cwd=str(cfg.repo_root))
+            except Exception:
+                if admission is not None:
+                    admission.release(token, record=False)
+                follower.unwatch(seed)
+                if own_follower:
+                    follower.close()
+                raise
+            if admission is not None:
+                admission.attach(token, proc.pid)
             canceled = False
 
             while True:
-                polled = proc.poll()
+                polled = poll_child(proc, spawned)
                 if polled is not None:
-                    rc = polled
+                    usage = polled
+                    rc = int(polled["returncode"])
+                    write_run_resources(seed_dir, usage)
                     break
 
                 if cancel_event is not None and cancel_event.is_set():
@@ -354,26 +437,20 @@ def run_one_seed(
                         rc = -2
                     break
 
-                now = time.monotonic()
-                if now - last_probe >= 0.35:
-                    year = read_latest_year_from_tech_log(tech_log)
-                    last_probe = now
-                    if year is not None and year != last_year:
-                        last_year = year
-                        emit_event(
-                            state="running",
-                            current_year=year,
-                            elapsed_sec=(time.time() - started),
-                            note="",
-                        )
-
                 time.sleep(0.10)
 
+            # Delivers the rows written since the follower's last read.
+            follower.unwatch(seed)
+            if own_follower:
+                follower.close()
+            if admission is not None:
+                admission.release(token, record=(not canceled and rc == 0))
+
             if canceled:
                 elapsed = time.time() - started
                 emit_event(
                     state="canceled",
-                    current_year=read_latest_year_from_tech_log(tech_log),
+                    current_year=last_year,
                     elapsed_sec=elapsed,
                     note="canceled by user",
                 )
@@ -403,11 +480,16 @@ def run_one_seed(
             "elapsed_sec": elapsed,
             "run_dir": str(seed_dir),
             "reused": reused,
+            "resources": usage,
             "reason": "cli run failed",
             "canceled": False,
         }
 
-    scan = scan_max_tech(tech_log)
+    if tracker is not None:
+        # The follower already saw every row; a missing log never produced any.
+        scan = tracker.result() if tech_log.exists() else {"ok": False, "reason": "tech log missing"}
+    else:
+        scan = scan_max_tech(tech_log)
     if not scan["ok"]:
         emit_event(
             state="failed",
@@ -422,6 +504,7 @@ def run_one_seed(
             "elapsed_sec": elapsed,
             "run_dir": str(seed_dir),
             "reused": reused,
+            "resources": usage,
             "reason": scan["reason"],
             "canceled": False,
         }
@@ -441,6 +524,7 @@ def run_one_seed(
         "elapsed_sec": elapsed,
         "run_dir": str(seed_dir),
         "reused": reused,
+        "resources": usage,
         "reason": "",
         "canceled": False,
         "rows": scan["rows"],
@@ -450,62 +534,73 @@ def run_one_seed(
     }
 
 
-def build_summary(
-    cfg: SweepConfig,
-    results: list[dict],
-    elapsed_sec: float,
-    *,
-    total_requested: Optional[int] = None,
-    stopped_early: bool = False,
-) -> dict:
-    ok_runs = [r for r in results if r.get("ok")]
-    canceled_runs = [r for r in results if r.get("canceled")]
-    fail_runs = [r for r in results if (not r.get("ok")) and (not r.get("canceled"))]
-
-    best_total = None
-    for r in ok_runs:
-        cur = int(r["max_total_unlocked_techs"])
-        if best_total is None or cur > int(best_total["max_total_unlocked_techs"]):
-            best_total = r
-
-    best_tech_id = None
-    for r in ok_runs:
-        row = r.get("max_tech_row") or {}
-        tid = int(row.get("tech_id", -1))
-        if best_tech_id is None or tid > int((best_tech_id.get("max_tech_row") or {}).get("tech_id", -1)):
-            best_tech_id = r
-
-    total = len(results) if total_requested is None else total_requested
-    return {
-        "elapsed_sec": elapsed_sec,
-        "total_seeds": total,
-        "completed_seeds": len(results),
-        "ok_runs": len(ok_runs),
-        "failed_runs": len(fail_runs),
-        "canceled_runs": len(canceled_runs),
-        "stopped_early": stopped_early,
-        "run_settings": {
-            "start_year": cfg.start_year,
-            "end_year": cfg.end_year,
-            "checkpoint_every_years": cfg.checkpoint_every_years,
-            "use_gpu": cfg.use_gpu,
-        },
-        "best_by_unlocked_count": None
-        if best_total is None
-        else {
-            "seed": best_total["seed"],
-            "max_total_unlocked_techs": best_total["max_total_unlocked_techs"],
-            "detail": best_total.get("max_total_row"),
-            "run_dir": best_total["run_dir"],
-        },
-        "best_by_tech_id": None
-        if best_tech_id is None
-        else {
-            "seed": best_tech_id["seed"],
-            "detail": best_tech_id.get("max_tech_row"),
-            "run_dir": best_tech_id["run_dir"],
-        },
-    }
+class SweepTally:
+    """Summary statistics of a sweep, updated one result at a time."""
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.ok = 0
+        self.canceled = 0
+        self.best_total: Optional[dict] = None
+        self.best_tech_id: Optional[dict] = None
+        self.usage = UsageRollup()
+
+    def add(self, r: dict) -> None:
+        self.completed += 1
+        self.canceled += 1 if r.get("canceled") else 0
+        if not r.get("reused"):
+            self.usage.add(r.get("resources"))
+        if not r.get("ok"):
+            return
+        self.ok += 1
+        # Ties go to the lower seed, as in a scan of the seed-sorted results.
+        seed = int(r.get("seed", 0))
+        key = (int(r["max_total_unlocked_techs"]), -seed)
+        if self.best_total is None or key > (int(self.best_total["max_total_unlocked_techs"]), -int(self.best_total["seed"])):
+            self.best_total = r
+        tid = int((r.get("max_tech_row") or {}).get("tech_id", -1))
+        if self.best_tech_id is None or (tid, -seed) > (
+            int((self.best_tech_id.get("max_tech_row") or {}).get("tech_id", -1)),
+            -int(self.best_tech_id["seed"]),
+        ):
+            self.best_tech_id = r
+
+    def summary(self, cfg: SweepConfig, elapsed_sec: float, *, total_requested: int, stopped_early: bool = False) -> dict:
+        best_total = self.best_total
+        best_tech_id = self.best_tech_id
+        return {
+            "elapsed_sec": elapsed_sec,
+            "total_seeds": total_requested,
+            "completed_seeds": self.completed,
+            "ok_runs": self.ok,
+            "failed_runs": self.completed - self.ok - self.canceled,
+            "canceled_runs": self.canceled,
+            "stopped_early": stopped_early,
+            # Cost of the children launched by this sweep; reused runs keep their own run_resources.json.
+            "resource_usage": self.usage.result(),
+            "run_settings": {
+                "start_year": cfg.start_year,
+                "end_year": cfg.end_year,
+                "checkpoint_every_years": cfg.checkpoint_every_years,
+                "use_gpu": cfg.use_gpu,
+                "mem_budget_gb": cfg.mem_budget_gb,
+            },
+            "best_by_unlocked_count": None
+            if best_total is None
+            else {
+                "seed": best_total["seed"],
+                "max_total_unlocked_techs": best_total["max_total_unlocked_techs"],
+                "detail": best_total.get("max_total_row"),
+                "run_dir": best_total["run_dir"],
+            },
+            "best_by_tech_id": None
+            if best_tech_id is None
+            else {
+                "seed": best_tech_id["seed"],
+                "detail": best_tech_id.get("max_tech_row"),
+                "run_dir": best_tech_id["run_dir"],
+            },
+        }
 
 
 def write_results(out_root: Path, results: list[dict], summary: dict) -> None:
@@ -598,10 +693,19 @@ def run_sweep(
     started = time.time()
     results: list[dict] = []
     done = 0
+    tally = SweepTally()
+    journal = ResultsJournal(cfg.out_root / "seed_max_tech_results.jsonl", cfg.write_every_sec)
+    # One thread tails every running seed's tech log and publishes its year progress.
+    follower = TechLogFollower().start()
+    durations = DurationModel(cfg.out_root / "run_durations.json")
+    backend = backend_name(cfg.use_gpu)
+    dispatch = durations.order(seed_list, cfg.start_year, cfg.end_year, backend)
+    admission = MemoryAdmission(resolve_budget_bytes(cfg.mem_budget_gb), cfg.out_root / "run_memory.json")
 
     emit(
         f"Running {total} seeds with workers={cfg.workers}, "
         f"years=[{cfg.start_year},{cfg.end_year}], use_gpu={cfg.use_gpu}"
+        + (f", mem_budget={admission.budget_bytes / 1024 ** 3:.1f}GiB" if admission.enabled else "")
     )
 
     def make_exception_result(seed: int, exc: Exception) -> dict:
@@ -620,6 +724,10 @@ def run_sweep(
         nonlocal done
         done += 1
         results.append(result)
+        journal.append(result)
+        tally.add(result)
+        if result.get("ok") and not result.get("reused"):
+            durations.record(seed, cfg.start_year, cfg.end_year, backend, float(result.get("elapsed_sec") or 0.0))
 
         if result.get("ok"):
             emit(
@@ -646,19 +754,19 @@ def run_sweep(
             }
         )
 
-        partial_results = sorted(results, key=lambda r: int(r.get("seed", 0)))
-        partial = build_summary(
-            cfg,
-            partial_results,
-            time.time() - started,
-            total_requested=total,
-            stopped_early=(cancel_event.is_set() if cancel_event is not None else False),
-        )
-        write_results(cfg.out_root, partial_results, partial)
+        if journal.compaction_due():
+            partial = tally.summary(
+                cfg,
+                time.time() - started,
+                total_requested=total,
+                stopped_early=(cancel_event.is_set() if cancel_event is not None else False),
+            )
+            write_results(cfg.out_root, sorted(results, key=lambda r: int(r.get("seed", 0))), partial)
+            journal.compacted()
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=cfg.workers) as ex:
         in_flight: dict[concurrent.futures.Future, int] = {}
-        seed_iter = iter(seed_list)
+        seed_iter = iter(dispatch)
 
         def submit_next() -> bool:
             if cancel_event is not None and cancel_event.is_set():
@@ -668,7 +776,7 @@ def run_sweep(
             except StopIteration:
                 return False
             emit_seed({"seed": seed, "state": "queued", "current_year": None, "note": ""})
-            fut = ex.submit(run_one_seed, seed, cfg, cancel_event, seed_event_cb)
+            fut = ex.submit(run_one_seed, seed, cfg, cancel_event, seed_event_cb, admission, follower)
             in_flight[fut] = seed
             return True
 
@@ -694,17 +802,20 @@ def run_sweep(
                 if cancel_event is None or not cancel_event.is_set():
                     submit_next()
 
+    follower.close()
+    durations.save()
+    admission.save()
     results.sort(key=lambda x: int(x.get("seed", 0)))
     elapsed = time.time() - started
     stopped_early = (cancel_event.is_set() and len(results) < total) if cancel_event is not None else False
-    summary = build_summary(
+    summary = tally.summary(
         cfg,
-        results,
         elapsed,
         total_requested=total,
         stopped_early=stopped_early,
     )
     write_results(cfg.out_root, results, summary)
+    journal.close()
 
     emit(
         f"Done in {elapsed:.2f}s. completed={summary['completed_seeds']}/{summary['total_seeds']}, "
@@ -732,6 +843,18 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--end-year", type=int, default=2025)
     p.add_argument("--checkpoint-every-years", type=int, default=50)
     p.add_argument("--workers", type=int, default=default_workers())
+    p.add_argument(
+        "--mem-budget-gb",
+        type=float,
+        default=0.0,
+        help="Start a seed only while projected peak RSS of running seeds fits this budget (0 = 80%% of available, <0 = off)",
+    )
+    p.add_argument(
+        "--write-every-sec",
+        type=float,
+        default=30.0,
+        help="Rewrite the results CSV/summary at most this often (seeds are journaled to JSONL as they finish)",
+    )
     p.add_argument("--use-gpu", choices=["0", "1"], default="0")
     p.add_argument("--no-reuse", action="store_true")
     p.add_argument(
@@ -777,6 +900,8 @@ def run_cli_mode(args: argparse.Namespace) -> int:
         use_gpu=use_gpu,
         reuse_existing=(not args.no_reuse),
         include_initial_log_rows=(not args.exclude_initial_log_rows),
+        mem_budget_gb=args.mem_budget_gb,
+        write_every_sec=max(0.0, args.write_every_sec),
     )
 
     if not cfg.exe.exists():
@@ -22,6 +22,14 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Callable, Iterable, Optional
 
+from memory_admission import MemoryAdmission, horizon_key, resolve_budget_bytes
+from run_durations import DurationModel, backend_name
+from run_resources import UsageRollup, kill_child, poll_child, read_run_resources, wait_child, write_run_resources
+from sweep_journal import ResultsJournal
+from tech_log_tail import TechLogTail
+
+HIT_MARKER = "seed_hit.json"
+
 
 @dataclass(frozen=True)
 class SearchConfig:
@@ -38,6 +46,14 @@ class SearchConfig:
     workers: int
     use_gpu: Optional[bool]
     reuse_existing: bool
+    # Memory budget for concurrent runs in GiB (0 = 80% of MemAvailable, <0 = worker count only).
+    mem_budget_gb: float = 0.0
+    # Watch the live tech log and kill the child as soon as the target unlocks.
+    kill_on_hit: bool = False
+    # Stop the whole search once this many seeds hit (0 = run every seed).
+    stop_after_hits: int = 0
+    # Seconds between full rewrites of the results CSV/summary; every seed is journaled as it finishes.
+    write_every_sec: float = 30.0
 
 
 def parse_seed_values(seed_start: Optional[int], seed_end: Optional[int], seeds_csv: Optional[str]) -> list[int]:
@@ -101,6 +117,34 @@ def matches_target(row: dict[str, str], target_tech_id: Optional[int], target_te
     return True
 
 
+def match_record(row: dict[str, str], year: int) -> dict:
+    return {
+        "year": year,
+        "event_type": row.get("event_type", ""),
+        "country_index": row.get("country_index", ""),
+        "country_name": row.get("country_name", ""),
+        "tech_id": row.get("tech_id", ""),
+        "tech_name": row.get("tech_name", ""),
+    }
+
+
+def first_hit(
+    rows: Iterable[dict[str, str]],
+    *,
+    target_year: int,
+    target_tech_id: Optional[int],
+    target_tech_name: Optional[str],
+) -> Optional[dict]:
+    for row in rows:
+        try:
+            year = int(row.get("year", ""))
+        except ValueError:
+            continue
+        if year <= target_year and matches_target(row, target_tech_id, target_tech_name):
+            return match_record(row, year)
+    return None
+
+
 def scan_tech_log(
     tech_log_path: Path,
     *,
@@ -127,14 +171,7 @@ def scan_tech_log(
                 continue
             if not matches_target(row, target_tech_id, target_tech_name):
                 continue
-            candidate = {
-                "year": year,
-                "event_type": row.get("event_type", ""),
-                "country_index": row.get("country_index", ""),
-                "country_name": row.get("country_name", ""),
-                "tech_id": row.get("tech_id", ""),
-                "tech_name": row.get("tech_name", ""),
-            }
+            candidate = match_record(row, year)
             if best is None or year < int(best["year"]):
                 best = candidate
 
@@ -145,8 +182,12 @@ def scan_tech_log(
     }
 
 
+def run_end_year(cfg: SearchConfig) -> int:
+    """The year a child actually runs to: nothing past the target year can produce a hit."""
+    return min(cfg.end_year, cfg.target_year)
+
+
 def build_cli_cmd(seed: int, cfg: SearchConfig, seed_out_dir: Path, tech_log_path: Path) -> list[str]:
-    effective_end_year = min(cfg.end_year, cfg.target_year)
     cmd = [
         str(cfg.exe),
         "--seed",
@@ -156,7 +197,7 @@ def build_cli_cmd(seed: int, cfg: SearchConfig, seed_out_dir: Path, tech_log_pat
         "--startYear",
         str(cfg.start_year),
         "--endYear",
-        str(effective_end_year),
+        str(run_end_year(cfg)),
         "--checkpointEveryYears",
         str(cfg.checkpoint_every_years),
         "--outDir",
@@ -181,10 +222,39 @@ def _load_json(path: Path) -> Optional[dict]:
         return None
 
 
+def hit_marker(seed: int, cfg: SearchConfig, match: dict) -> dict:
+    return {
+        "seed": seed,
+        "start_year": cfg.start_year,
+        "end_year": run_end_year(cfg),
+        "backend": backend_name(cfg.use_gpu),
+        "config_path": str(cfg.config),
+        "target_tech_id": cfg.target_tech_id,
+        "target_tech_name": cfg.target_tech_name,
+        "match": match,
+    }
+
+
+def _write_json(path: Path, data: dict) -> None:
+    try:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    except OSError:
+        pass
+
+
 def can_reuse_existing_run(seed: int, cfg: SearchConfig, seed_dir: Path, tech_log: Path) -> bool:
     if not tech_log.exists():
         return False
 
+    # A run killed on its first hit has no run_meta.json; its marker vouches for the partial log.
+    # A marker from another search means the log is partial for this one, whatever run_meta.json says.
+    marker = _load_json(seed_dir / HIT_MARKER)
+    if isinstance(marker, dict):
+        want = hit_marker(seed, cfg, marker.get("match"))
+        if not all(marker.get(k) == want[k] for k in ("seed", "start_year", "end_year", "backend", "target_tech_id", "target_tech_name")):
+            return False
+        return Path(str(marker.get("config_path", ""))).name == cfg.config.name
+
     meta_path = seed_dir / "run_meta.json"
     meta = _load_json(meta_path)
     if not isinstance(meta, dict):
@@ -197,8 +267,7 @@ def can_reuse_existing_run(seed: int, cfg: SearchConfig, seed_dir: Path, tech_lo
     except Exception:
         return False
 
-    expected_end_year = min(cfg.end_year, cfg.target_year)
-    if meta_seed != seed or meta_start != cfg.start_year or meta_end != expected_end_year:
+    if meta_seed != seed or meta_start != cfg.start_year or meta_end != run_end_year(cfg):
         return False
 
     if cfg.use_gpu is not None:
@@ -216,7 +285,12 @@ def can_reuse_existing_run(seed: int, cfg: SearchConfig, seed_dir: Path, tech_lo
     return True
 
 
-def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.Event] = None) -> dict:
+def run_one_seed(
+    seed: int,
+    cfg: SearchConfig,
+    cancel_event: Optional[threading.Event] = None,
+    admission: Optional[MemoryAdmission] = None,
+) -> dict:
     seed_dir = cfg.out_root / f"seed_{seed}"
     tech_log = seed_dir / "tech_unlocks.csv"
     run_log = seed_dir / "seed_run.log"
@@ -225,6 +299,9 @@ def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.
     started = time.time()
     reused = False
     rc = 0
+    usage: Optional[dict] = None
+    live_hit: Optional[dict] = None
+    match: Optional[dict] = None
 
     if cancel_event is not None and cancel_event.is_set():
         return {
@@ -238,22 +315,76 @@ def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.
             "reason": "canceled",
             "match": None,
             "canceled": True,
+            "not_run": True,
         }
 
     if cfg.reuse_existing and can_reuse_existing_run(seed, cfg, seed_dir, tech_log):
         reused = True
+        usage = read_run_resources(seed_dir)
     else:
+        token = None
+        if admission is not None:
+            token = admission.admit(horizon_key(cfg.start_year, run_end_year(cfg), backend_name(cfg.use_gpu)), cancel_event)
+            if token is None:
+                return {
+                    "seed": seed,
+                    "ok": False,
+                    "hit": False,
+                    "returncode": -2,
+                    "elapsed_sec": time.time() - started,
+                    "run_dir": str(seed_dir),
+                    "reused": False,
+                    "reason": "canceled",
+                    "match": None,
+                    "canceled": True,
+                    "not_run": True,
+                }
+        # Start the clock once admitted so duration history excludes memory queueing.
+        started = time.time()
         cmd = build_cli_cmd(seed, cfg, seed_dir, tech_log)
+        # Stale outputs from an earlier run must not be mistaken for this run's hit or vouch for a killed run.
+        for stale in (tech_log, seed_dir / HIT_MARKER, seed_dir / "run_meta.json"):
+            try:
+                stale.unlink()
+            except FileNotFoundError:
+                pass
+        tail = TechLogTail(tech_log) if cfg.kill_on_hit else None
+        next_tail = 0.0
         with run_log.open("w", encoding="utf-8") as logf:
             logf.write("COMMAND:\n")
             logf.write(" ".join(cmd) + "\n\n")
-            proc = subprocess.Popen(cmd, stdout=logf, stderr=subprocess.STDOUT, cwd=str(cfg.repo_root))
+            spawned = time.monotonic()
+            try:
+                proc = subprocess.Popen(cmd, stdout=logf, stderr=subprocess.STDOUT, cwd=str(cfg.repo_root))
+            except Exception:
+                if admission is not None:
+                    admission.release(token, record=False)
+                raise
+            if admission is not None:
+                admission.attach(token, proc.pid)
             canceled = False
             while True:
-                polled = proc.poll()
+                polled = poll_child(proc, spawned)
                 if polled is not None:
-                    rc = polled
+                    usage = polled
+                    rc = int(polled["returncode"])
+                    write_run_resources(seed_dir, usage)
                     break
+                if tail is not None and time.monotonic() >= next_tail:
+                    next_tail = time.monotonic() + 0.25
+                    live_hit = first_hit(
+                        tail.read_rows(),
+                        target_year=cfg.target_year,
+                        target_tech_id=cfg.target_tech_id,
+                        target_tech_name=cfg.target_tech_name,
+                    )
+                    if live_hit is not None:
+                        kill_child(proc)
+                        usage = wait_child(proc, spawned)
+                        rc = int(usage["returncode"])
+                        write_run_resources(seed_dir, usage)
+                        _write_json(seed_dir / HIT_MARKER, hit_marker(seed, cfg, live_hit))
+                        break
                 if cancel_event is not None and cancel_event.is_set():
                     canceled = True
                     try:
@@ -271,6 +402,19 @@ def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.
                     break
                 time.sleep(0.1)
 
+            if not canceled and live_hit is None and rc == 0:
+                match = scan_tech_log(
+                    tech_log,
+                    target_year=cfg.target_year,
+                    target_tech_id=cfg.target_tech_id,
+                    target_tech_name=cfg.target_tech_name,
+                )
+            if admission is not None:
+                # Only complete runs teach the peak: a child stopped on its hit (killed live, or by
+                # --stopOnTechId) ended early, so its peak says little about the horizon.
+                complete = match is not None and not (cfg.target_tech_id is not None and match["hit"])
+                admission.release(token, record=complete)
+
             if canceled:
                 elapsed = time.time() - started
                 return {
@@ -288,6 +432,22 @@ def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.
 
     elapsed = time.time() - started
 
+    if live_hit is not None:
+        return {
+            "seed": seed,
+            "ok": True,
+            "hit": True,
+            "returncode": rc,
+            "elapsed_sec": elapsed,
+            "run_dir": str(seed_dir),
+            "reused": False,
+            "resources": usage,
+            "reason": "killed on first hit",
+            "match": live_hit,
+            "canceled": False,
+            "killed_on_hit": True,
+        }
+
     if rc != 0:
         return {
             "seed": seed,
@@ -297,17 +457,19 @@ def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.
             "elapsed_sec": elapsed,
             "run_dir": str(seed_dir),
             "reused": reused,
+            "resources": usage,
             "reason": "cli run failed",
             "match": None,
             "canceled": False,
         }
 
-    match = scan_tech_log(
-        tech_log,
-        target_year=cfg.target_year,
-        target_tech_id=cfg.target_tech_id,
-        target_tech_name=cfg.target_tech_name,
-    )
+    if match is None:
+        match = scan_tech_log(
+            tech_log,
+            target_year=cfg.target_year,
+            target_tech_id=cfg.target_tech_id,
+            target_tech_name=cfg.target_tech_name,
+        )
 
     return {
         "seed": seed,
@@ -317,6 +479,7 @@ def run_one_seed(seed: int, cfg: SearchConfig, cancel_event: Optional[threading.
         "elapsed_sec": elapsed,
         "run_dir": str(seed_dir),
         "reused": reused,
+        "resources": usage,
         "reason": match["reason"],
         "match": match["match"],
         "canceled": False,
@@ -345,6 +508,7 @@ def write_results(out_root: Path, results: list[dict], summary: dict) -> None:
                 "run_dir",
                 "reason",
                 "canceled",
+                "killed_on_hit",
             ]
         )
         for r in results:
@@ -365,6 +529,7 @@ def write_results(out_root: Path, results: list[dict], summary: dict) -> None:
                     r.get("run_dir", ""),
                     r.get("reason", ""),
                     r.get("canceled", False),
+                    r.get("killed_on_hit", False),
                 ]
             )
 
@@ -372,44 +537,65 @@ def write_results(out_root: Path, results: list[dict], summary: dict) -> None:
         json.dump(summary, f, indent=2)
 
 
-def build_summary(cfg: SearchConfig, results: list[dict], total: int, elapsed_total: float, stopped_early: bool) -> dict:
-    completed = len(results)
-    hits = [r for r in results if r.get("hit")]
-    ok_count = sum(1 for r in results if r.get("ok"))
-    canceled_count = sum(1 for r in results if r.get("canceled"))
-    fail_count = completed - ok_count - canceled_count
-
-    earliest_hit = None
-    if hits:
-        earliest_hit = min(
-            (
-                {
-                    "seed": r["seed"],
-                    **(r.get("match") or {}),
-                }
-                for r in hits
-            ),
-            key=lambda m: int(m.get("year", 10**9)),
-        )
-
-    return {
-        "total_seeds": total,
-        "completed_seeds": completed,
-        "ok_runs": ok_count,
-        "failed_runs": fail_count,
-        "canceled_runs": canceled_count,
-        "hit_count": len(hits),
-        "hit_ratio": (len(hits) / total) if total else 0.0,
-        "hit_ratio_completed": (len(hits) / completed) if completed else 0.0,
-        "elapsed_sec": elapsed_total,
-        "stopped_early": stopped_early,
-        "target": {
-            "target_year": cfg.target_year,
-            "target_tech_id": cfg.target_tech_id,
-            "target_tech_name": cfg.target_tech_name,
-        },
-        "earliest_hit": earliest_hit,
-    }
+class SearchTally:
+    """Summary statistics of a search, updated one result at a time."""
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self.ok = 0
+        self.canceled = 0
+        self.killed_on_hit = 0
+        self.hits = 0
+        self.earliest_hit: Optional[dict] = None
+        self.usage = UsageRollup()
+
+    def add(self, r: dict) -> None:
+        self.completed += 1
+        self.ok += 1 if r.get("ok") else 0
+        self.canceled += 1 if r.get("canceled") else 0
+        self.killed_on_hit += 1 if r.get("killed_on_hit") else 0
+        if not r.get("reused"):
+            self.usage.add(r.get("resources"))
+        if r.get("hit"):
+            self.hits += 1
+            cand = {"seed": r["seed"], **(r.get("match") or {})}
+            # Ties go to the lower seed, as in a scan of the seed-sorted results.
+            key = (int(cand.get("year", 10**9)), int(cand["seed"]))
+            if self.earliest_hit is None or key < (int(self.earliest_hit.get("year", 10**9)), int(self.earliest_hit["seed"])):
+                self.earliest_hit = cand
+
+    def summary(
+        self,
+        cfg: SearchConfig,
+        total: int,
+        elapsed_total: float,
+        stopped_early: bool,
+        not_run: Optional[list[int]] = None,
+    ) -> dict:
+        return {
+            "total_seeds": total,
+            "completed_seeds": self.completed,
+            "ok_runs": self.ok,
+            "failed_runs": self.completed - self.ok - self.canceled,
+            "canceled_runs": self.canceled,
+            "killed_on_hit_runs": self.killed_on_hit,
+            "hit_count": self.hits,
+            "hit_ratio": (self.hits / total) if total else 0.0,
+            "hit_ratio_completed": (self.hits / self.completed) if self.completed else 0.0,
+            "elapsed_sec": elapsed_total,
+            "stopped_early": stopped_early,
+            "stop_after_hits": cfg.stop_after_hits,
+            # Seeds whose simulator never started because the search stopped first.
+            "not_run_seeds": sorted(not_run) if not_run is not None else [],
+            # Cost of the children launched by this search; reused runs keep their own run_resources.json.
+            "resource_usage": self.usage.result(),
+            "target": {
+                "target_year": cfg.target_year,
+                "target_tech_id": cfg.target_tech_id,
+                "target_tech_name": cfg.target_tech_name,
+            },
+            "earliest_hit": self.earliest_hit,
+        }
 
 
 def run_search(
@@ -431,10 +617,21 @@ def run_search(
         f"Starting search: seeds={total}, workers={cfg.workers}, target_year={cfg.target_year}, "
         f"tech_id={cfg.target_tech_id}, tech_name={cfg.target_tech_name}"
     )
+    admission = MemoryAdmission(resolve_budget_bytes(cfg.mem_budget_gb), cfg.out_root / "run_memory.json")
+    if admission.enabled:
+        emit(f"Memory admission budget={admission.budget_bytes / 1024 ** 3:.1f}GiB")
 
     started = time.time()
     results: list[dict] = []
     done = 0
+    hit_count = 0
+    tally = SearchTally()
+    journal = ResultsJournal(cfg.out_root / "seed_search_results.jsonl", cfg.write_every_sec)
+    # Set by a user cancel or by reaching stop_after_hits; stops dispatch and kills in-flight children.
+    halt = threading.Event()
+    durations = DurationModel(cfg.out_root / "run_durations.json")
+    backend = backend_name(cfg.use_gpu)
+    dispatch = durations.order(seed_list, cfg.start_year, run_end_year(cfg), backend)
 
     def make_exception_result(seed: int, exc: Exception) -> dict:
         return {
@@ -451,9 +648,22 @@ def run_search(
         }
 
     def process_result(seed: int, result: dict) -> None:
-        nonlocal done
+        nonlocal done, hit_count
+        if result.get("canceled") and cfg.stop_after_hits > 0 and hit_count >= cfg.stop_after_hits:
+            result["reason"] = f"stopped after {cfg.stop_after_hits} hit(s)"
         results.append(result)
+        journal.append(result)
+        tally.add(result)
         done += 1
+        if result.get("hit"):
+            hit_count += 1
+            if cfg.stop_after_hits > 0 and hit_count >= cfg.stop_after_hits and not halt.is_set():
+                emit(f"Reached {hit_count} hit(s); stopping remaining seeds")
+                halt.set()
+        # Runs cut short on a hit (killed live, or --stopOnTechId) would drag the full-run estimate down.
+        stopped_on_hit = result.get("killed_on_hit") or (cfg.target_tech_id is not None and result.get("hit"))
+        if result.get("ok") and not result.get("reused") and not result.get("canceled") and not stopped_on_hit:
+            durations.record(seed, cfg.start_year, run_end_year(cfg), backend, float(result.get("elapsed_sec") or 0.0))
 
         hit_mark = "HIT" if result["hit"] else "MISS"
         if result.get("canceled"):
@@ -470,27 +680,23 @@ def run_search(
             f"elapsed={result['elapsed_sec']:.2f}s{detail}"
         )
 
-        partial = build_summary(
-            cfg,
-            sorted(results, key=lambda r: r["seed"]),
-            total,
-            time.time() - started,
-            stopped_early=(cancel_event.is_set() if cancel_event is not None else False),
-        )
-        write_results(cfg.out_root, sorted(results, key=lambda r: r["seed"]), partial)
+        if journal.compaction_due():
+            partial = tally.summary(cfg, total, time.time() - started, stopped_early=halt.is_set())
+            write_results(cfg.out_root, sorted(results, key=lambda r: r["seed"]), partial)
+            journal.compacted()
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=cfg.workers) as ex:
         in_flight: dict[concurrent.futures.Future, int] = {}
-        seed_iter = iter(seed_list)
+        seed_iter = iter(dispatch)
 
         def submit_next() -> bool:
-            if cancel_event is not None and cancel_event.is_set():
+            if halt.is_set():
                 return False
             try:
                 seed = next(seed_iter)
             except StopIteration:
                 return False
-            fut = ex.submit(run_one_seed, seed, cfg, cancel_event)
+            fut = ex.submit(run_one_seed, seed, cfg, halt, admission)
             in_flight[fut] = seed
             return True
 
@@ -499,6 +705,8 @@ def run_search(
                 break
 
         while in_flight:
+            if cancel_event is not None and cancel_event.is_set():
+                halt.set()
             done_set, _ = concurrent.futures.wait(
                 set(in_flight.keys()),
                 timeout=0.2,
@@ -515,18 +723,25 @@ def run_search(
                     result = make_exception_result(seed, exc)
                 process_result(seed, result)
 
-                if cancel_event is None or not cancel_event.is_set():
+                if not halt.is_set():
                     submit_next()
 
+    durations.save()
+    admission.save()
     results.sort(key=lambda r: r["seed"])
     elapsed_total = time.time() - started
-    stopped_early = cancel_event.is_set() if cancel_event is not None else False
-    summary = build_summary(cfg, results, total, elapsed_total, stopped_early)
+    ran = {int(r["seed"]) for r in results if not r.get("not_run")}
+    not_run = [seed for seed in seed_list if seed not in ran]
+    # A halt raised by the last seed(s) to finish skipped nothing.
+    stopped_early = halt.is_set() and bool(not_run)
+    summary = tally.summary(cfg, total, elapsed_total, stopped_early, not_run)
 
     write_results(cfg.out_root, results, summary)
+    journal.close()
     emit(
         f"Done in {elapsed_total:.2f}s. hits={summary['hit_count']}/{total}, "
-        f"failed={summary['failed_runs']}, canceled={summary['canceled_runs']}. Results in {cfg.out_root}"
+        f"failed={summary['failed_runs']}, canceled={summary['canceled_runs']}, not_run={len(not_run)}. "
+        f"Results in {cfg.out_root}"
     )
 
     return results, summary
@@ -556,6 +771,29 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--tech-name")
 
     p.add_argument("--workers", type=int, default=default_workers())
+    p.add_argument(
+        "--mem-budget-gb",
+        type=float,
+        default=0.0,
+        help="Start a seed only while projected peak RSS of running seeds fits this budget (0 = 80%% of available, <0 = off)",
+    )
+    p.add_argument(
+        "--kill-on-hit",
+        action="store_true",
+        help="Watch each seed's tech log and stop its run as soon as the target tech unlocks",
+    )
+    p.add_argument(
+        "--stop-after-hits",
+        type=int,
+        default=0,
+        help="Stop the search (cancel queued seeds, kill running ones) once this many seeds hit (0 = run all)",
+    )
+    p.add_argument(
+        "--write-every-sec",
+        type=float,
+        default=30.0,
+        help="Rewrite the results CSV/summary at most this often (seeds are journaled to JSONL as they finish)",
+    )
     p.add_argument("--use-gpu", choices=["0", "1"], help="Optional override for CLI --useGPU")
     p.add_argument("--no-reuse", action="store_true", help="Force rerun even if seed tech log already exists")
 
@@ -595,6 +833,10 @@ def run_cli_mode(args: argparse.Namespace) -> int:
         workers=max(1, args.workers),
         use_gpu=use_gpu,
         reuse_existing=(not args.no_reuse),
+        mem_budget_gb=args.mem_budget_gb,
+        kill_on_hit=args.kill_on_hit,
+        stop_after_hits=max(0, args.stop_after_hits),
+        write_every_sec=max(0.0, args.write_every_sec),
     )
 
     if not cfg.exe.exists():
@@ -641,6 +883,8 @@ def launch_gui(defaults: argparse.Namespace) -> int:
     workers_var = tk.StringVar(value=str(defaults.workers))
     use_gpu_var = tk.StringVar(value="" if defaults.use_gpu is None else str(defaults.use_gpu))
     reuse_var = tk.BooleanVar(value=not defaults.no_reuse)
+    kill_on_hit_var = tk.BooleanVar(value=defaults.kill_on_hit)
+    stop_after_var = tk.StringVar(value=str(defaults.stop_after_hits))
 
     frm = tk.Frame(root)
     frm.pack(fill="x", padx=10, pady=8)
@@ -663,8 +907,12 @@ def launch_gui(defaults: argparse.Namespace) -> int:
     add_row("Tech name (optional)", tech_name_var, 11)
     add_row("Workers", workers_var, 12)
     add_row("Use GPU (blank/0/1)", use_gpu_var, 13)
+    add_row("Stop after N hits (0 = all)", stop_after_var, 16)
 
     tk.Checkbutton(frm, text="Reuse existing logs", variable=reuse_var).grid(row=14, column=1, sticky="w", pady=2)
+    tk.Checkbutton(frm, text="Stop each run at its first hit", variable=kill_on_hit_var).grid(
+        row=15, column=1, sticky="w", pady=2
+    )
 
     frm.grid_columnconfigure(1, weight=1)
 
@@ -732,6 +980,8 @@ def launch_gui(defaults: argparse.Namespace) -> int:
                 workers=max(1, int(workers_var.get())),
                 use_gpu=use_gpu,
                 reuse_existing=bool(reuse_var.get()),
+                kill_on_hit=bool(kill_on_hit_var.get()),
+                stop_after_hits=max(0, int(stop_after_var.get() or 0)),
             )
 
             if not cfg.exe.exists():
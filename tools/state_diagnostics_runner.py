@@ -22,6 +22,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from memory_admission import MemoryAdmission, horizon_key, resolve_budget_bytes
+from run_durations import DurationModel, backend_name
+from run_resources import read_run_resources, rollup_usage, wait_child, write_run_resources
+
 
 @dataclass(frozen=True)
 class DiagConfig:
@@ -35,6 +39,8 @@ class DiagConfig:
     workers: int
     use_gpu: Optional[bool]
     reuse_existing: bool
+    # Memory budget for concurrent runs in GiB (0 = 80% of MemAvailable, <0 = worker count only).
+    mem_budget_gb: float = 0.0
 
 
 def resolve_user_path(path_value: str, repo_root: Path) -> Path:
@@ -254,7 +260,7 @@ def analyze_seed(seed_dir: Path) -> dict:
     }
 
 
-def run_one_seed(seed: int, cfg: DiagConfig) -> dict:
+def run_one_seed(seed: int, cfg: DiagConfig, admission: Optional[MemoryAdmission] = None) -> dict:
     seed_dir = cfg.out_root / f"seed_{seed}"
     run_log = seed_dir / "seed_run.log"
     seed_dir.mkdir(parents=True, exist_ok=True)
@@ -262,14 +268,31 @@ def run_one_seed(seed: int, cfg: DiagConfig) -> dict:
     started = time.time()
     reused = False
     rc = 0
+    usage: Optional[dict] = None
     if cfg.reuse_existing and can_reuse_existing(seed, cfg, seed_dir):
         reused = True
+        usage = read_run_resources(seed_dir)
     else:
         cmd = build_cmd(seed, cfg, seed_dir)
         with run_log.open("w", encoding="utf-8") as logf:
             logf.write("COMMAND:\n")
             logf.write(" ".join(cmd) + "\n\n")
-            rc = subprocess.call(cmd, stdout=logf, stderr=subprocess.STDOUT, cwd=str(cfg.repo_root))
+            token = None
+            if admission is not None:
+                token = admission.admit(horizon_key(cfg.start_year, cfg.end_year, backend_name(cfg.use_gpu)))
+            # Measure from launch: admission queueing would skew the longest-first order.
+            started = time.time()
+            try:
+                spawned = time.monotonic()
+                proc = subprocess.Popen(cmd, stdout=logf, stderr=subprocess.STDOUT, cwd=str(cfg.repo_root))
+                if admission is not None:
+                    admission.attach(token, proc.pid)
+                usage = wait_child(proc, spawned)
+                rc = int(usage["returncode"])
+                write_run_resources(seed_dir, usage)
+            finally:
+                if admission is not None:
+                    admission.release(token, record=(usage is not None and rc == 0))
 
     elapsed = time.time() - started
     if rc != 0:
@@ -280,6 +303,7 @@ def run_one_seed(seed: int, cfg: DiagConfig) -> dict:
             "elapsed_sec": elapsed,
             "run_dir": str(seed_dir),
             "reused": reused,
+            "resources": usage,
             "reason": "cli run failed",
         }
 
@@ -292,6 +316,7 @@ def run_one_seed(seed: int, cfg: DiagConfig) -> dict:
             "elapsed_sec": elapsed,
             "run_dir": str(seed_dir),
             "reused": reused,
+            "resources": usage,
             "reason": analyzed.get("reason", "diagnostic parse failed"),
         }
 
@@ -302,6 +327,7 @@ def run_one_seed(seed: int, cfg: DiagConfig) -> dict:
         "elapsed_sec": elapsed,
         "run_dir": str(seed_dir),
         "reused": reused,
+        "resources": usage,
         "reason": "",
         **analyzed,
     }
@@ -336,6 +362,8 @@ def build_summary(results: list[dict], elapsed_sec: float) -> dict:
         "total_seeds": len(results),
         "ok_runs": len(ok_runs),
         "failed_runs": len(fail_runs),
+        # Cost of the children launched by this batch; reused runs keep their own run_resources.json.
+        "resource_usage": rollup_usage(r.get("resources") for r in results if not r.get("reused")),
         "final_low_state_means": {
             "final_low_stability_countries": fmean("final_low_stability_countries"),
             "final_low_legitimacy_countries": fmean("final_low_legitimacy_countries"),
@@ -450,8 +478,15 @@ def run_batch(cfg: DiagConfig, seeds: list[int]) -> tuple[list[dict], dict]:
         flush=True,
     )
 
+    durations = DurationModel(cfg.out_root / "run_durations.json")
+    backend = backend_name(cfg.use_gpu)
+    # Submission order is dispatch order: longest-expected seeds start first.
+    dispatch = durations.order(seeds, cfg.start_year, cfg.end_year, backend)
+    admission = MemoryAdmission(resolve_budget_bytes(cfg.mem_budget_gb), cfg.out_root / "run_memory.json")
+    if admission.enabled:
+        print(f"Memory admission budget={admission.budget_bytes / 1024 ** 3:.1f}GiB", flush=True)
     with concurrent.futures.ThreadPoolExecutor(max_workers=cfg.workers) as ex:
-        futs = {ex.submit(run_one_seed, seed, cfg): seed for seed in seeds}
+        futs = {ex.submit(run_one_seed, seed, cfg, admission): seed for seed in dispatch}
         done = 0
         for fut in concurrent.futures.as_completed(futs):
             seed = futs[fut]
@@ -469,6 +504,8 @@ def run_batch(cfg: DiagConfig, seeds: list[int]) -> tuple[list[dict], dict]:
                     "reason": f"exception: {exc}",
                 }
             results.append(r)
+            if r.get("ok") and not r.get("reused"):
+                durations.record(seed, cfg.start_year, cfg.end_year, backend, float(r.get("elapsed_sec") or 0.0))
             if r.get("ok"):
                 print(
                     f"[{done}/{total}] seed={seed} ok final_low_s={r.get('final_low_stability_countries')} "
@@ -478,6 +515,8 @@ def run_batch(cfg: DiagConfig, seeds: list[int]) -> tuple[list[dict], dict]:
             else:
                 print(f"[{done}/{total}] seed={seed} fail rc={r.get('returncode')} reason={r.get('reason')}", flush=True)
 
+    durations.save()
+    admission.save()
     results.sort(key=lambda x: int(x.get("seed", 0)))
     summary = build_summary(results, time.time() - started)
     write_outputs(cfg.out_root, results, summary)
@@ -502,6 +541,12 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
     p.add_argument("--end-year", type=int, default=2025)
     p.add_argument("--checkpoint-every-years", type=int, default=50)
     p.add_argument("--workers", type=int, default=default_workers())
+    p.add_argument(
+        "--mem-budget-gb",
+        type=float,
+        default=0.0,
+        help="Start a seed only while projected peak RSS of running seeds fits this budget (0 = 80%% of available, <0 = off)",
+    )
     p.add_argument("--use-gpu", choices=["0", "1"], default="0")
     p.add_argument("--no-reuse", action="store_true")
     return p.parse_args(argv)
@@ -536,6 +581,7 @@ def main(argv: list[str]) -> int:
         workers=max(1, args.workers),
         use_gpu=use_gpu,
         reuse_existing=(not args.no_reuse),
+        mem_budget_gb=args.mem_budget_gb,
     )
 
     if not cfg.exe.exists():
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""Append-only per-seed results journal for the seed sweepers.
+
+Each finished seed is appended to `<name>.jsonl` as one JSON line and flushed,
+so a sweep's live record costs O(1) per seed. The sorted `results.csv` and
+`summary.json` are full rewrites; the sweepers only do them when
+`compaction_due()` says the interval has elapsed, and once at the end. If a
+sweep dies between rewrites, the journal still holds every finished seed.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+
+class ResultsJournal:
+    def __init__(self, path: Path, compact_every_sec: float = 30.0) -> None:
+        self.path = path
+        self.compact_every_sec = max(0.0, float(compact_every_sec))
+        self.last_compact = time.monotonic()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # One journal per sweep: results of an earlier sweep in the same out root are not carried over.
+        self.f = path.open("w", encoding="utf-8")
+
+    def append(self, result: dict) -> None:
+        self.f.write(json.dumps(result, default=str) + "\n")
+        self.f.flush()
+
+    def compaction_due(self) -> bool:
+        return time.monotonic() - self.last_compact >= self.compact_every_sec
+
+    def compacted(self) -> None:
+        self.last_compact = time.monotonic()
+
+    def close(self) -> None:
+        self.f.close()
+
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""Incremental readers for the `tech_unlocks.csv` logs running worldsim_cli children append to.
+
+Shared by the seed sweepers. Each read parses only the bytes appended since the
+previous one (a trailing partial line is held back until its newline arrives),
+so watching a live log costs O(new bytes) instead of a full re-read per poll.
+A log that shrinks (rewritten by a new run) is read again from the start.
+
+`TechLogFollower` multiplexes every active log of a sweep onto one thread. On
+Linux it sleeps on inotify events for the seed dirs and only falls back to a
+slow stat sweep as a safety net (drvfs mounts under WSL do not report writes
+made by Windows processes); elsewhere it stats the logs every `poll_sec`. A
+log is opened only when its size changed.
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional
+
+RowsCallback = Callable[[list[dict[str, str]]], None]
+
+
+class TechLogTail:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.offset = 0
+        self.header: Optional[list[str]] = None
+        self.partial = b""
+
+    def reset(self) -> None:
+        self.offset = 0
+        self.header = None
+        self.partial = b""
+
+    def read_rows(self, final: bool = False) -> list[dict[str, str]]:
+        """Rows completed since the last call (empty while the log does not exist yet).
+
+        With `final` (the writer has exited) an unterminated last line counts as a row.
+        """
+        try:
+            with self.path.open("rb") as f:
+                f.seek(0, 2)
+                size = f.tell()
+                if size < self.offset:
+                    self.reset()
+                f.seek(self.offset)
+                data = f.read(size - self.offset)
+        except OSError:
+            return []
+        if not data and not (final and self.partial):
+            return []
+        self.offset += len(data)
+        lines = (self.partial + data).split(b"\n")
+        self.partial = b"" if final else lines.pop()
+        rows: list[dict[str, str]] = []
+        for raw in lines:
+            line = raw.decode("utf-8", errors="replace").rstrip("\r")
+            if not line:
+                continue
+            fields = next(csv.reader([line]))
+            if self.header is None:
+                self.header = fields
+                continue
+            rows.append(dict(zip(self.header, fields)))
+        return rows
+
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_CREATE = 0x00000100
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding: directory watches and the (wd, file name) pairs that saw activity."""
+
+    def __init__(self) -> None:
+        import ctypes
+        import ctypes.util
+
+        self.libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add(self, directory: Path) -> Optional[int]:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(str(directory)), IN_MODIFY | IN_CLOSE_WRITE | IN_CREATE)
+        return wd if wd >= 0 else None
+
+    def remove(self, wd: int) -> None:
+        self.libc.inotify_rm_watch(self.fd, wd)
+
+    def wait(self, timeout: float) -> set[tuple[int, str]]:
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            buf = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        events: set[tuple[int, str]] = set()
+        pos = 0
+        while pos + _EVENT_HEADER.size <= len(buf):
+            wd, _, _, name_len = _EVENT_HEADER.unpack_from(buf, pos)
+            start = pos + _EVENT_HEADER.size
+            name = buf[start : start + name_len].rstrip(b"\0").decode("utf-8", errors="replace")
+            events.add((wd, name))
+            pos = start + name_len
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class _Followed:
+    def __init__(self, path: Path, on_rows: RowsCallback) -> None:
+        self.tail = TechLogTail(path)
+        self.on_rows = on_rows
+        self.size = -1
+        self.wd: Optional[int] = None
+        self.lock = threading.Lock()
+
+
+class TechLogFollower:
+    def __init__(self, poll_sec: float = 0.5, safety_sec: float = 2.0, use_inotify: bool = True) -> None:
+        self.lock = threading.Lock()
+        self.entries: dict[Hashable, _Followed] = {}
+        self.stop = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.inotify: Optional[_Inotify] = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self.inotify = _Inotify()
+            except Exception:
+                self.inotify = None
+        self.poll_sec = max(0.05, float(poll_sec))
+        # With inotify the stat sweep only catches writes it cannot see.
+        self.sweep_sec = max(self.poll_sec, float(safety_sec)) if self.inotify is not None else self.poll_sec
+        self.mode = "inotify" if self.inotify is not None else "poll"
+        self.stats = {"reads": 0, "bytes": 0}
+
+    def start(self) -> "TechLogFollower":
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._loop, name="tech-log-follower", daemon=True)
+            self.thread.start()
+        return self
+
+    def watch(self, key: Hashable, path: Path, on_rows: RowsCallback) -> None:
+        """Follow `path` (it may not exist yet); `on_rows` gets each batch of new rows on the follower thread."""
+        entry = _Followed(path, on_rows)
+        if self.inotify is not None:
+            entry.wd = self.inotify.add(path.parent)
+        with self.lock:
+            self.entries[key] = entry
+
+    def unwatch(self, key: Hashable) -> None:
+        """Stop following `key` after delivering every row written so far (call once the child exited)."""
+        with self.lock:
+            entry = self.entries.pop(key, None)
+        if entry is None:
+            return
+        self._drain(entry, final=True)
+        if entry.wd is not None and self.inotify is not None:
+            with self.lock:
+                shared = any(e.wd == entry.wd for e in self.entries.values())
+            if not shared:
+                self.inotify.remove(entry.wd)
+
+    def close(self) -> None:
+        self.stop.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5.0)
+        if self.inotify is not None:
+            self.inotify.close()
+            self.inotify = None
+
+    def _drain(self, entry: _Followed, final: bool = False) -> None:
+        with entry.lock:
+            before = entry.tail.offset
+            rows = entry.tail.read_rows(final)
+            entry.size = entry.tail.offset
+            with self.lock:
+                self.stats["reads"] += 1
+                self.stats["bytes"] += max(0, entry.tail.offset - before)
+            if rows:
+                try:
+                    entry.on_rows(rows)
+                except Exception:
+                    pass
+
+    def _loop(self) -> None:
+        next_sweep = 0.0
+        while not self.stop.is_set():
+            if self.inotify is not None:
+                try:
+                    active = self.inotify.wait(self.poll_sec)
+                except (OSError, ValueError):
+                    active = set()
+            else:
+                self.stop.wait(self.poll_sec)
+                active = set()
+            with self.lock:
+                entries = list(self.entries.values())
+            now = time.monotonic()
+            sweep = now >= next_sweep
+            if sweep:
+                next_sweep = now + self.sweep_sec
+            for entry in entries:
+                # Seed dirs also hold the run log and artifacts; only writes to the followed log count.
+                if entry.wd is not None and (entry.wd, entry.tail.path.name) in active:
+                    self._drain(entry)
+                elif sweep:
+                    try:
+                        size = entry.tail.path.stat().st_size
+                    except OSError:
+                        continue
+                    if size != entry.size:
+                        self._drain(entry)
+
+    def summary(self) -> dict[str, Any]:
+        with self.lock:
+            return {"mode": self.mode, **self.stats}
+
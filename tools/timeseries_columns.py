@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Columnar loader for worldsim `timeseries.csv` artifacts.
+
+Shared by `evaluate_run.py` and `fine_tune_realism.py`. The whole file is read
+with the C csv reader, transposed once, and each column is converted to a
+float64 NumPy array in a single call instead of building a dict per row and
+calling `float()` per cell. `pop_share_by_lat_band` ("a|b|c" per row) is
+decoded into a 2-D (rows x bands) array of normalized shares.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+try:
+    import numpy as np
+except Exception as exc:  # pragma: no cover
+    raise SystemExit(
+        "NumPy not available. Install numpy (`pip install numpy`) to load timeseries artifacts. "
+        f"Details: {exc}"
+    )
+
+
+TINY = 1e-12
+LAT_BAND_COLUMN = "pop_share_by_lat_band"
+
+
+@dataclass
+class TimeseriesColumns:
+    names: List[str]
+    n_rows: int
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+    # Number of tokens present in each row's lat-band cell (rows are zero-padded in the 2-D array).
+    lat_band_counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def column(self, name: str, default: float = 0.0) -> np.ndarray:
+        """1-D float64 column, or a constant array of `default` when the column is absent."""
+        arr = self.columns.get(name)
+        if arr is None:
+            return np.full(self.n_rows, float(default), dtype=np.float64)
+        return arr
+
+    def lat_bands(self) -> np.ndarray:
+        arr = self.columns.get(LAT_BAND_COLUMN)
+        if arr is None:
+            return np.zeros((self.n_rows, 0), dtype=np.float64)
+        return arr
+
+
+def _to_float(v: str) -> float:
+    try:
+        return float(v)
+    except Exception:
+        return 0.0
+
+
+def _float_column(raw: Sequence[str]) -> np.ndarray:
+    try:
+        return np.array(raw, dtype=np.float64)
+    except ValueError:
+        # Mixed/blank cells: fall back to per-cell parsing, unparseable cells become 0.0.
+        return np.array([_to_float(v) for v in raw], dtype=np.float64)
+
+
+def _lat_band_column(raw: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    parsed: List[List[float]] = []
+    for cell in raw:
+        vals: List[float] = []
+        for tok in cell.strip().split("|"):
+            tok = tok.strip()
+            if tok:
+                vals.append(_to_float(tok))
+        parsed.append(vals)
+    counts = np.array([len(v) for v in parsed], dtype=np.int64)
+    width = int(counts.max()) if len(parsed) else 0
+    bands = np.zeros((len(parsed), width), dtype=np.float64)
+    for i, vals in enumerate(parsed):
+        bands[i, : len(vals)] = vals
+    # Rows with positive mass become shares of the clamped values; others keep raw values.
+    clamped = np.maximum(bands, 0.0)
+    sums = clamped.sum(axis=1)
+    norm = sums > TINY
+    bands[norm] = clamped[norm] / sums[norm, None]
+    return bands, counts
+
+
+def read_timeseries_columns(path: Path, complete_rows_only: bool = False) -> TimeseriesColumns:
+    """Load a timeseries file; `complete_rows_only` drops a trailing unterminated row of a file still being written."""
+    with path.open("r", encoding="utf-8", newline="") as f:
+        if complete_rows_only:
+            text = f.read()
+            rows = [r for r in csv.reader(io.StringIO(text[: text.rfind("\n") + 1], newline="")) if r]
+        else:
+            rows = [r for r in csv.reader(f) if r]
+    if not rows:
+        return TimeseriesColumns(names=[], n_rows=0)
+
+    header = rows[0]
+    body = rows[1:]
+    width = len(header)
+    if any(len(r) != width for r in body):
+        body = [(r + [""] * (width - len(r)))[:width] for r in body]
+    n_rows = len(body)
+    raw_cols = list(zip(*body)) if body else [()] * width
+
+    out = TimeseriesColumns(names=list(header), n_rows=n_rows)
+    for name, raw in zip(header, raw_cols):
+        if name == LAT_BAND_COLUMN:
+            out.columns[name], out.lat_band_counts = _lat_band_column(raw)
+        else:
+            out.columns[name] = _float_column(raw)
+    if LAT_BAND_COLUMN not in out.columns:
+        out.lat_band_counts = np.zeros(n_rows, dtype=np.int64)
+    return out